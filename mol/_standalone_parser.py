@@ -0,0 +1,3577 @@
+# Generated by scripts/gen_standalone_parser.py — do not edit.
+# The file was automatically generated by Lark v1.3.1
+__version__ = "1.3.1"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        pos = self.pos_in_stream or 0
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+from dataclasses import dataclass
+from typing import Generic, AnyStr
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+@dataclass(frozen=True)
+class TextSlice(Generic[AnyStr]):
+    #--
+    text: AnyStr
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if not isinstance(self.text, (str, bytes)):
+            raise TypeError("text must be str or bytes")
+
+        if self.start < 0:
+            object.__setattr__(self, 'start', self.start + len(self.text))
+            assert self.start >=0
+
+        if self.end is None:
+            object.__setattr__(self, 'end', len(self.text))
+        elif self.end < 0:
+            object.__setattr__(self, 'end', self.end + len(self.text))
+            assert self.end <= len(self.text)
+
+    @classmethod
+    def cast_from(cls, text: 'TextOrSlice') -> 'TextSlice[AnyStr]':
+        if isinstance(text, TextSlice):
+            return text
+
+        return cls(text, 0, len(text))
+
+    def is_complete_text(self):
+        return self.start == 0 and self.end == len(self.text)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def count(self, substr: AnyStr):
+        return self.text.count(substr, self.start, self.end)
+
+    def rindex(self, substr: AnyStr):
+        return self.text.rindex(substr, self.start, self.end)
+
+
+TextOrSlice = Union[AnyStr, 'TextSlice[AnyStr]']
+LarkInput = Union[AnyStr, TextSlice[AnyStr], Any]
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    __match_args__ = ("data", "children")
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, Symbol):
+            return NotImplemented
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name: str, filter_out: bool = False) -> None:
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+    def serialize(self, memo=None) -> Dict[str, Any]:
+        ##
+
+        ##
+
+        return {'name': str(self.name), '__type__': 'NonTerminal'}
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from contextlib import suppress
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: TextOrSlice, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner: 'Scanner'):
+        self.scanner = scanner
+
+    def __call__(self, t: Token):
+        res = self.scanner.fullmatch(t.value)
+        if res is not None:
+            t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp()) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text: TextSlice, pos):
+        for mre in self._mres:
+            m = mre.match(text.text, pos, text.end)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+    def fullmatch(self, text: str) -> Optional[str]:
+        for mre in self._mres:
+            m = mre.fullmatch(text)
+            if m:
+                return m.lastgroup
+        return None
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: TextSlice
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: TextSlice, line_ctr: Optional[LineCounter] = None, last_token: Optional[Token]=None):
+        if isinstance(text, TextSlice):
+            if line_ctr is None:
+                line_ctr = LineCounter(b'\n' if isinstance(text.text, bytes) else '\n')
+
+                if text.start > 0:
+                    ##
+
+                    line_ctr.feed(TextSlice(text.text, 0, text.start))
+
+            if not (text.start <= line_ctr.char_pos <= text.end):
+                raise ValueError("LineCounter.char_pos is out of bounds")
+
+        self.text = text
+        self.line_ctr = line_ctr
+        self.last_token = last_token
+
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text == other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: Optional[LexerState]):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text_or_slice: TextOrSlice) -> 'LexerThread':
+        text = TextSlice.cast_from(text_or_slice)
+        return cls(lexer, LexerState(text))
+
+    @classmethod
+    def from_custom_input(cls, lexer: 'Lexer', text: Any) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        if self.state is None:
+            raise TypeError("Cannot lex: No text assigned to lexer state")
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text: str):
+        #--
+        return LexerState(TextSlice.cast_from(text))
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner: Optional[Scanner] = None
+
+    def _build_scanner(self) -> Scanner:
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        return Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self) -> Scanner:
+        if self._scanner is None:
+            self._scanner = self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < lex_state.text.end:
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer; use YourTransformer().transform(parser.parse()) instead")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', 0)
+    if future_interface == 2:
+        return lexer_class
+    elif future_interface == 1:
+        class CustomLexerWrapper1(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice) and not lexer_state.text.is_complete_text():
+                    raise TypeError("Interface=1 Custom Lexer don't support TextSlice")
+                lexer_state.text = lexer_state.text
+                return self.lexer.lex(lexer_state, parser_state)
+        return CustomLexerWrapper1
+    elif future_interface == 0:
+        class CustomLexerWrapper0(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice):
+                    if not lexer_state.text.is_complete_text():
+                        raise TypeError("Interface=0 Custom Lexer don't support TextSlice")
+                    return self.lexer.lex(lexer_state.text.text)
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper0
+    else:
+        raise ValueError(f"Unknown __future_interface__ value {future_interface}, integer 0-2 expected")
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: Optional[LarkInput]) -> Union[LarkInput, LexerThread, None]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        if self.skip_lexer:
+            return text
+        if text is None:
+            return cls(self.lexer, None)
+        if isinstance(text, (str, bytes, TextSlice)):
+            return cls.from_text(self.lexer, text)
+        return cls.from_custom_input(self.lexer, text)
+
+    def parse(self, text: Optional[LarkInput], start=None, on_error=None):
+        if self.lexer_conf.lexer_type in ("dynamic", "dynamic_complete"):
+            if isinstance(text, TextSlice) and not text.is_complete_text():
+                raise TypeError(f"Lexer {self.lexer_conf.lexer_type} does not support text slices.")
+
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[TextOrSlice]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    cache_grammar: bool
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    cache_grammar
+            For use with ``cache`` option. When ``True``, the unanalyzed grammar is also included in the cache.
+            Useful for classes that require the ``Lark.grammar`` to be present (e.g. Reconstructor).
+            (default= ``False``)
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'cache_grammar': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if self.cache_grammar and not self.cache:
+            raise ConfigurationError('cache_grammar cannot be set when cache is disabled')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    __serialize_fields__ = ['parser', 'rules', 'options']
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        if self.options.cache_grammar:
+            self.__serialize_fields__ = self.__serialize_fields__ + ['grammar']
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_%s_%s_%s_%s_%s.tmp" % (
+                        "cache_grammar" if self.options.cache_grammar else "cache", username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'     ##
+
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        if 'grammar' in data:
+            self.grammar = Grammar.deserialize(data['grammar'], memo)
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: TextOrSlice, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[LarkInput]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: LarkInput, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        if on_error is not None and self.options.parser != 'lalr':
+            raise NotImplementedError("The on_error option is only implemented for the LALR(1) parser.")
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        token = None
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token.new_borrow_pos(self.DEDENT_type, '', token) if token else Token(self.DEDENT_type, '', 0, 0, 0, 0, 0, 0)
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+import pickle, zlib, base64
+DATA = (
+b'eJzs3X1AXPld7/FhEkJmwiQhCTMJEGAIBBIgPCchJDwlPB6G3Sa72ZbSDrATFigbaAilS4lVbIHS6YMUWrRV01rbirVVq4LaW62XXrkqen24gl5xXXVXd9VVw1V7r1e958w5JO+P3tpuH3Tdu/vHfucFw9PM9/v5nfM7A/n2+AWXK85l/XdnPi+6Z7j71siNW/PWbe/gjbfeuBV+fOhmb8ye2zduPdl/s3twZP4N83l35qNxtfOGa+TOfN9eI84ubrvssstuu8TbZY9dEuyy1y4eu3jtss8uiXbx2WW/XQ7Y5aBdkuxyyC6H7XLELsl28dslYJejdjlmlxS7pNolzS7H7ZJulwy7ZNolaJcsu5ywS7Zdcuxy0i65dsmzyym7nLZLvl0K7FJolzN2KbJLsV1K7FJqlzK7lNulwi5n7XLOLuftUmmXC3apsstFu1yyS7VdauxSa5c6u9Tb5bJdrtilwS6NdmmyS7NdWuzSahfDLm12Cdml3S4P2eVhu7zGLlftcs0uj9jlUbtct8tjdnmtXV5nl46RG9E9/U/cHLp1w+rFqOexa+GW9raW9ob5aMLlh0KhhvZH5m9EfU+Eb9144sZbw72D3U+MmM0a9YyO3Aj3PHX7xsj8u3Ya/PZTwzfmo16zz2/feOvt0e7B+ejecOyt4fB81NNm3emyNQSj0X32eDyYifhbo4M3nHkwv6/X299ep13eYJc32iVsly67dNulxy6P2yVilxt26bXLE3bps0u/XQbs8ia7DNrlSbvctMuQXYbt8ma73LLLiF1u22XULm+xy5hd3mqXp+wybpe32WXCLnfs8m12ebtdvt0u32GXSbt8p13eYZd32mXKLtN2mbHLu+wya5d32yVql/fY5b12eZ9d3m+X77LLnF0+YJd5uyzY5YN2+ZBdFu3y3Xb5Hrt82C4fscv32uX77PL9drlrl4/a5WN2+QG7fNwuP2iXT9jlk3b5lF1+yC5Ldvlhu3zaLj9il8/Y5bN2+VG7/Jhdftwun7PLT9jlJ+3yU3ZZtsuKXX7aLj9jl5+1y+ft8p/s8gW7/Jxdft4uX7TLL9jlP9tl1S5fsst/scsv2mXNLv/VLr9kl1+2y6/YZd0uv2qXX7PLf7PLr9vlN+zym3b5Lbv8d7v8tl027LJpl9+xy+/a5X/Y5ffssmWX37fL03b5A7s8Y5c/tMsf2eWP7fKsXZ6zy5/Y5U/t8rxdXrDLn9nlz+3yF3Z50S5/aZe/sstf2+WeXbbt8j/t8jd2+Vu7/J1dvmyX/2WX/22Xv7fL/7HLP9jlH+3yT7ESctlLcSjOqW6n7nLqbqfGO3WPUxOcutepHqd6nbrPqYlO9Tl1v1MPOPWgU5Ocesiph516xKnJTvU7NeDUo0495tQUp6Y6Nc2px52a7tQMp2Y6NejULKeecGq2U3OcetKpuU7Nc+opp552ar5TC5xa6NQzTi1yarFTS5xa6tQyp5Y7tcKpZ516zqnnnVrp1AtOrXLqRadecmq1U2ucWuvUOqfWO/WyU684tcGpjU5tcmqzU1uc2upU5xAv1ObUkFPbnfqQUx926mucetWp15z6iFMfdep1pz7m1Nc69XVO7XDq653a6dQ3OPWNTg07tcup3U7tcerjTo049YZTe536hFP7nNrv1AGnvsmpg0590qk3nTrk1GGnvtmpt5w64tTbTh116lucOubUtzr1KaeOx5nHOvEjt7tv3Y4d6jg3o7tvvHX4lnmMs3NIYh/F7B7sHrw13/emqPfh2Jvt45a+uNix/e2hN924OWIdt5hHQrvb60IN80ZcdNe1hkfmDXfU3XJt3tgVdT/y0LyxO7qrrv3KvBEf3d3Q1tI4b+yJJjzccPWydVhlJER3PXL1dfPG3ujua4/UXZ03PNE9bfVX6y6bn84bjX+suaXNvLXPOoiqa3+oPVwybyRGd5sHZ8a84YvuudrwyKNX2+eN/dH4a21115rnjQNRs33MNzfXmW8+GN39yNVHzU+QFN3T0H7t0avmzUPRXeH2tnnjsPmm6w+1XTffdCQaX/dYXYv57SRHdz16zXyL//4XPDtvBKK72h8y33n0/huL541j91E+b6RE9z5yta79WmOD+ROkmt/fw9aPkmb+wCHrsx6Pxl9+qO0h8xtKNx+qR9vMr54R3dX4kHmfzKivpf2RhqsPh689crWlvWneCEZ3ZzdYj1eW+Ui0XHukwfywE1G3defs6J4rDY3WgamRYz7E5kN58v53UTpv5FoPsPXd50X3PtzycEPsENY4ZX3xUKhu3jgd3RX7xPnR+Ma62B0Lou5G89MXRne3hB42v6sz9z9d2bxRZD5Ar334oavmD1BsPrwP1z1m3rXEfJ6aH3ps3iiNxoda2h81n+ay6F7zaW14pMVqgXLzh7/2mvp5oyKacLWhraHO+jJn73/ainnjXHT3Yy2PmM/UefPjGq5ds5+pyuiuNqt1LkR3X409eFXmU9ds/ewXzWfZaYhLUfcVs6GqzXc1XDPvXBPd33Dtct3DDVfuP3q10T11ly+bn3beqIsmmG9sarKek/pofH1DU4v56S6bXyD2DV6J7n64zfr+G6J7zI9+9LL5CRuju6/XW1+9yWqta5et1mmOxjc9WnfVfNxaovGva2loM2+1mo/C69ovzxuG2cpXH7K/Xpv5iNQ9ctn8yULRXVeshmmP7ml/NFRvfQMPRfeHw7Fpi/3f6qCHo4kjt2+NPn473Nt/YzAyb7wmGgiHb44ODpqnBN3mmcDjN+z7lph3vmqdUzxpjmf/yNDNeeNadO/Nodvh2Ngaj0T3dkci/bf7rfc8auJmxHnP9WjC0C3n9mNR75Pdtx/vc/ja6O7u20NPzhuvi8aP3uy+9dS80RH1yVefN14f3f/k6ODt/uHB/se77c/fGfWODHeP3XQ+zRui+wa7n+yJdDt+Y9Rdbz5o4Wi8+b12m5++yzzVt85+bnY/aX7CbidqjJ6od7jffPPjfd395md93GyK2LMdsR6nnsGhx99k/+zn5o0b0cTIjccHu29ZD8eTt+eN3mji7Vv9TzxhBpX9hifM78l+JCM3eueNvqhvsL/3xu3+J3c+oj+61zpXszEQ9fY/OTxof5V5403RROs7Gey/ecP+8MHovu7HH78xMuLc/8mox/xWbt948sZNUzej+27duD1666bz3qFoQn+vc3s46nly6C07X+fN0SORG/b3NWp+7092DzvvuBX1mueMt3e+gZHovhtvGRq8/3G3o94nRrtvRRyOmt/frSF8P28xv5+nbj7uaCzqMb/1Nzl6q/m53jo8FOsyy09FvU9ZzeVw3PzQvqExR2+L7u0dNT9R7KeeMH/qkRHzNNh5552ox3qmHH1b1LvzpFh8e/TA7VtPmefDI4+P7nzb325+tqGd+3+H+dFP9u98F5PRZD4Sg/0jO+/5zqh3rK9/cOdzvCMa7zwo74zuHRrb+V6mzCYzP+bGjqejnsitoZ2HcyaaFA47be4MjLlKvCu6x2zd8NDwvDHr/CjW55g33m2O+8NXG+rMMY5G3XXm4L4nuqf+oatXrVR7b9Qz3N2/c9f3RXdbmjfeH02wpi/22b7LHLBbTzj3mIumhcP2WA133759w2wL56czv41Sc24/EPVbc/9gzEfs95lBOB89HA7HpgQfYy4mC9Gj5ueUsXN+LPODPhj12t9rOPSomTAfih4Jh/GM23c8P28sRnfF7vDd5s9uDoPz7X6P2R6WzGky52He+HD0kPnhO+8PDw+OjljJ/xHrbua87Nzte63v9P5D6Hwz5sL4fdZXfxAq9seXVM4b328OQuzN3bfMCLgb9TmdsvMJP2p94IM8cz6j+ZU/Zn1DO/nlvNlc2X4guutqg7ncfTy66yFrFfrB6KF/+aDPG5+I+uTN88Yno95H2680XL12+SFr7f9UdP9OI8YCaWTe+KHoHjM8Y8/sUuyLO0nqfHHz+fjhqE+ewHnj0/Yz1y+Ph5lUP2IFuH4BpxPmjc9EPdYbnO/0s1GfefRkDcPOQ/Kjsc95PxLtjzMfyh8zg/J+j8wbPx5NDodj8fXkjdt9QzvtZD4Zn4sm8u3zxk+YhwjmY/WTsZ/K6VjnezUb5Kf+2YJkjszywAfiXK7R6J5Y3DnHdnfmDZfhCn0hbmp+xLAO/Yw4q9gHs1PmsZ5ol2i3KF60R5Qg2ivyiLyifaJEkU/kEu0XHRAdFCWJDokOi46IkkV+UUB0VHRMlCJKFaWJjovSRRmiTFFQlCU6IcoW5YhOinJFeaJTotOifFGBqFB0RlQkKhaViEpFZaJyUYXorOic6LyoUnRBVCW6KLokqhbViGpFdaJ60WXRFVGDqFHUJGoWtYhaRYaoTRQStVOjhtvKFWfujHk0ho1DxGHiCBFHJBP5RAFRTQSIGqKWKCTqiHoigSgiiokSIpXwEF4ihWgg0ohSIpFIJzKITMJHuIhmoowoJ1qILCKbqCBaiUrCIHKINqKdyCMaiSYiSMQTuUQSMGrsstr2lLk6fjwOs55h9/Ru650Pme/8trhYC7sMD0K0VeKv1f6QeI7BAsdggWOwwDFY4BgscAwWOAYLHIMFjsECx2CBY7DAMVjgGCxwDBY4BgscgwWOwQLHYIFjsMAxWOAYLHAMFjgGCxyDBY7BAsdggWOwwDFY4BgscAwWOAYLHIMFjsECx2CBY7DAMVjgGCxwDBY4BgscgwWOwQLHYIFjsMAxWOAYLHAMFjgGCxyDBY7BAsdggWOwwDFY4BgsxNp2T+xA0ez0YafTQ5+zbjxs3vjBODTxj8TunWDde5/5vk9a73uNeWNPHLr2t63P7yZ2EbuJeGIPkUDsJTyEl0gkfISL2E8cIA4SScQh4jBxhEgm/ESAOEocI1KIVCKNOE6kExlEJhEksogTRDaRQ5wkcok84hRxmsgnCohC4gxRRBQTJUQpUUaUExXEWeIccZ6oJC4QVcRF4hJRTdQQtUQdUU9cJq4QDUQj0UQ0Ey1EK2EQbUSIaAdGjb3O+WWC2zq/9FjZsLNEVsoSWSnnX5VyplYpZ2OVcjZmK06ULMoXFYiqRQFRjahWVCiqE9WLEkRFomJRiShV5BF5RSmiBlGaqFSUKEoXZYgyRT6RS9QsKhOVi1pEWaIKUauoUmSIckRtonZRnihelCRqFDWJckVBatTwWr1eYD4+Z833XTXrT5v1mln/NPZYuEL742IPn8vIi32zLqM89kS7jIfN+ohZ/yj2bbuMq1P28WWfWR81a7ZZr5s1wayPmfXXzfpas/6cWV9n1o/EnmqX8XisjVyGEWs1l9Fl1g7zC6fHxXrdFZqIi7W5K/R+68brzRsX4mKj5Qq5rRud5ge9Jfb8u4y3m/UN5jsux8UG02W8OdY0LiMYGzGX8ZvWD73PHPc3mmi1pj2Rh7s3mPc3uGje4KJ5g4vmDYy2jWQinyggqokAUUPUEoVEHVFPJBBFRDFRQqQSHsJLpBANRBpRSiQS6UQGkUn4CBfRTJQR5UQLkUVkExVEK1FJGEQO0Ua0E3lEI9FEBIl4IpdIAkYNn3O4a7zbfFfYbPmiOOvN+9nNXezmLnZzF7u5i93cxW7uYjd3sZu72M1d7OYudnMXu7mL3dzFbu5iN3exm7vYzV3s5i52cxe7uYvd3MVu7mI3d7Gbu9jNXezmLnZzF7u5i93cxW7uYjd3sZu72M1d7OYudnMXu7mL3dzFbu5iN3exm7vYzV3s5i52cxe7uYvd3MVu7mI3d7Gbu9jNXezmLnZzF7u5i93cFevmAzsnb2+2grvLvPHWWDsfvGMdrrpCebGN/6Sva7HqNuv61FdetL7aYtVjfuLr1ifeWbWs1WkhbuorL1/fmlXrEEd7lqM9y9Ge5WjPcrRnOdqzHO1ZjvYsR3uWoz3L0Z7laM9ytGc52rMc7VmO9ixHe5ajPcvRnuVoz3K0ZznasxztWY72LEd7lqM9y9Ge5WjPcrRnOdqzHO1ZjvYsR3uWoz3L0Z7laM9ytGc52rMc7VmO9ixHe5ajPcvRnuVoz3K0ZznasxztWY72LEd7lqM9y9Ge5WjPcrRnY6N9+I49B78cG+EjVhPvnE11yllRp5wHdcp5UKccAXfK2U2nnMF0yhlMp5zBdMoZTKecs3TKOUunnIl0yplIp5xfdMr5RaecUXTKGUWnnDV0ynlCp5xJdsoRfqecc3bKWWannGV2ynllp5w7dsq5Y6ecO3bKuWOnnC12ytlip5zLdco5YKec2XXKmV2nnKV0yrlcp5zLdcq5XKecz3TKGUynnMt1yvlap5yv2coWtYoMUY6oTdQuyhXliU5Ro0ay1fk7z+KQ3GNIrpMN2ff329v69tsK5R62qkR+0ePUqBG4Y23nmCtPbH/jqPWZIyb/3FpvbpjNuz82hq5Qb1zsp3cZM2btNWtk6sECu7PgfsWFtsh8x2NxsdlwGR+MdbcrdNB6w86Su7OkPmHW56YerKg7C+j9hbPPvNFp3eg339MzhQV0wHzD38SeTVfIHxcbZ1coNS7WCa7QG6wb1uWOjrjYJLiMu1MPltQ3mfXC1IMjgZ2VftCsjbEudxkfN+uT5ifIccfiwGX80NSDQ4WbZh2KjZ/LODP14JBh57rKkFlLzTpsfoLvt76DN5s3PmzduH/McMu8MSrHBmXmje64WPu4Qg3WjfvHAgnm56uYenAsUGHW7zbriHmHv7XucNu88dvWjVHzxh/HxXreZfxtbJpdoZ+y3rBzeGMeBoX64mKd7wp92rrxFvPGjbhY97tCPdaNMfPGgHXj/jFPinnju6wbbzVvPBUXi11X6EetG0+ZN47IMc24eeON1o23mTfebd2YMG98Z1wsCFyhx60bd8xv55RZv818w2BcLFZdRtbU/eOc+8d3bzfr07EgchnFZv12s86a9TvM+iuxUXcZT5p10qyJUw8OxhrM+tqpBwdj32nWy1P/8oArw+pfs77D/Eb+xvpG3mm+4UosMV3GYbNOmbXNrNPmHap4BeELsZk6Zk2ROQvGH05ZVwdcRv6UtcfoMvZa702x3nvUlPfBpBq/iZC3cZo4RBwmjhBxRDKRTxQQ1USAqCFqiUKijqgnEogiopgoIVIJD+ElUogGIo0oJRKJdCKDyCR8hItoJsqIcqKFyCKyiQqilagkDCKHaCPaiTxiF5FExBONRBMRJHKJU8Rl4hxxgXATu4k9xF5iH7GfOED4iWPEceIEcZI4Q5wlzhMXiUvEFSIEjBqpzlWF18SOfNOcy/TGID7f+/hgvS/2UcfNj0rnqd5z7OTn2LzPsV+fY1A8xzh4jnHwHCfzOTbVcxzG5zimzzEonmPvPcdReI7D+Fzsh8mwfpCdw748uZSSZx+aZPLFfHvi0C+Odol2i+JFe0QJor0ij8gr2idKFPlELtF+0QHRQVGS6JDosOiIKFnkFwVER0XHRCmiVFGa6LgoXZQhyhQFRVmiE6JsUY7opChXlCc6JTotyhcViApFZ0RFomJRiahUVCYqF1WIzorOic6LKkUXRFWii6JLompRjahWVCeqF10WXRE1iBpFTaJmUYuoVWSI2kQhUTs1agSRK8aXuQx9GaliYzcRT+whEoi9hIfwEvuIRMJHuIj9xAHiIJFEHCIOE0eIZMJPBIijxDEihUgl0ojjRDqRQWQSQSKLOEFkEznESSKXyCNOEaeJfKKAKCTOEEVEMVFClBJlRDlRQZwlzhHniUriAlFFXCQuEdVEDVFL1BH1xGXiCtFANBJNRDPRQrQSBtFGhIh2YNTI+qZe4f73vVhgncMfcU+9lKsGJ/75lRXjz603Z1tvnjH1+dh8uYy/mHpwZrnJuNxkXG4yLjcZl5uMy03G5SbjcpNxucm43GRcbjIuNxmXm4zLTcblJuNyk3G5ybjcZFxuMi43GZebjMtNxuUm43KTcbnJuNxkXG4yLjcZl5uMy03G5SbjcpNxucm43GRcbjIhN5mQm0zITSbkJhNykwm5yYTcZEJuMiE3mZCbTMhNJuQmE3KTCbnJhNxkQm4yITeZkJtMyE0m5CYTcpMJucmE3GRCbjIhN5mQm0zITSbkJhNykwm5yYTcZEJuMiE3mZCbTMhNJuQmE3KTCbnJhNxkQm4yITeZkJtMyM1YQubciW1ghQpiu8MnuU89LAfYw3IIOGwfaOXyBM4jJ3AeOYHzyAmcR07gPHIC55ETOI+cwHnkBM4jJ3AeOYHzyAmcR07gPHIC55ETOI+cwHnkBM4jJ3AeOYHzyAmcR07gPHIC55ETOI+cwHnkBM4jJ3AeOYHzyAmcR07gPHIC55ETOI+cwHnkBM4jJ3AeOYHzyAmcR07gPHIC55ETOI+cwHnkBM4j/eWREziPnMB55ATOIydwHjmB88gJnEdO4DxyAueREziPnMB55ATOIydwHjmB88gJnEdO4DxyAueREziPnMB55ATOIydwHjmB88gJnEdO4DxyAueREziPTK9HTuA8cgLnkRM4j5zAeeQEziMncB45gfPICZxHTuA8cgLnkRM4j50reVaumAdLoYq42MC7QqfwCn3rj/UgaXySND5JGp8kjU+SxidJ45Ok8Um2+CRbfJItPskWn2SLT7LFJ9nik2zxSbb4JFt8ki0+yRafZItPssUn2eKTbPFJtvgkW3ySJj5JE5+kiU/SxCdp4pM08Uma+CRNfJImPkkTn6SJT9LEJ2nikzTxSZr4JE18kiY+SROfpIlP0sQnaeKTNPFJmvgkTXySJj5JE5+kiU/SxCdp4pM08Uma+CRNfJImPkkTn6SJT9LEJ2nikzTxSZr4JE18kiY+SROfpIlP0sQnaeKTNPFJmvgkTXySJj5JE5+kic9Ok1PcUX87GsPGIeIwcYSII5KJfKKAqCYCRA1RSxQSdUQ9kUAUEcVECZFKeAgvkUI0EGlEKZFIpBMZRCbhI1xEM1FGlBMtRBaRTVQQrUQlYRA5RBvRTuQRjUQTESTiiVwiCRg1Tlttu8dc+3xxsVXEZbzJrO8y65diK5UrFMdfW/sz6zO4iV3EbiKeSCA8hJfYRyQSPsJFHCAOEknEIeIwcYRIJvxEgDhKHCNSiFQijThOpBMZRCYRJLKIE0Q2kUOcJHKJPOIUcZrIJwqIQuIMUUQUEyVEKVFGlBMVxFniHHGeqCQuEFXEReISUU3UELVEHVFPXCauEA1EI9FENBMtRCthEG1EiGgHRo38b+oGprWF+Ft8XdDL/WXPBVy538mWfydz453MjXcyN2KII5KJfKKAqCYCRA1RSxQSdUQ9kUAUEcVECZFKeAgvkUI0EGlEKZFIpBMZRCbhI1xEM1FGlBMtRBaRTVQQrUQlYRA5RBvRTuQRjUQTESTiiVwiCRg1Ctm2M2zbGbbtDNt2hm07w7adYdvOsG1n2LYzbNsZtu0M23aGbTvDtp1h286wbWfYtjNs2xm27QzbdoZtO8O2nWHbzrBtZ9i2M2zbGbbtDNt2hm07w7adYdvOsG1n2LYzbNsZtu0M23aGbTvDtp1h286wbWfYtjNs2xm27QzbdoZtO8O2nWHbzrBtZ9i2M2zbGbbtDNt2hm07E2vbM6+gq2U7a4y15CXI62q/4mJTZL9ky/hVaye8+BX6WDR9bY9FifNYfMx6LEoZZ32Msz7GWR/jrI9x1sc462Oc9THO+hhnfYyzPsZZH+Osj3HWxzjrY5z1Mc76GGd9jLM+xlkf46yPcdbHOOtjnPUxzvoYZ32Msz7GWR/jrI9x1sc462Oc9THO+hhnfYyzPsZZH+Osj3HWxzjrY5z1Mc76GGd9jLM+xlkf46yPcdbHOOtjnPUxzvoYZ32Msz7GWR/jrI9x1heLs7Kva4Qvm+/4w7hvYJZnzU/wS/I6+m/VywGM38ZwW3/05k++tuEufwVm2/2f2npcPvGv/fQVd+zf2fiMFW1n78S+fOgjsZfpntv5veofNj/g3WYtsj7gPOPvGc7nMxzJZziFzzD+nmHIPcOQe4Z58wxH5RlGzDMMn2cYf89wop7hgD/DiHkmNhCVfEFuruyQ59o7pRf4o44z6ceZ9ONM+nH+qONM+nEm/TgfhHE+CONM+nEm/Th/1HEm/TiTfpxJP86kH2fSjzPpx/nIjzPpx/lgj/NpGGfSjzPpx5n040z6cT4N40z6cXbSOJN+nG01zqQfZ4+NM+nHmfTjbIRxJv04k36cST/OpB9n0o8z6ceZ9ONM+nG27zj7cpxJP86kH2fSjzPpx5n040z6cSb9eKxtq/7Fb5D/Zuw3yC9abz9u8u+tt0fNG5nuqQcbkats8FU2+CobfJUNvsoGX2WDr7LBV9ngq2zwVTb4Kht8lQ2+ygZfZYOvssFX2eCrbPBVNvgqG3yVDb7KBl9lg6+ywVfZ4Kts8FU2+CobfJUNvsoGX2WDr7LBV9ngq2zwVTb4Kht8lQ2+ygZfZYOvssFX2eCrbPBVNvgqG3yVDb7KBl9lg6+ywVfZ4Kts8FU2+CobfJUNvhpr8EsvacW2VuQ/m/rqK/dL/cs835o9vuqd3405N/VgMzYa+7FrXoEHKtbxyfu/pgemlovx0xympzk/T3NknmZWPc1EepqJ9DTD4Wn29dPMg6eZFE8zq55m+z/NaXyaefB07Gmsc464PmUdY9Xzp1phAq8wgVeYwCv8qVaYwCtM4BX+vCv8eVeYwCtM4BX+VCtM4BUm8AoTeIUJvMIEXmECr/BBXmECr/BxXeEjvsIEXmECrzCBV5jAK3zEV5jAK2yaFSbwCjtohQm8wnZaYQKvMIFX+JyvMIFXmMArTOAVJvAKE3iFCbzCBF5hAq+wU1fYgitM4BUm8AoTeIUJvMIEXmECrzCBV2I9fJlt28+27Wfb9rNt+9m2/WzbfrZtP9u2n23bz7btZ9v2s2372bb9bNt+tm0/27afbdvPtu1n2/azbfvZtv1s2362bT/btp9t28+27Wfb9rNt+9m2/WzbfrZtP9u2n23bz7btZ9v2s2372bb9bNt+tm0/27afbdvPtu1n2/azbfvZtv1s2362bT/btp9t28+27Wfb9rNt+9m2/bG2vcK27WbbdrNtu9m23WzbbrZtN9u2m23bzbbtZtt2s2272bbdbNtutm0327abbdvNtu1m23azbbvZtt1s2262bTfbtptt28227WbbdrNtu9m23WzbbrZtN9u2m23bzbbtZtt2s2272bbdbNtutm0327abbdvNtu1m23azbbvZtt1s2262bTfbtptt28227WbbdrNtu9m23Wzb7ljbNrBtF9m2i2zbRbbtItt2kW27yLZdZNsusm0X2baLbNtFtu0i23aRbbvItl1k2y6ybRfZtots20W27SLbdpFtu8i2XWTbLrJtF9m2i2zbRbbtItt2kW27yLZdZNsusm0X2baLbNtFtu0i23aRbbvItl1k2y6ybRfZtots20W27SLbdpFtu8i2XWTbLrJtF9m2i2zbRbbtItt2Mda2jWzbEbbtCNt2hG07wrYdYduOsG1H2LYjbNsRtu0I23aEbTvCth1h246wbUfYtiNs2xG27QjbdoRtO8K2HWHbjrBtR9i2I2zbEbbtCNt2hG07wrYdYduOsG1H2LYjbNsRtu0I23aEbTvCth1h246wbUfYtiNs2xG27QjbdoRtO8K2HWHbjrBtR9i2I2zbEbbtCNt2hG07wrYdibVtE9v2BT6uL/ChfIGP3gts2xfYnC+wOV9gn7zAH/EFtsYLbJoX2LYv8JF4gU/MC2yNF2I/SPMda+Jcxk9aJ5otr/6lq2/yX7p6h1mnp179i1f/kf/i1Vf9Q1c72fIFLl/2X71qNcfrPeb9Tsculhnf0OactQ12cOrlukn31Tfn2piZY3ysxrjUj3GpH2NmjnGpH+NSP8Y0HWOajnGpH+NSP8bMHONSP8alfoxL/RiX+jEu9WNc6scY4WNc6seY2mPM8zEu9WNc6se41I9xqR9jno9xqR/jkjTGpX6M69MYl/oxLlZjXOrHuNSPcUUZ41I/xqV+jEv9GJf6MS71Y1zqx7jUj3GpH+M6OMYFboxL/RiX+jEu9WNc6se41I9xqR/jUj8WG+EQ/wRrvfw6la14atRot+6/86tEb45Dazs6RY0aDzlbvd9hJcTD1ge/19QXzTu+zxypqztj2BI3Zd/vy3ZEhD5oveGieTPT+iyv4d9v+Ufry7iJXcRuIp7YQyQQewkP4SX2EYmEj3AR+4kDxEEiiThEHCaOEMmEnwgQR4ljRAqRSqQRx4l0IoPIJIJEFnGCyCZyiJNELpFHnCJOE/lEAVFInCGKiGKihCglyohyooI4S5wjzhOVxAWiirhIXCKqiRqilqgj6onLxBWigWgkmohmooVoJQyijQgR7cCocZVBsM0g2GYQbDMIthkE2wyCbQbBNoNgm0GwzSDYZhBsMwi2GQTbDIJtBsE2g2CbQbDNINhmEGwzCLYZBNsMgm0GwTaDYJtBsM0g2GYQbDMIthkE2wyCbQbBNoNgm0GwzSDYZhBsMwi2GQTbDIJtBsE2g2CbQbDNINhmEGwzCLYZBNsMgm0GwTaDYJtBsM0g2GYQbDMIthkE2wyCbQbBNoNgm0GwzSDYZhBsMwi2GQTbDIJtBsE2g2CbQbDNINhmEGwzCLYZBNsMgm0GwTaDYJtBsM0g2GYQbDMIthkE2wyCbQbBdiwIrjnHFUet44pHXj2zf/VvWE+9Us7orV2Vt039+57ZP2pNlNv8gM/FcskVKrM+4KT5htpYhLlC77XecMC8UWLdOGPeyLJuHDPvct6s7zff8PNxUw/OaLe4Pm9xfd7i+rzF9XmL6/MW1+ctrs9bXJ+3uD5vcX3e4vq8xfV5i+vzFpfkLS7JW1ySt7gkb3FJ3uKSvMUleYtL8haX5C2uwltchbe4Cm9xFd7iKrzFVXiLq/AWV+EtrsJbXIW3uApvcRXe4sK7xYV3iwvvFrtoiwvvFhfeLS68W1xrt7jWbnGt3eJau8W1dotr7RbX2i0ur1tcUbe4om5xRd3iirrFFXWLK+oWV9QtrqhbXFG3uKJucUXd4oq6xRV1iyvqFlfULa6oW1xRt7iibnFF3eKKusUVdYsr6lZs5K/zT3f1xc7l3aJdot2ieNEeUYJor8gj8or2iRJFPpFLtF90QHRQlCQ6JDosOiJKFvlFAdFR0TFRiihVlCY6LkoXZYgyRUFRluiEKFuUIzopyhXliU6JTovyRQWiQtEZUZGoWFQiKhWVicpFFaKzonOi86JK0QVRleii6JKoWlQjqhXViepFl0VXRA2iRlGTqFnUImoVGaI2UUjUTo0aj/2bvGbXunzwnqmX32WB1zq/NxmwzlNex2sEn+J6+SkEkI3DxBEijkgm8okCopoIEDVELVFI1BH1RAJRRBQTJUQq4SG8RArRQKQRpUQikU5kEJmEj3ARzUQZUU60EFlENlFBtBKVhEHkEG1EO5FHNBJNRJCIJ3KJJGDU6HD+6YpI7DLf6/lLY2OS9GP2xHfimoLxYX7yD/PLfjh25zfYf2HUZSzFQs1lvMZ66xu5z/dP1ke5iV3EbiKe2EMkEHsJD+El9hGJhI9wEfuJA8RBIok4RBwmjhDJhJ8IEEeJY0QKkUqkEceJdCKDyCSCRBZxgsgmcoiTRC6RR5wiThP5RAFRSJwhiohiooQoJcqIcqKCOEucI84TlcQFooq4SFwiqokaopaoI+qJy8QVooFoJJqIZqKFaCUMoo0IEe3AqBF2XsHzA1b0dNn/cp3xuxa6rYjYOQa7LMefl+0c6uFy+zb2y9s4dG/j0L2NQxdDHJFM5BMFRDURIGqIWqKQqCPqiQSiiCgmSohUwkN4iRSigUgjSolEIp3IIDIJH+EimokyopxoIbKIbKKCaCUqCYPIIdqIdiKPaCSaiCART+QSScCo8TgPmL/qAbJ1fPuDUw8OkHcOgL/SYe79o9uv+6B255h71IhwwIY5YMMcsGEO2DAHbJgDNswBG+aADXPAhjlgwxywYQ7YMAdsmAM2zAEb5oANc8CGOWDDHLBhDtgwB2yYAzbMARvmgA1zwIY5YMMcsGEO2DAHbJgDNswBG+aADXPAhjlgwxywYQ7YMAdsmAM2zAEb5oANc8CGOWDDHLBhDtgwB2yYAzbMARvmgA1zwIY5YMMcsGEO2DAHbDg2YDfMZeSN5uPyUWsZ6eULYOpki6NOtrbq7EXlCfb8JHt+kj0/yZ6fZM9Psucn2fOT7PlJ9vwke36SPT/Jnp9kz0+y5yfZ85Ps+Un2/CR7fpI9P8men2TPT7LnJ9nzk+z5Sfb8JHt+kj0/yZ6fZM9Psucn2fOT7PlJ9vwke36SPT/Jnp9kz0+y5yfZ85Ps+Un2/CR7fpI9P8men2TPT7LnJ9nzk+z5Sfb8JHt+kj0/yZ6fZM9Pxtq279/0N6f/TX9xvMOs75vCnks/R3SdI7rOEV3niK5zRNc5ousc0XWO6DpHdJ0jus4RXeeIrnNE1zmi6xzRdY7oOkd0nSO6zhFd54iuc0TXOaLrHNF1jug6R3SdI7rOEV3niK5zRNc5ousc0XWO6DpHdJ0jus4RXeeIrnNE1zmi6xzRdY7oOkd0nSO6zhFd54iuc0TXOaLrHNF1jug6R3SdI7rOEV3niK5zRNdjIzpwx94AybGWpTexh1/kg/wiH9cX+VC+yB5+kZ36Ijv1RTbNi/x5X2SfvMgOepE9/CIflhf5LL3IPnkx9lMNOhugP2z9VE++Av9+w1c9XLa2pl9nPRQ3nX00V2wfbYjP8CBTapApNciUGuQzPMiUGmRKDfK5H+RzP8iUGmRKDfIZHmRKDTKlBplSg0ypQabUIFNqkA03yJQaZI8NsvsGmVKDTKlBptQgU2qQ3TfIlBrkAA0ypQY5TYNMqUGO1iBTapApNcj+H2RKDTKlBplSg0ypQabUIFNqkCk1yJQa5NQOchwHmVKDTKlBptQgU2qQKTXIlBpkSg3G5nmYx8uvi0MPOsoXFYjiRYWiBFGRqFhUIvKIvKJSUaLIJ3KJykTlogpRpeigKEl0SHRYdESULKoWBUQ1olpRnahelCJKFTWI0kSNonRRhihT1CQKippFLaIsUbaoVWSIckRtonZRrihPdIoaNd7MaxJ/a93BTewidhPxxB4igdhLeAgvsY9IJHyEi9hPHCAOEknEIeIwcYRIJvxEgDhKHCNSiFQijThOpBMZRCYRJLKIE0Q2kUOcJHKJPOIUcZrIJwqIQuIMUUQUEyVEKVFGlBMVxFniHHGeqCQuEFXEReISUU3UELVEHVFPXCauEA1EI9FENBMtRCthEG1EiGgHRo1bPHL7PJ/zz3NwPs/B+TwHJ4Y4IpnIJwqIaiJA1BC1RCFRR9QTCUQRUUyUEKmEh/ASKUQDkUaUEolEOpFBZBI+wkU0E2VEOdFCZBHZRAXRSlQSBpFDtBHtRB7RSDQRQSKeyCWSgFFjhG07zbadZttOs22n2bbTbNtptu0023aabTvNtp1m206zbafZttNs22m27TTbdpptO822nWbbTrNtp9m202zbabbtNNt2mm07zbadZttOs22n2bbTbNtptu0023aabTvNtp1m206zbafZttNs22m27TTbdpptO822nWbbTrNtp9m202zbabbtNNt2mm07zbadZttOs22n2bbTsba97bxAJFS/szdwxHrzqPVm6xcjju28Pr81bgq/RbHzGww7Pf7jsU/2Fr7INSl2lOcW7RLtFsWL9ogSRHtFHpFXtE+UKPKJXKL9ogOig6Ik0SHRYdERUbLILwqIjoqOiVJEqaI00XFRuihDlCkKirJEJ0TZohzRSVGuKE90SnRalC8qEBWKzoiKRMWiElGpqExULqoQnRWdE50XVYouiKpEF0WXRNWiGlGtqE5UL7osuiJqEDWKmkTNohZRq8gQtYlConZq1Biz925DW7GtvbfyBXC/zEj75di9n/qm/yNez/IXoy6Y9RenvvK+6HeZHzAivxT17/wi2XH7L/7aj2iJPPMl0nclkkW2HqdGjbfx5YkFMqMF9j0mXtLrK77ev41sPS4vyiP1DTxAd3b+nvkH5Q8mvM98W7v1/m9zfhvy763uezv3Kf4GS5yNXcRuIp7YQyQQewkP4SX2EYmEj3AR+4kDxEEiiThEHCaOEMmEnwgQR4ljRAqRSqQRx4l0IoPIJIJEFnGCyCZyiJNELpFHnCJOE/lEAVFInCGKiGKihCglyohyooI4S5wjzhOVxAWiirhIXCKqiRqilqgj6onLxBWigWgkmohmooVoJQyijQgR7cCo8e3fkqtt/67X+q0l7fuYjN/BuD8lcX/KjvvJryvu8dOF/vJfWxG/ma+n+85Xf4/95f177NavZv/s1Ku/z/7y+gt1+qvr7+A21we40n2Ahwsf4OHCB3i4EEMckUzkEwVENREgaohaopCoI+qJBKKIKCZKiFTCQ3iJFKKBSCNKiUQincggMgkf4SKaiTKinGghsohsooJoJSoJg8gh2oh2Io9oJJqIIBFP5BJJwKjxTvsQPnTQbR3DTzn/Bkpol5V2c+aN37M6fees6Ly9tE1z8cuXxS/fvsfMN/tM0/idqf8oL7wZNd51xz4ZvmY9pLPMhQHmwgBzYYC5MMBcGGAuDDAXBpgLA8yFAebCAHNhgLkwwFwYYC4MMBcGmAsDzIUB5sIAc2GAuTDAXBhgLgwwFwaYCwPMhQHmwgBzYYC5MMBcGGAuDDAXBpgLA8yFAebCAHNhgLkwwFwYYC4MMBcGmAsDzIUB5sIAc2GAuTDAXBhgLgwwFwaYCwPMhQHmwgBzYYC5MMBcGIhN8Ludf7LMqJqKvWo99Fmr5XdOdj5ufcApYNSIvnoQ+f8+iDQP3kLxcVMvn6PJV48ip162R5Hv4YWioFwoCsqFoqBcKArKhaKgXCgKyoWioFwoCsqFoqBcKArKhaKgXCgKyoWioFwoCsqFoqBcKArKhaKgXCgKyoWioFwoCsqFoqBcKArK5mxQLhQF5UJRUC4UBeVCUVAuFAXlQlFQLhQF5UJRUC4UBeVCUVAuFAXlQlFQLhQF5UJRUC4UBeVCUVAuFAXlQlFQLhQF5cAsKBeKgnKhKCgXioJyoSgoF4qCcqEoKBeKgnKhKCgXioJyoSgoF4qCcqEoKBeKgnKhKCgXioJyoSgoG/ZBuVAUlAtFQblQFJQLRUG5UBSUC0VBuVAUlMsFQblQFJQLRUG5UBSUC0VBuVAUlAtFQblQFJQLRUG5UBSUC0VBuVAUtA/I32v/CnPoR+KsY9L3MWXCkjJhSZmwpExYUiYsKROWlAlLyoQlZcKSMmFJmbCkTFhSJiwpE5aUCUvKhCVlwpIyYUmZsKRMWFImLCkTlpQJS8qEJWXCkjJhSZmwpExYUiYsKROWlAlLyoQlZcKSMmFJmbCkTFhSJiwpE5aUCUvKhCVlwpIyYUmZsKRMWFImLCkTlpQJS8qEJWXCkjJhSZmwpExYUiYsKROWlAlLyoQlZcKSMmFJmbCkTFhSJiwpE5aUCUvKhCVlwpIyYUmZsKRMWFImLCkTlpQJS8qEJWXCkjJhSZmwpExYUiYsKROWlAnbKfN+nuu+C41h4xBxmDhCxBHJRD5RQFQTAaKGqCUKiTqinkggiohiooRIJTyEl0ghGog0opRIJNKJDCKT8BEuopkoI8qJFiKLyCYqiFaikjCIHKKNaCfyiEaiiQgS8UQukQSMGt/F1wFUyMhVyMBXyCJg63Fq1JjjP1RwXKLyuCw9x+37f2DnXx3eY77vA2b9a0zNZzg1n4ndf55Lt1+Wbr8s3X5Zuv2ydPtl6fbL0u2XpdsvS7dflm6/LN1+Wbr9snT7Zen2y9Ltl6XbL0u3X5Zuvzx+flm6/bJ0+2Xp9suz5pel2y9Lt1+Wbr8s3X5Zuv2ydPtl6fbL0u2XpdsvS7dflm6/LN1+Wbr9snT7Zen2y9Ltl6XbL0u3X/rRL0u3X5Zuvyzdflm6/bJ0+2Xp9svS7Zel2y9Lt1+Wbr8s3X5Zuv2ydPtl6fbL0u2XpdsvS7dfJtkvS7dflm6/LN1+Wbr9snT7Zen2y9Ltlxzxy9Ltl6XbL0u3X5Zuvyzdflm6/bJ0+2Xp9svS7Zel2y9Lt9/OoYWdnf9pa1PCHNZQlBt+H4vd6YMv89+jtTahdsVNfYt+oXYnlT/JVP4kUshGHJFMVBO1RCFRR9QTCUQRUUJ4iRSigUgjEokMwkc0E2VEC5FFZBMVRCtRSRhEDpFHNBJNRJCIJ3KJJGDU+JD9F1pCt2JnyYtf8dVvofI46+7f7fyO+Yh17+95df/75f0iipfRtrf1eo7mqVe3v6f++fb3h3kC+WM4PLFxiDhMHCHiiGQinyggqokAUUPUEoVEHVFPJBBFRDFRQqQSHsJLpBANRBpRSiQS6UQGkUn4CBfRTJQR5UQLkUVkExVEK1FJGEQO0Ua0E3lEI9FEBIl4IpdIAkaNj1htu2A+MKenrNMqV8hntfZ+8w1vMuu7zDo5ZZ1TuUJxcejPP7c+k5vYRewm4okEwkN4iX1EIuEjXMQB4iCRRBwiDhNHiGTCTwSIo8QxIoVIJdKI40Q6kUFkEkEiizhBZBM5xEkil8gjThGniXyigCgkzhBFRDFRQpQSZUQ5UUGcJc4R54lK4gJRRVwkLhHVRA1RS9QR9cRl4grRQDQSTUQz0UK0EgbRRoSIdmDU+F7ndyKi1kHh93G3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3pkd2a3pkt6ZHdmt6ZLemR3ZremS3psferfn+nV3jwQfzZ3yJC8yXMH02DhNHiDgimcgnCohqIkDUELVEIVFH1BMJRBFRTJQQqYSH8BIpRAORRpQSiUQ6kUFkEj5gwe2Kc1n/3T/Q+hLXoC9hsGyUEy1EFpFNVBCtRCVhEDlEG9FO5BGNRBMRJOKJXCIJGDXu3omdshsXrcXyoyY+aB4jfyy2+/KxOw8W+veMWG/5AZ4c3mWz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wz32Wzx+AimokyopxoIbKIbKKCaCUqCYPIIdqIdiKPaCSaiCART+QSScCo8XHnFfZLsbb+Qf6W7F9Z93YTu4jdRDyxh0gg9hIewkvsIxIJH+Ei9hMHiINEEnGIOEwcIZIJPxEgjhLHiBQilUgjjhPpRAaRSQSJLOIEkU3kECeJXCKPOEWcJvKJAqKQOEMUEcVECVFKlBHlRAVxljhHnCcqiQtEFXGRuERUEzVELVFH1BOXiStEA9FINBHNRAvRShhEGxEi2oFR4xN3rAfPZfyMlQqffJlfWHsp19OsrPuzuKmX9pdqQ1lu60H5FH+z6LSc8Zy2j3x/6BX0SP2LB8h6IEL/6q8WLTl/8MMX+3WtH+YfRa2NPVxxonxRgSheVChKEBWJikUlIo/IKyoVJYp8IpeoTFQuqhBVig6KkkSHRIdFR0TJompRQFQjqhXViepFKaJUUYMoTdQoShdliDJFTaKgqFnUIsoSZYtaRYYoR9QmahflivJEp0QXRBdFl6lR49POv+T0YWtgfoSv9BqXu4/bd//Mq5dxX/mXca3rr38w9epvMX3zLuPuHDbZl3E/aw3Rh8z3vSUuNrqu0C/Yq5p9p1/jEe6vIY9tHCaOEHFEMpFPFBDVRICoIWqJQqKOqCcSiCKimCghUgkP4SVSiAYijSglEol0IoPIJHyEi2gmyohyooXIIrKJCqKVqCQMIodoI9qJPKKRaCKCRDyRSyQBo8aP8tW86bIQpcuBRLq9evwYt6iW2OZLbPMltvkS23yJbb7ENl9imy+xzZfY5kts8yW2+RLbfIltvsQ2X2KbL7HNl9jmS2zzJbb5Ett8iW2+xDZfYpsvsc2X2OZLbPMltvkS23yJbb7ENl9imy+xzZfY5kts8yW2+RLbfIltvsQ2X2KbL7HNl9jmS2zzJbb5Ett8iW2+xDZfYpsvsc2X2OZLbPMltvkS23wp1rY//ko+qfrn51LW+ekJ6wDGWuyfiZvC2dXnrMfB/GJG+tSD1epZ9tmzbK1n2U3Pcoyf5bA+y2F9lnPzLJ/yZzkqz3KInuUYP8vOeJaN+ixH5dnYE/sT1g9kHmgYu6f0b9SGPhN7BeNP8gTyhJxAnpATyBNyAmnLLdol2i2KFxWK9ogSRHtFZ0RFomKRR1Qi8or2iUpFiSKfyCUqE+0XlYsqRGdF50TnRZWiC6IDooOiKlGS6JDosOiI6KLokihZ5BdViwKio6IaUa2oTlQvOia6LEoRpYquiBpEaaLjokZRuihDlClqEgVFzaIWUZbohChb1CoyRDmiNlFI1C46KcoV5YlOUaPGT/E8u1yem3Lpy3LpGluPU6PGsvPPV8XFtrxWnL+/bfzS1INTy52evxr7+NOiw6IjojhRsihfVCCqFgVENaJaUaGoTlQvShAViYpFJaJUkUfkFaWIGkRpolJRoihdlCHKFPlELlGzqExULmoRZYmyRRWiVlGlyBDliNpE7aI8UaOoSRQvyhUlUaPGT/P64O9Zd3ATu4jdRDyxh0gg9hIewkvsIxIJH+Ei9hMHiINEEnGIOEwcIZIJPxEgjhLHiBQilUgjjhPpRAaRSQSJLOIEkU3kECeJXCKPOEWcJvKJAqKQOEMUEcVECVFKlBHlRAVxljhHnCcqiQtEFXGRuERUEzVELVFH1BOXiStEA9FINBHNRAvRShhEGxEi2oFR42ec15FuWavez9qb2KFLsdcQfN7KiBPm+y49WMOMDWbFBrNig1mxwazYYFZsMCs2mBUbzIoNZsUGs2KDWbHBrNhgVmwwKzaYFRvMig1mxQazYoNZscGs2GBWbDArNpgVG8yKDWbFBrNig1mxwazYYFZsMCs2mBUbzIoNZsUGs2KD8bDBeNhgPGwwHjYYDxuMhw3GwwbjYYPxsMF42GA8bDAeNhgPG4yHDcbDBuNhg/GwwXjYYDxsMB42GA8bjIcNxsMG42GD8bDBeNhgPGwwHjYYDxuMhw3GwwbjYYPxsMF42GA8bDAeNhgPG4yHDcbDBuNhg/GwwXjYYDxsxOLhP/3/tGVj/QHQ5Cls1HyB+6zPcwCf58w9z9x5nknxPAfjeQ7G8+z45/mUPM8YfJ7h8Dxb7Hk+Wc9zFp7nyDwfexp/zvpBQub3uOw8bef5C0L3mOn3mOn3mOn3mOn3mOn3mOn3mOn3+MPcY6bfY6bfY6bfY6bf42N7j5l+j5l+j5l+j5l+j5l+j5l+j8/UPWb6PWb6PWb6PWb6PWb6PWb6PT5t95jp95jp99hS95jp99hf95jp95jpMZwgsokc4iSRS+QRp4jTRD5RQBQSZ4giopgoIUqJMqKCOEucI84TlcQFooq4SFwiqokaopaoI+qJy8QVooFoJJqIZqKFaCUMoo1oB0aNn9/5V8as/dj7Z7CG7GMY9pnhF+1rUa5Q4c4e7mZsD/cXnP2Rttix4X/mjm6H7HJ0yL5Gh+xrdMh5aofsVnTIjkSH7Eh0yI5Eh+xIdMgeRIfsQXTIzkKH7Cx0yH5Bh+wXdMgOQYfsEHTIeX+HnOl3yN5oh5x5d8huaIfsGnXIrlGH7BN1yF5Qh+wFdcheUIfsBXXI7k+H7P50yN5Mh+zpdMhOTYfs1HTIHkSH7M10yN5Mh+zNdMhuRYfsTnbI3kyH7L90yP5Lh+y/dMiOS4fssXTIHkuH7LF0yB5Lh+yVdMiOS4fsOXbY87HK1w7myATl2Pf40jf0T3K89H+Jw/pHPD70kl4Jef+f5Pgv/MXB5NgP4xbtEu0WxYv2iBJEe0UekVe0T5Qo8olcov2iA6KDoiTRIdFh0RFRssgvCoiOio6JUkSpojTRcVG6KEOUKQqKskQnRNmiHNFJUa4oT3RKdFqULyoQFYrOiIpExaISUamoTFQuqhCdFZ0TnRdVii6IqkQXRZdE1aIaUa2oTlQvuiy6ImoQNYqaRM2iFlGryBC1iUKidmrU+EXmildyxSu54pVc8UqueCVXvJIrXskVr+SKV3LFK7nilVzxSq54JVe8kiteyRWv5IpXcsUrueKVXPFKrnglV7ySK17JFa/kildyxSu54pVc8UqueCVXvJIrXskVr+SKV3LFK7nilVzxSq54JVe8kiteyRWv5IpXcsUrueKVXPFKrnglV7ySK17JFa/kildyxSu54pVc8UqueCVXvJIrXskVr+SKV3LFK7nilVzxSq54JVe8kiteyRWv5IpXcsUrueKVXPFKrnglV7ySK17JFa/kildyxSu54pVc8UqueCVXvJIrXjtX1qxcWTQPb961c0i1z3rzf3X+JZRvs05NfknOdXaG9DXSRq+RsXyNjKWtOFGyKF9UIKoWBUQ1olpRoahOVC9KEBWJikUlolSRR+QVpYgaRGmiUlGiKF2UIcoU+UQuUbOoTFQuahFlibJFFaJWUaXIEOWI2kTtojxRo6hJFC/KFSVRo8YvW439yvtVga/3NwS+1l8MeBn9QsA36RcB7ofbk+aneWbq1d8MmHqwPfqG2Kj8Cjfu34Lkt3GIOEwcIeKIZCKfKCCqiQBRQ9QShUQdUU8kEEVEMVFCpBIewkukEA1EGlFKJBLpRAaRSfgIF9FMlBHlRAuRRWQTFUQrUUkYRA7RRrQTeUQj0UQEiXgil0gCRo31O9axnyt0KvYatF/Fn6Z494j1ll+zD23sVeGmHCbflAO5m/aK8d+s+3+3+QmPxk3ZV/Y/at34HvOh7419Wy4jyawfNt9RY73jI+Yb/jH2LbpCi7Fd31/nidzB2Ndwi3aJdoviRXtECaK9Io/IK9onShT5RC7RftEB0UFRkuiQ6LDoiChZ5BcFREdFx0QpolRRmui4KF2UIcoUBUVZohOibFGO6KQoV5QnOiU6LcoXFYgKRWdERaJiUYmoVFQmKhdViM6KzonOiypFF0RVoouiS6JqUY2oVlQnqhddFl0RNYgaRU2iZlGLqFVkiNpEIVE7NWr8BhboULXMVrXMXbVMmq04UbIoX1QgqhYFRDWiWlGhqE5UL0oQFYmKRSWiVJFH5BWliBpEaaJSUaIoXZQhyhT5RC5RUNQsKhOVi1pEWaJsUYWoVVQpMkQ5ojZRuyiPGjV+k6+L/TssdzZ2EbuJeGIPkUDsJTyEl9hHJBI+wkXsJw4QB4kk4hBxmDhCJBN+IkAcJY4RKUQqkUYcJ9KJDCKTCBJZxAkim8ghThK5RB5xijhN5BMFRCFxhigiiokSopQoI8qJCuIscY44T1QSF4gq4iJxiagmaohaoo6oJy4TV4gGopFoIpqJFqKVMIg2IkS0A6PGb/EM8ot8zr/IwfkiB+eLHJwvYqWykUzkEwVENREgaohaopCoI+qJBKKIKCZKiFTCQ3iJFKKBSCNKiUQincggMgkf4SKaiTKinGghsohsooJoJSoJg8gh2oh2Io9oJJqIIBFP5BJJwKjx352/Ajcbe5XOb+/8ayuft87uvte88RtxDwYvlCJHWin2Crjxdb3i03rp5I9O/Yd95ef9V3xucuzXOPZrHPs1jv0ax36NY7/GsV/j2K9x7Nc49msc+zWO/RrHfo1jv8axX+PYr3Hs1zj2axz7NY79Gsd+jWO/xrFf49ivcezXOPZrHPs1jv0ax36NY7/GsV/j2K9x7Nc49msc+zWO/RrHfo1jv8axX+PYr3Hs1zj2axz7NY79Gsd+jWO/xrFf49ivcezXOPZrHPs1jv0ax34tNrS/Y28cGe+0pv53nV/p+B4L/+MV9AJua7c88FJe6DRq/J7zGy2fiOXhlvVgfJ/JtLjYc+AK1Vo3vt+89+ute/++k56HYvtvTzMLJpgFE8yCCWbBBLNgglkwwSyYYBZMMAsmmAUTzIIJZsEEs2CCWTDBLJhgFkwwCyaYBRPMgglmwQSzYIJZMMEsmGAWTDALJpgFE8yCCWbBBLNgglkwwSyYYBZMMAsmmAUTzIIJZsEEs2CCWTDBLJhgFkwwCyaYBRPMgglmwQSzYIJZMMEsmGAWTDALJpgFE8yCCWbBBLNgIpYFf2C1bZP5wPxv8113zW5+W2wn9xnuuFTJjkuVHAdUyY5Lley4VMmOS5XsuFTJjkuV7LhUyY5Lley4VMmOS5XsuFTJjkuV7LhUyY5Lley4VMmOS5XsuFTJjkuV7LhUyY5Lley4VMmOS5XsuFTJjkuV7LhUyY5Lley4VMmOS5XsuFTJjkuV7LhUyY5Lley4VMmOS5XsuFTJjkuV7LhUyY5Lley4VMmOS5XsuFTJjkuV7LhUyY5Lley4VNnHm3/4DS1Q1pLwD7xm/fJYqb72BeqPrB/fbepz5ls/atZHp6wTdVeozPqwk+Ybas36fvMNT1pvOGveeK9144B5o8S6cca8kWXdOGbe9/yDWTV+33qwdxG7iXhiD5FA7CU8hJfYRyQSPsJF7CcOEknEIeIwcYRIJvxEgDhKpBCpRBpxnEgnMohMIkhkESeIbCKHyCXyiFPEaSKfKCAKiSKimCghSokyopyoIM4RlcQFooq4SFwiqokaopaoI+qJy8QVooFoJJqIZqKFaCUMoo0IEe3AqPHHvLb6hlg2ukW7RLtF8aI9ogTRXpFH5BXtEyWKfCKXaL/ogOigKEl0SHRYdESULPKLAqKjomOiFFGqKE10XJQuyhBlioKiLNEJUbYoR3RSlCvKE50SnRbliwpEhaIzoiJRsahEVCoqE5WLKkRnRedE50WVoguiKtFF0SVRtahGVCuqE9WLLouuiBpEjaImUbOoRdQqMkRtopConRo1nn31bwt/g39b+B3mHc64p/5D/JHhV/+4sPEt+Tdin+Puz00eat3E2mXjMHGEiCOSiXyigKgmAkQNUUsUEnVEPZFAFBHFRAmRSngIL5FCNBBpRCmRSKQTGUQm4SNcRDNRRpQTLUQWkU1UEK1EJWEQOUQb0U7kEY1EExEk4olcIgkYNf5Ewt/6C+ThqVcXgalX5h+YfzX7vzXZ/6fWEH3MfF+z9b7d5o3EuKkHYf671ti5iV1EPLGHSCD2Eh7CS+wjEgkf4SL2EweIg0QScYg4TBwhkgk/ESCOEseIFCKVSCOOE+lEBpFJBIks4gSRTeQQJ4lcIo84RZwm8okCopA4QxQRxUQJUUqUEeVEBXGWOEecJyqJC0QVcZG4RFQTNUQtUUfUE5eJK0QD0Ug0Ec1EC9FKGEQbESLagVHj+TvzsT+I8texa4gvvHp29erCOvVvsrBap6Fvf2WusH/Gvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiOy9xmRvc+I7H1GZO8zInufEdn7jMjeZ0T2PiP23uef4++SGZ/lwdpnMXUxjBp/8U19bdQ/v8K8szx/M64nP2ot0+6pl3Jh+UXrh9vpmlGZmFH7sfpLZnBAMjggGRyQDA5IBgckgwOSwQHJ4IBkcEAyOCAZHJAMDkgGBySDA5LBAcnggGRwQDI4IBkckAwOSAYHJIMDksEByeCAZHBAMjggGRyQDA5IBgckgwOSwQHJ4IBkcEAyOCAZHJAMDkgGBySDA5LBAcnggGRwQDoqIBkckAwOSAYHJIMDksEByeCAZHBAMjggGRyQDA5IBgckgwOSwQHJ4IBkcEAyOCAZHJAMDkgGBySDA5LBAcnggGRwQDI4IBkckAwOSAYHJIMDksEByeCAZHBAMjggGRyQDA5IBgckgwOSwQE7V/7q/xWr/yJOrZz9h3/nWP3a0/Svd15J/708lv0015RPx374e+bJ4jaD1S3B6pZgdUuwuiVY3RKsbglWtwSrW4LVLcHqlmB1S7C6JVjdEqxuCVa3BKtbgtUtweqWYHVLsLolWN0SrG4JVrcEq1uC1S3B6pZgdUuwuiVY3RKsbglWtwSrW4LVLcHqlmB1S7C6JVjdEqxuCVa3BKtbgtUtweqWYHVLsLolWN0SrG4JVrcEq1uC1S3B6pZgdUuwuiVY3RKsbglWtwSrW4LVLcHqlmB1S7C6JVjdEqxuCVa3BKtbgtUtweqWYHVLsLolWN0SrG4JVrcEq1uC1S3B6pZgdUuwuiVY3RKsbglWtx2s/5OXJD+ExrBxiDhMHCHiiGQinyggqokAUUPUEoVEHVFPJBBFRDFRQqQSHsJLpBANRBpRSiQS6UQGkUn4CBfRTJQR5UQLkUVkExVEK1FJGEQO0Ua0E3lEI9FEBIl4IpdIAkaNv2HbDrFth9i2Q2zbIbbtENt2iG07xLYdYtsOsW2H2LZDbNshtu0Q23aIbTvEth1i2w6xbYfYtkNs2yG27RDbdohtO8S2HWLbDrFth9i2Q2zbIbbtENt2iG07xLYdYtsOsW2H2LZDbNshtu0Q23aIbTvEth1i2w6xbYfYtkNs2yG27RDbdohtO8S2HWLbDrFth9i2Q2zbIbbtUKxt//aV9ZtTxnunXsoB799xaOc4tHMc2jkO7RyHdo5DO8ehnePQznFo5zi0cxzaOQ7tHId2jkM7x6Gd49DOcWjnOLRzHNo5Du0ch3aOQzvHoZ3j0M5xaOc4tHMc2jkO7RyHdo5DO8ehnePQznFo5zi0cxzaOQ7tHId2jkM7x6Gd49DOcWjnOLRzHNo5Du0ch3aOQzvHoZ3j0M5xaOc4tHMc2jkO7RyHdi42tF+22vZ9Zndftbr7veaNL++MSEvclP3bfRlue25DH7TeYl3Zy3ZbH/u/7sTuaPyWdZnvf+/8FdGZnSn/fes+f///29U/6xrUl5gUr14GfPX1Nd/o1b//Y03ROfN9h91TD16TssxVZpmrzDJXmWWuMstcZZa5yixzlVnmKrPMVWaZq8wyV5llrjLLXGWWucosc5VZ5iqzzFVmmavMMleZZa4yy1xllrnKLHOVWeYqs8xVZpmrzDJXmWWuMstcZZa5yixzlVnmKrPMVWaZq8wyV5llrjLLXGWWucosc5VZ5iqzzFVmmavMMleZZa4yy1xllrnKLHOVWeYqs8xVZpmrzDJXmWWuMsux/v0HbvD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD1ygZfr2zw9coGX69s8PXKBl+vbPD12ht8/2j/tQqjwToC/adv0aGm9ZrwzqmX8SHnq0eaU68eaX5TjjTvr+Ff4OoeOwYNueL4T9jVxMYxTpQvKhDFiwpFCaIiUbGoROQReUWlokSRT+QSlYnKRRWiStFBUZLokOiw6IgoWVQtCohqRLWiOlG9KEWUKmoQpYkaRemiDFGmqEkUFDWLWkRZomxRq8gQ5YjaRO2iXFGe6JToguii6DI1GoqL4zbgX+CxspFJuIgjRD5RQBQTbYSHSCVqiHainCgFRs3E+3r/Vb7Q6+Km/pV/ju+lvpbg/j++F9olD+4ncBxo4xBxmDhCxBHJRD5RQFQTAaKGqCUKiTqinkggiohiooRIJTyEl0ghGog0opRIJNKJDCKT8BEuopkoI8qJFiKLyCYqiFaikjCIHKKNaCfyiEaiiQgS8UQukQSMhnbH+tY6bCt2tlRjR1M7S8Z1OaO5LovEdVkkrsuie12WjOuyBF+XJfi6LCfXZTm5LsvJdVlOrstifV0Wl+uyuFyXhfy6LOTXZSG/Lgv5dVmGrsuy/n/bu/OAyPO7zv/1pbqa4upuqKKpBpqroaEbaO7upg+ubs6iSNYknWxiwKKmZCo1V7ophaywIpE12t4jSnYBXTWKmmhiIBLXgOCCJxKNt6uz43iuOqLuunj+6nsw83yt0WR+6cl0xs4f+fSDLmamitfn/X5/vnVwR9r6HWlfd6Rh3ZGGdUcGgDsyANyR9nVH2tcdaV93ZFS4I6PCHWlfd2RwuCODwx1pbXektd2R1nZHRow70ujuyMBxR9reHWl7d6Tt3ZG2d0ca3R1p63ekWd+Rke2OtMs7MuDcsduex3A+NvCNyYDfCx23Ap+RfLy+EvX2V8xvTCHcxDHCQxwnUgkvkUakE5lEFuEiThAniVNENpFD+Ag/kUucJvKIAHGGyCcKiELiLFFEFBMlRClRRpwjyokK4jxRSVQRF4iLRDVRQ9QSl4g6op5oIBqJJqKZaCEuE1eIq0QrcY24TtwgbhJtRDvRQXQSXcQt4jbRTfQQvUQf0U8MEEFikAgRQ0AilGpwWvs4f+gf5875OHfOx7lzLBhELlFN1BBtRB7RTnQQtUQn0UWkEnVEPdFAFBBpRDqRT3QThUQjkUkUEcVECZFFuIg+ooloJvqJMqKcaCEGiFYiSFQQg8QQUUX0EL1EKeEhKolsIBHyWrk1n+X+vaMnwG8Y5l+kGY9+n+Cj3yd4lIkPPdyXD81rvH9gzL0Gv1DwHdYuSk8i2e1cobPmR0OHMoxX5cVh5o9v15h76D+1NJT5ae//Q/WWuc94Z5I/rdDvGLxXWdLiX2QPepFt50V2mhfZ4l9kI3+RjfxF9tQX2Q5eZBt9kQ32Rbb4F9k1XmQTe5Ft9EUrrideWT7NI3zTK8jpreQ6/K/E9GuT6ztf9biaL2r81VcU25MG3hQZ/F5O8d9rPW6nrBt8d/L2P20/DKH3OI9T6LLhPHLV5h++J/m1t5vfkW19x9kkD+dePlhtcjzc5Hi4yfFwk9nZ5Hi4yfFwk6naZKo2OR5ucjzcZHY2OR5ucjzc5Hi4yfFwk+PhJsfDTUZ5k+PhJtO7yVxvcjzc5Hi4yfFwk+PhJnO9yfFwk1tzk+PhJvfpJsfDTW7aTY6HmxwPN7mzNjkebnI83OR4uMnxcJPj4SbHw02Oh5scDzdZDza50Tc5Hm5yPNzkeLjJ8XCT4+Emx8NNjoebVuJzDL6Wpcy6GpIicouOiTyi46JUkVeUJkoXZYgyRVkil+iE6KTolChblCPyifyiXNFpUZ4oIDojyhcViApFZ0VFomJRiahUVCY6JyoXVYjOiypFVaILoouialGNqFZ0SVQnqhc1iBpFTaJmUYvosuiK6KqoVXRNdF10Q3RT1CZqF3WIOkVdolui26JuUY+oV9Qn6hcNiIKiQVFINEQlQj7Dfsus/cU6+Y+vk4euTraTrQiVSJ48OJk9iZjZyCF8hJ8wiFyimqgh2og8op3oIGqJTqKLSCXqiHqigSgg0oh0Ip/oJgqJRiKTKCKKiRIii3ARfUQT0Uz0E2VEOdFCDBCtRJCoIAaJIaKK6CF6iVLCQ1QS2UAilGscvY3gQwba0FulUL5VGs9bpfHYMkS5ompRjahNlCdqF3WIakWdoi5RqqhOVC9qEBWI0kTponxRt6hQ1CjKFBWJikUloiyRS9QnahI1i/pFZaJyUYtoQNQqCooqRIOiIVGVqEfUK/KIKkXZVCJ0OinrXPRe6ymyPIO/mv5JGQuelNr/pP39Aesbjn7RvPWqx7+es38D/W+bf3/G+vuXLvOZ15i+nteqEqF8w3kaOrg59/Kz0EcP7qBssUH7X1pgfF7f02dezqmRK22v8WWbQuv+8/eehZacRz+Ubb4HKnT21XmEzKN6yr/ySD0sD1CRwdPQl1gZShG5RcdEHtFxUarIK0oTpYsyRJmiLJFLdEJ0UnRKlC3KEflEflGu6LQoTxQQnRHliwpEhaKzoiJRsahEVCoqE50TlYsqROdFlaIq0QXRRVG1qEZUK7okqhPVixpEjaImUbOoRXRZdEV0VdQquia6LrohuilqE7WLOkSdoi7RLdFtUbeoR9Qr6hP1iwZEQdGgKCQaohKhYsN5Rcm21S5LHAZrTZUaPN28F7GxkUP4CD9hELlENVFDtBF5RDvRQdQSnUQXkUrUEfVEA1FApBHpRD7RTRQSjUQmUUQUEyVEFuEi+ogmopnoJ8qIcqKFGCBaiSBRQQwSQ0QV0UP0EqWEh6gksoFE8qTP3D7HB/Y5PpbP8eF7jrl9jul8jul8jkF5jvfxOWbjOabmOeb2OT4Uz/En8xyz8Zx1T85Z9+R7k/tzzpwPPpD8r52bs+aEUOfRU0TvmbMHoHNHzwi8yZiznwpZs/5NrlCrYT0CrtBHzD98X/JvTs/ZA4rPmljL5fFa5z5f5z5f5z5f5+O1zn2+zn2+zkdynY/kOvf5Ovf5Oh+vde7zde7zde7zde7zde7zde7zdf741rnP1/kTW+fPcp37fJ37fJ37fJ37fJ0/y3Xu83XGcZ37fJ3ZXOc+X2dQ17nP17nP15mmde7zde7zde7zde7zde7zde7zde7zde7zde6BdYZ7nft8nft8nft8nft8nft8nft8nft83dodFZLbXeZ2l7ndZW53mdtd5naXud1lbneZ213mdpe53WVud5nbXeZ2l7ndZW53mdtd5naXud1lbneZ213mdpe53WVud5nbXeZ2l7ndZW53mdtd5naXud1lbneZ213mdpe53WVud5nbXeZ2l7ndZW53mdtd5naXud1lbneZ213mdpe53WVud5nbXeZ2l7ndZW53mdtdK7fnjaMXqud+uheqv00G9LfJgedtcuCxZYhyRdWiGlGbKE/ULuoQ1Yo6RV2iVFGdqF7UICoQpYnSRfmiblGhqFGUKSoSFYtKRFkil6hP1CRqFvWLykTlohbRgKhVFBRViAZFQ6IqUY+oV+QRVYqyqUSo0nCOFR+3jhVVBi9fnLC+I0XkFh0TeUTHRakiryhNlC7KEGWKskQu0QnRSdEpUbYoR+QT+UW5otOiPFFAdEaULyoQFYrOiopExaISUamoTHROVC6qEJ0XVYqqRBdEF0XVohpRreiSqE5UL2oQNYqaRM2iFtFl0RXRVVGr6JrouuiG6KaoTdQu6hB1irpEt0S3Rd2iHlGvqE/ULxoQBUWDopBoiEqELhhHz2NtmJ30pQ/YeulztcxP2vpxY87+OK1fODohzVvHnouG81RBqVWkqq1/lulC85Lw9yf/8BvW7WoMjplfifjZyCF8hJ8wiFyimqgh2og8op3oIGqJTqKLSCXqiHqigSgg0oh0Ip/oJgqJRiKTKCKKiRIii3ARfUQT0Uz0E2VEOdFCDBCtRJCoIAaJIaKK6CF6iVLCQ1QS2UAiVGuw63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63qk63rsrnvJcJ4l+HWzb9YZ/I0utyU2t+1vqDc+7ctN3iKheots0rfIJrVliHJF1aIaUZsoT9Qu6hDVijpFXaJUUZ2oXtQgKhClidJF+aJuUaGoUZQpKhIVi0pEWSKXqE/UJGoW9YvKROWiFtGAqFUUFFWIBkVDoipRj6hX5BFVirKpRKjB4Gz4e3iMbZQQLsJPVBM1RD0xSKQRBUQ7MUQ0E41AItRo2J875Ap+eM5+OUulNf02yT18gffwBd7DF3gPX+A9fIH38AXewxd4D1/gPXyB9/AF3sMXeA9f4D18gffwBd7DF6x72GzY7zi0f4D3ZEK4J2Xrnv3DbTEe6ItOzJfd/D7fFffNyS/82oN9W9W15A3+2Jh7tV6Hctk4elfJyeSXh5O3/2krJFckJD+Dsm4jh/ARfsIgcolqooZoI/KIdqKDqCU6iS4ilagj6okGooBII9KJfKKbKCQaiUyiiCgmSogswkX0EU1EM9FPlBHlRAsxQLQSQaKCGCSGiCqih+glSgkPUUlkA4nQ1Qe7w1/bD9P/rD/pySxEf23t21aDL4a/JGPoJRmCL8nByFaESiT/q8x/2O3kv+QTyb9cSa5f4dyz3uT6A8l/aczAJv8j8x+RQriJY4SHOE6kEl4ijUgnMohMIotwESeIk8QpIpvIIXyEn8glThN5RIA4Q+QTBUQhcZYoIoqJEqKUKCPOEeVEBXGeqCSqiAvERaKaqCFqiUtEHVFPNBBNRDPRQlwmrhBXiVbiGnGduEHcJNqIdqKD6CS6iFtEN9FD9BJ9RD8xQASJQSJEDAGJ0HWDU0GEP9oI90eE+yPC/WHBIHKJaqKGaCPyiHaig6glOokuIpWoI+qJBqKASCPSiXyimygkGolMoogoJkqILMJF9BFNRDPRT5QR5UQLMUC0EkGighgkhogqoofoJUoJD1FJZAOJ0I0krCcMjlkfqnBTYrzIGC8yxouM8SJjvMgYLzLGi4zxImO8yBgvMsaLjPEiY7zIGC8yxouM8SJjvMgYLzLGi4zxImO8yBgvMsaLjPEiY7zIGC8yxouM8SJjvMgYLzLGi4zxImO8yBgvMsaLjPEiY7zIGC8yxouM8SJjvMgYLzLGi4zxImO8yBgvMsaLjPEiY7zIGC8yxouM8SJjvGjFuE1yu8bcrjG3a8ztGnO7xtyuMbdrzO0ac7vG3K4xt2vM7Rpzu8bcrjG3a8ztGnO7xtyuMbdrzO0ac7vG3K4xt2vM7Rpzu8bcrjG3a8ztGnO7xtyuMbdrzO0ac7vG3K4xt2vM7Rpzu8bcrjG3a8ztGnO7xtyuMbdrzO0ac7vG3K4xt2vM7Rpzu8bcrjG3a8ztGnO7ZuW23crt+5OPTMj6LlcwG9/wfub4/dY3dFjf8IFkwX6KL4p96VWy//zVsS+9Kvb/fTHsSy+TTSS/lWejejkb1cvZqF7ORvVyNqq3z0ZdhvNc87dYzzXfMvjU3EnrO1JEbtExkUd0XJQq8orSROmiDFGmKEvkEp0QnRSdEmWLckQ+kV+UKzotyhMFRGdE+aICUaHorKhIVCwqEZWKykTnROWiCtF5UaWoSnRBdFFULaoR1YouiepE9aIGUaOoSdQsahFdFl0RXRW1iq6JrotuiG6K2kTtog5Rp6hLdEt0W9Qt6hH1ivpE/aIBUVA0KAqJhqhE6Lbx6MPzXsMPzzM/Du6Y+YdHn6L3y3P/7FP0vs1wGS7zf6/5b+NIJH9cTkP+aqsh91j75geTbjwaFJ4x//DG5B+/1bx9r8Fh+qMcQj6KfmbDR/gJg8glqokaoo3II9qJDqKW6CS6iFSijqgnGogCIo1IJ/KJbqKQaCQyiSKimCghsggX0Uc0Ec1EP1FGlBMtxADRSgSJCmKQGCKqiB6ilyglPEQlkQ0kQn1Wbo8lH5m/QPx+w7xhCuEmPMRxIpXwEmlEOpFBZBJZhIs4QZwkThHZRA7hI/xELnGayCMCxBkinyggComzRBFRTJQQpUQZcY4oJyqI80QlUUVcIC4S1UQNUUtcIuqIeqKBaCSaiGaihbhMXCGuEq3ENeI6cYO4SbQR7UQH0Ul0EbeI20Q30UP0En1EPzFABIlBIkQMAYlQfxLWs/a/Zva6AePo7Ufv59uPjk4lb5TzxBvtuTJooP2Fbsih7YYc6G7IEc6WIcoVVYtqRG2iPFG7qENUK+oUdYlSRXWielGDqECUJkoX5Yu6RYWiRlGmqEhULCoRZYlcolJRn6hJ1CzqF5WJykUtogFRqygoqhANioZEVVQiNMhgBudYz+bYFObYFObYFOaQUBu5RDVRQ7QReUQ70UHUEp1EF5FK1BH1RANRQKQR6UQ+0U0UEo1EJlFEFBMlRBbhIvqIJqKZ6CfKiHKihRggWokgUUEMEkNEFdFD9BKlhIeoJLKBRChkOB/c/f3W+WPIpDv5OG2ZeoOEepmhXmaolxnqZYZ6maFeZqiXGeplhnqZoV5mqJcZ6mWGepmhXmaolxnqZYZ6maFeZqiXGeplhnqZoV5mqJcZ6mWGepmhXmaolxnqZYZ6maFeZqiXGeplhnqZoV5mqJcZ6mWGepmhXmaolxnqZYZ6maFeZqiXGeplhnqZoV5mqJcZ6mWGepmhXmaolxnqZYZ62Qr1GyW328ztNnO7zdxuM7fbzO02c7vN3G4zt9vM7TZzu83cbjO328ztNnO7zdxuM7fbzO02c7vN3G4zt9vM7TZzu83cbjO328ztNnO7zdxuM7fbzO02c7vN3G4zt9vM7TZzu83cbjO328ztNnO7zdxuM7fbzO02c7vN3G4zt9vM7TZzu83cbjO328ztNnO7zdxuM7fbVm7/nVl9zU9M+Waz+n6RleIfStbmfzTn4wvmtdGUl9MbKpSLzoX2HPImg88WXZarxpflmvVleR7DVoRKhN5s8OmhVOsmKSK36JjIIzouShV5RWmidFGGKFOUJXKJTohOik6JskU5Ip/IL8oVnRbliQKiM6J8UYGoUHRWVCQqFpWISkVlonOiclGF6LyoUlQluiC6KKoW1YhqRZdEdaJ6UYOoUdQkaha1iC6LroiuilpF10TXRTdEN0VtonZRh6hT1CW6Jbot6hb1iHpFfaJ+0YAoKBoUhURDVCL0FoPv1foyCcqX2Te5Y93k6LLJL2Gj2rhI5BA+wk8YRC5RTdQQbUQe0U50ELVEJ9FFpBJ1RD3RQBQQaUQ6kU90E4VEI5FJFBHFRAmRRbiIPqKJaCb6iTKinGghBohWIkhUEIPEEFFFuAkPkU30EL1EKVFJXCBuEVeIa0QKcYw4TniJDOIEcZI4TQSIM8RZ4hxxnrhEXCauEjeIm8RtIgQkQm817KfIgj9sTkVvM+wXRQafNfXvrSoRSvJjc/bTx1f52v4DPogH/AEf8BE94E/7gA/vAffpAR/rA27AA27AA/4UDrizDrhlDrhlDvjDOuAP64CV74BJPGDlO2DlO2DlO2CxO+CP/oAl7YA5OGAODlhQDliEDlhQDhiXA9aQA9aQA9aQA26ZA5aAA+btgPXggHv7gEk84J474N4+4AY8YPs4YPU/YPU/YCU/YMgPWK8PWK8PWK8PWGEPWAYPWNIOuGUOWA8OuH8OWOwOWCksXCduEDeJNqKd6CA6iS7iFnGb6CZ6iF6ij+gnBoggMUgMAYnQ241HLzR59FsaH67Xl3zOLyt5Mrn+2NyDeHnJO5xuGVqwLu9+scELY4+xED7GbvIYu8lj7CYWDCKXqCZqiDYij2gnOohaopPoIlKJOqKeaCAKiDQincgnuolCopHIJIqIYqKEyCJcRB/RRDQT/UQZUU60EANEKxEkKohBYoioInqIXqKU8BCVRDaQSJbEB/4O+GxWnIf7jbKJZIXivh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh3hvh2x9u2IYV+NdgWfSv7dB5Pr8tzLp5kd5niHOd5hjneY4x3meIc53mGOd5jjHeZ4hzneYY53mOMd5niHOd5hjneY4x3meIc53mGOd5jjHeZ4hzneYY53mOMd5niHOd5hjneY4x3meIc53mGOd5jjHeZ4hzneYY53mOMd5niHOd5hjneY4x3meIc53mGOd5jjHeZ4hzneYY53mOMd5niHOd5hjneY4x0rx19iPLSnDPP1U2mf9rhxdMp4qQG9hseNoxd3vf6OHQ/qtGHO/L8091qeOh7Yr4T/YmvPhA3nle0N1ruXR1/ZCGf+Rqy/n3u9fNRJIvkjfcg/4cVM//mUV+3+P2amwfygpmetg2hUBtpxDgLjHATGOQiMcxAY5yAwzkFgnIPAOAeBcQ4C4xwExjkIjHMQGOcgMM5BYJyDwDgHgXEOAuMcBMY5CIxzEBjnIDDOQWCcg8A4B4FxDgLjHATGOQiMcxAY5yAwzkFgnIPAOAeBcQ4C4xwExjkIjHMQGOcgMM5BYJyDwDgHgXEOAuMcBMY5CIxzEBjnIDDOQWCcg8A4B4FxDgLjHATGOQiMcxAYt4ralzpFLXjGTPGYcfRRzfNHG8b6tGfz859/7Og1zd9hft/jkvd95n2fed9n3veZ933mfZ9532fe95n3feZ9n3nfZ973mfd95n2fed9n3veZ933mfZ9532fe95n3feZ9n3nfZ973mfd95n2fed9n3veZ933mfZ9532fe95n3feZ9n3nfZ973mfd95n2fed9n3veZ933mfZ9532fe95n3feZ9n3nfZ973mfd95n2fed9n3veZ930r7zErt0efnYXP1Ap5UpDHPzS/M4VwE8cID3GcSCW8RBqRTmQQmUQW4SJOECeJU0Q2kUP4CD+RS5wm8ogAcYbIJwqIQuIsUUQUEyVEKVFGnCPKiQriPFFJVBEXiItENVFD1BKXiDqinmggmohmooW4TFwhrhKtxDXiOnGDuEm0Ee1EB9FJdBG3iG6ih+gl+oh+YoAIEoNEiBgCEslDDxvYu/mjfTf3x7u5P97N/WHBIHKJaqKGaCPyiHaig6glOokuIpWoI+qJBqKASCPSiXyimygkGolMoogoJkqILMJF9BFNRDPRT5QR5UQLMUC0EkGighgkhogqoofoJUoJD1FJZAOJUNz4tB/5/SZ5NeKb5NWdb5JXd9oyRLmialGNqE2UJ2oXdYhqRZ2iLlGqqE5UL2oQFYjSROmifFG3qFDUKMoUFYmKRSWiLJFL1CdqEjWL+kVlonJRi2hA1CoKiipEg6IhUZWoR9Qr8ogqRdlUIvSEVOQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJVuQJK7dPGrwS9s+ufL05+YW/N+b++SWwo0tf/++lrqMrXP/Sha0HehnrKes//nSSH5kzh0FX8PvmzLdNuEIZ1ustnjYe8st8r+TqnnkNduwVPTzPGEefy34O5ehHzBBcIHKAROjd1ncNO1/7JCvZJ3nrT/KfY+EakAjdfWUPvnn3ch76H8Jn/+DfS95984P3g5Xmtalxw34vUWjFuuCakG4xxcd4io/xFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFFLvFlLWnv8w4egXB+NzL12f2mN895neP+d1jfveY3z3md4/53WN+95jfPeZ3j/ndY373mN895neP+d1jfveY3z3md4/53WN+95jfPeZ3j/ndY373mN895neP+d1jfveY3z3md4/53WN+95jfPeZ3j/ndY373mN895neP+d1jfveY3z3md4/53WN+95jfPeZ3j/ndY373mN895neP+d1jfves/H65wfdjNsnbtJrkTWJN8sZBWxEqEZownCfRnrZq+qTU9GnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWnuiWkrxu8xjp42e84caD6U/MPvWtPzfzCc3/0UumJY3+UK/kpy/eHkFy5ZN/gK49NNeK94rE6OhKEp8xte6Vni1Rncpgy8zTr4W+YDlkK4iWOEhzhOpBJeIo1IJzKITCKLcBEniJPEKSKbyCF8hJ/IJU4TeUSAOEPkEwVEIXGWKCKKiRKilCgjzhHlRAVxnqgkqogLxEWimqghaolLRB1RTzQQjUQT0Uy0EJeJK8RVopW4RlwnbhA3iTaineggOoku4hZxm+gmeoheoo/oJwaIIDFIhIghIBGaNuRq9dF1yn65Wt1vDwP/0XB+++Vdcxb4SlPmyw3+0NSMwV8xd1c+yuCuvNv6rv0P+yqWoNAxAzXIkVt0TOQRHReliryiNFG6KEOUKcoSuUQnRCdFp0TZohyRT+QX5YpOi/JEAdEZUb6oQFQoOisqEhWLSkSlojLROVG5qEJ0XlQpqhJdEF0UVYtqRLWiS6I6Ub2oQdQoahI1i1pEl0VXRFdFraJrouuiG6KbojZRu6hD1CnqEt0S3RZ1i3pEvaI+Ub9oQBQUDYpCoiEqEZo1eEYZYxsbw7az4SP8hEHkEtVEDdFG5BHtRAdRS3QSXUQqUUfUEw1EAZFGpBP5RDdRSDQSmUQRUUyUEFmEi+gjmohmop8oI8qJFmKAaCWCRAUxSAwRVUQP0UuUEh6iksgGEqH3JmGO/6G/so7aX33Ej1qcM5yrUiFvypx9mfXLrQPKfzKco03w65JfH0muYfPLX2N9+bHkzf7U7OsP5RsJ/v+8Xfm9yb+ZmMP7CMx3I7z9c3lDgfnJ9RUpc4/eWfB6eB/z5/yOgqNW8Qlu0E9YG/R9hvNK3Ki5Ib/2dbrB/g1srGQNCR1PebTDXvsdlkjeLU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcU5rcTaDuJXb+0fzWDBr7uXrSt9l/d3XG0cfM1+dgrJ2dOYdktPqkH1q+QbZB8/zB/U8fzbP88fxPPfB80z780z78wze83zMnmfWnmcKn+c+eJ4P7fP8ST/PrD1v3ZNvND6vL0h5VS+gm9fFXObP8F/6heJmQ8pPMe/2Nxm8pP7X5uOSQriJY4SHOE6kEl4ijUgnMohMIotwESeIk8QpIpvIIXyEn8glThN5RIA4Q+QTBUQhcZYoIoqJEqKUKCPOEeVEBXGeqCSqiAvERaKaqCFqiUtEHVFPNBCNRBPRTLQQl4krxFWilbhGXCduEDeJNqKd6CA6iS7iFnGb6CZ6iF6ij+gnBoggMUiEiCEgkZzvnLchD1kn928x7KcY7XL/Dqv4G6JqUY3II6oVpYrqRPWiBlGaKF3UKMoUZYlcoiZRs6hF1Co6JcoW5Yh8Ir8oV9QmyhO1izpEnaIuUb6oQNQtKhT1iIpExaISUa+oVNQn6heVicpFA6KgqEI0KBoSVYqqRBeoROhbDfvVI8F2cyM8azzwj1T6GE9kD/urJb/Nuv+B5O2+0bzdjyS/no+a+Sn220+xVXyK/fZT7LefYr/9FCqLjVyimqgh2og8op3oIGqJTqKLSCXqiHqigSgg0oh0Ip/oJgqJRiKTKCKKiRIii3ARfUQT0Uz0E2VEOdFCDBCtRJCoIAaJIaKKcBPZhIfoIXqJUqKSuEDcIq4Q14gU4hhxnPASGcQJ4iRxmjhDnCXOEeeJS8Rl4ipxg7hJ3CZCQCI0b9i/mSz0F9aU8O0Gnw5/wsBD48gtOibyiI6LUkVeUZooXZQhyhRliVyiE6KTolOibFGOyCfyi3JFp0V5ooDojChfVCAqFJ0VFYmKRSWiUlGZ6JyoXFQhOi+qFFWJLoguiqpFNaJa0SVRnahe1CBqFDWJmkUtosuiK6KrolbRNdF10Q3RTVGbqF3UIeoUdYluiW6LukU9ol5Rn6hfNCAKigZFIdEQlQh9h+G8TOf3zTKzIGXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGJWXGZZeZ9xuf9nWEb5CMvMG+7X82eK37S3ELGzmEj/ATBpFLVBM1RBuRR7QTHUQt0Ul0EalEHVFPNBAFRBqRTuQT3UQh0UhkEkVEMVFCZBEuoo9oIpqJfqKMKCdaiAGilQgSFcQgMURUET1EL1FKeIhKIhtIhP6LYf8OIVfoz5wLFS+/naDSehJg0brFG5P+maOnD/JSnJs+wyc/f9D6By5ZNz/auROyVybsvbIse2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2WUe2XUyu13JmG9a/2t5tj5XZLiBaZ4gSleYIoXmOIFpniBKV5giheY4gWmeIEpXmCKF5jiBaZ4gSleYIoXmOIFpniBKV5giheY4gWmeIEpXmCKF5jiBaZ4gSleYIoXmOIFpniBKV5giheY4gWmeIEpXmCKF5jiBaZ4gSleYIoXmOIFpniBKV5giheY4gWmeIEpXmCKF5jiBaZ4gSleYIoXmOIFK8X/1XBe8lVjpvi7JcWrTPEqU7zKFK8yxatM8SpTvMoUrzLFq0zxKlO8yhSvMsWrTPEqU7zKFK8yxatM8SpTvMoUrzLFq0zxKlO8yhSvMsWrTPEqU7zKFK8yxatM8SpTvMoUrzLFq0zxKlO8yhSvMsWrTPEqU7zKFK8yxatM8SpTvMoUrzLFq0zxKlO8yhSvMsWrTPEqU7zKFK8yxatWir/Hyq35fMlbjLlnXy+fFfLZP/HyvQafge2RQ2yPXBTosYeuD8hGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn+dGn7dy+33Gq/LSq4fhPctmkQn9vPWOh+83nCuas2ZTXjHlTv7lWet5lB8wHr0s+1V+Wbb58uli87/g0RsfXrcvy/5B4+gDE1zmX35d8o8N5td/6KVRovzf5CjxwaPa8ydmsfmQ9WgcXeu8JtdvrslgcU2el7gmzz1ck+cebBmiXFG1qEbUJsoTtYs6RLWiTlGXKFVUJ6oXNYgKRGmidFG+qFtUKGoUZYqKRMWiElGWyCXqEzWJmkX9ojJRi2hA1CoKiipEg6IhUZXII8oW9Yh6RZWiUioR+uFXZ7h4bXe8WclOSjP6F7f+jxjOyzrTrUHjw4bzYQgxUx8x+KFLjfLcTaM8c9QozybailCJ0I8aR1eRf/HoOvMz1uTzUesvzPd4flvy6x9Orj/jPOLmez/ND+JbNG+2at3M7E75zsQQ/Ghy/UhyTcxhuDhq7D+aXH8ILeBHrf+Ktdfjz/tf/DGbH83YxR/3xwyeAWd5BpzlGXCWZ8BZngFneQac5RlwlmfAWZ4BZ3kGnOUZcJZnwFmeAWd5BpzlGXCWZ8BZngFneQac5RlwlmfAWZ4BZ3kGnOUZcJZnwFmeAWd5BpzlGXCWZ8BZngFneQac5RlwlmfAWZ4BZ3kGnOUZcJZnwFmeAWd5BpzlGXCWZ8BZngFneQac5RlwlmfAWZ4BZ3kGnOUZcJZnwFmeAWd5BpzlGXCWZ8BZngFnrW37YwY/iGVcppBxufQxblebdQn6DIM+w6DPMOgzDPoMgz7DoM8w6DMM+gyDPsOgzzDoMwz6DIM+w6DPMOgzDPoMgz7DoM8w6DMM+gyDPsOgzzDoMwz6DIM+w6DPMOgzDPoMgz7DoM8w6DMM+gyDPsOgzzDoMwz6DIM+w6DPMOgzDPoMgz7DoM8w6DMM+gyDPsOgzzDoMwz6DIM+w6DPMOgzDPqMlduPS25XmNsV5naFuV1hbleY2xXmdoW5XWFuV5jbFeZ2hbldYW5XmNsV5naFuV1hbleY2xXmdoW5XWFuV5jbFeZ2hbldYW5XmNsV5naFuV1hbleY2xXmdoW5XWFuV5jbFeZ2hbldYW5XmNsV5naFuV1hbleY2xXmdoW5XWFuV5jbFeZ2hbldYW5XmNsV5naFuV1hbles3P64cfRKmbeZg8iN5EP0ovn1/2b8W5q3zNnzt+Zevh5izl+/aD4MP2HYJ+zQX1pj9idMfjTJM9bvdNw4evCCfzxn/9azLzr6L7J+D9o3JP/gPRqa548e3x3zH7wpj+9nfDxfyw9/N3+Wd+YwjP7k6zob5s/+zz/Nw/DS3d96acv80dHd3Da/vi0tYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYIMtYMNqAT9l8FXYmdZUniJyi46JPKLjolSRV5QmShdliDJFWSKX6ITopOiUKFuUI/KJ/KJc0WlRniggOiPKFxWICkVnRUWiYlGJqFRUJjonKhdViM6LKkVVoguii6JqUY2oVnRJVCeqFzWIGkVNomZRi+iy6IroqqhVdE10XXRDdFPUJmoXdYg6RV2iW6Lbom5Rj6hX1CfqFw2IgqJBUUg0RCVC/92wL0qG6qxpacdwnq0Jnp37N/hkza51968nb5eWYtUOV+hvreuoP2088HcirxtfQA/Mzxh8QUyf1JM+qc99dq5+1jgau798zv7wwdPW651/zszbzST3rGH956WvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvhaWvheVxC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0tfC0sOw9LXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwtLXwnb9+QUpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAEpLAG7sOwZztXGk9bA/IsGB6NuyU237MNu+/v3jVflwpw5UY6b3/iwT5KffLD33zyqvHfuC2eQ/iXj6FO5f9NA7M9IVM7YUfllw373oPXF4HcjWhYSoU8ZvJr5zahSNnIIH+EnDCKXqCZqiDYij2gnOohaopPoIlKJOqKeaCAKiDQincgnuolCopHIJIqIYqKEyCJcRB/RRDQT/UQZUU60EANEKxEkKohBYoioInqIXqKU8BCVRDaQCP0Ki2bwZ3mDn7Vu8KsS7EkGe5LBnmSwJxnsSQZ7ksGeZLAnGexJBnuSwZ5ksCcZ7EkGe5LBnmSwJxnsSQZ7ksGeZLAnGexJBnuSwZ5ksCcZ7EkGe5LBnmSwJxnsSQZ7ksGeZLAnGexJBnuSwZ5ksCcZ7EkGe5LBnmSwJxnsSQZ7ksGeZLAnGexJBnuSwZ5ksCcZ7EkGe5LBnmSwJ5nbSSu3v2bYv9429Gbr6savm7yR5FdZ/A3D+XW332rxNx9sJzSvtfzEnEwEwfNzD39H/C2DH4P7d+aDmkK4iWOEhzhOpBJeIo1IJzKITCKLcBEniJPEKSKbyCF8hJ/IJU4TeUSAOEPkEwVEIXGWKCKKiRKilCgjzhHlRAVxnqgkqogLxEWimqghaolLRB1RTzQQjUQT0Uy0EJeJK8RVopW4RlwnbhA3iTaineggOoku4hZxm+gmeoheoo/oJwaIIDFIhIghIBH6beNoNm5Mefm/NXTFnob/h9SJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ9aJQ6sS/A4rQSgq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNyoSAq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrX6KJybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTcq13ajcm03Ktd2o3JtNyrXdqNybTdqjxi/a9jnteC3m+ez54yjX9jyVPKmH0yuhSi638Ta/E3Wt/9Pw3mr50+Z3/48q1Tw71GkbLiJY4SHOE6kEl4ijUgnMohMIotwESeIk8QpIpvIIXyEn8glThN5RIA4Q+QTBUQhcZYoIoqJEqKUKCPOEeVEBXGeqCSqiAvERaKaqCFqiUtEHVFPNBCNRBPRTLQQl4krxFWilbhGXCduEDeJNqKd6CA6iS7iFnGb6CZ6iF6ij+gnBoggMUiEiCEgEfo9VoKQT+YVn8wrPplXfDKv+GRe8cm84pN5xSfzik/mFZ/MKz6ZV3wyr/hkXvHJvOKTecUn84pP5hWfzCs+mVd8Mq/4ZF7xybzik3nFJ/OKT+YVn8wrPplXfDKv+GRe8cm84pN5xSfzik/mFZ/MKz6ZV3wyr/hkXvHJvOKTecUn84pP5hWfzCs+mVd8Mq/4ZF7xybzik3nFJ/OKT+YVn8wrPplXfDKv+GRe8cm84pN5xSfzik/mFZ/MKz6ZV3wyr/hkXvHJvOKTecUn84pP5hWfzCs+mVd8Mq/4ZF7xybzik3nFJ/OKT+YVn8wrPplXfDKv+GRe8cm84rPnlRcMPk1yl93kLradDR/hJwwil6gmaog2Io9oJzqIWqKT6CJSiTqinmggCog0Ip3IJ7qJQqKRyCSKiGKihMgiXEQf0UQ0E/1EGVFOtBADRCsRJCqIQWKIqCJ6iF6ilPAQlUQ2kAj9vpXb1eQj47ZKmyv0kwZ2fYmd7j9gukM3pXXclLZyUxqJLUOUK6oW1YjaRHmidlGHqFbUKeoSpYrqRPWiBlGBKE2ULsoXdYsKRY2iTFGRqFhUIsoSuUSloj5Rk6hZ1C8qE5WLWkQDolZRUFQhGhQNiaqoROgPDed5vN+ynsf7I8P5yM9nTP2xwWHPK8OeV4Y9rwx7Xhn2vDLseSU3Xhn2vJIGr6TBK8OeV37GXvnJeeUn55VhzyvDnleGPa8Me17ZlV7ZsV7Zo17ZlV4Z9ryy87wy7Hll2PNK2r2yS7ySdq8Me17Jt1fy7ZV8eyXDXsmiV4Y9ryTTKwnzyrDnlWHPKwnzyrDnlWHPK7XLK7XLKzXIK8OeV+qMV+qMV+qMV2qCV/aoV/aoV3aeV4Y9rwx7Xhn2vLIrvTLseWXY88qw55VhzyuV2iu12Su12SvV2CvV2CvDnleGPa9UTq8Me14Z9rxS17xSu7xSkbxSg7xSdbwy7HmlBnntqvMnhvPOiZ+wqs7/Mh59bOEX6G+Tf/Rphf/80wrfm1yL5z4Pn1p4NMp+AqXV+QjDP7W21OtzJ93+13aSuVPOG5/Flnq0kx7+nfR5+9zPn0BTtNFLVBIeIhtIhP7MsH/vQ+jQ6mt/LvNzTObnmMzPMZmfYzI/x2R+jsn8HJP5OSbzc0zm55jMzzGZn2MyP8dkfo7J/ByT+Tkm83NM5ueYzM8xmZ9jMj/HZH6Oyfwck/k5JvNzTObnmMzPMZmfYzI/x2R+jsn8HJP5OSbzc0zm55jMzzGZn2MyP8dkfo7J/ByT+Tkm83NM5ueYzM8xmZ9jMj/HZH6Oyfwck/k5JvNzTObnmMzPMZmfYzI/x2R+jsn8HJP5OSbzc0zm55jMzzGZn2MyP8dkfo7J/ByT+Tkm83NM5ueYzM8xmZ9jMj/HZH6Oyfwck/k5JvNzTObnmMzPMZmfYzI/x2R+jsn8HLPn5xelsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMSlsMTtwvIXxit6Hb/5uvxvmXv9fGbGgdRVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv9RVv11X/9J4dIXzC+QKp/kLXi6mzD26QPNQXaCxr2r+lcFfAXD00f/mrwJ435z9ZsWvNMzb/bXhPKv5U9Z1mP9tOB8M9gaL/8fgS00SKNM2cggf4ScMIpeoJmqINiKPaCc6iFqik+giUok6op5oIAqINCKdyCe6iUKikcgkiohiooTIIlxEH9FENBP9RBlRTrQQA0QrESQqiEFiiKgieoheopTwEJVENpAI/Y3kdom5XWJul5jbJeZ2ibldYm6XmNsl5naJuV1ibpeY2yXmdom5XWJul5jbJeZ2ibldYm6XmNsl5naJuV1ibpeY2yXmdom5XWJul5jbJeZ2ibldYm6XmNsl5naJuV1ibpeY2yXmdom5XWJul5jbJeZ2ibldYm6XmNsl5naJuV1ibpeY2yXmdom5XWJul5jbJeZ2ycrt/zXsX8rgCqWnzNkfOPMOq0wfGg/8kwhz2HUf9uPm3z7w+x98w0Nz9835rP+zehj+znB+t9CI1Z7/3uAhfEwO4WNyCB+TQ/iYHMLH5BA+JofwMTmEj8khfEwO4WNyCB+TQ/iYHMLH5BA+JofwMTmEj8khfEwO4WNyCB+TQ/iYHMLH5BA+JofwMTmEj8khfEwO4WNyCB+TQ/iYHMLH5BA+JofwMTmEj8khfIyH8G/7k7e7rP85Xy6TG50TlYsqROdFlaIq0QXRRVG1qEZUK7okqhPVixpEjaImUbOoRXRZdEV0VdQquia6LrohuilqE7WLOkSdoi7RLdFtUbeoR9Qr6hP1iwZEQdGgKCQaohKhfzCc40HA+tyzfzSO3qs/ZmD3FcjDVmB/6z892JL9mUq1WdL/5vNWsj9zqXalfF7v/mf9u3aTD0fwhQd9Zw3rzpr/zsm5l1+EnSENKUMaUoY0pAxpSBnSkDKkIWVIQ8qQhpQhDSlDGlKGNKQMaUgZ0pAypCFlSEPKkIaUIQ0pQxpShjSkDGlIGdKQMqQhZUhDypCGlCENKUMaUoa0oAxpQRnSgjKkBWVIC8pgC3JUJjonKhdViM6LKkVVoguii6JqUY2oVnRJVCeqFzWIGkVNomZRi+iy6IroqqhVdE10XXRDdFPUJmoXdYg6RV2iW6Lbom5Rj6hX1CfqFw2IgqJBUUg0RCVCKSnOJ272WKOu26owH0i6NsWpPO+xK1Ko03AK6jmnoIbeZNiVM9Rq/uH7kl877VQ8n2GXr9BHrGPVsRQO0DlSr3KkXuVIvcqRepUj9SpH6lWO1KscqVc5Uq9ypF7lSL3KkXqVI/UqR+pVjtSrHKlXOVKvcqRe5Ui9ypF6lSP1KkfqVY7UqxypVzlSr3KkXtkqEBWKzoqKRMWiElGpqEx0TlQuqhCdF1WKqkQXRBdF1aIaUa3okqhOVC9qEDWKmkTNohbRZdEV0VVRq+ia6LrohuimqE3ULuoQdYq6RLdEt0Xdoh5Rr6hP1C8aEAVFg6KQaIhKhDwy/X3Wv0TsHeaunvscfpnY5zDDHU+Zevkq6c/fM4tuqnUvzP/6fcOqha7kVG/e1mve1vxl7wXmzdI+v6Puqzvhmxdj3vwKHjjr4NFpPijp0kwMaSaGNBNDmokhzcSQZmJIMzGkmRjSTAxpJoY0E0OaiSHNxJBmYkgzMaSZGNJMDGkmhjQTQ5qJIc3EkGZiSDMxpJkY0kwMaSaGNBNDmokhzcSQZmJIMzGkmRjSTAxpJoY0E0OaiSHNxJBmYkgzMaSZGNJMDGkmhjQTQ5qJIc3EkGZiSDMxpJkY0kwMaSaGNBNDmokhzcSQZmJIMzGkmRjSTAxpJoY0E0OaiSHNxJBmYkgzMaSZGNJMDGkmhjQTQ5qJIc3EkGZiSDMxpJkY0kwMaSaGNBNDmokhzcSQZmJIMzHsZpJxNApnWhdhMlMevULiC+QVEg/yhRHmqy1KzC88eoXEA3mFRBbbdfAf0K1tuIljhIc4TqQSXiKNSCcyiEwii3ARJ4iTxCkim8ghfISfyCVOE3lEgDhD5BMFRCFxligiiokSopQoI84R5UQFcZ6oJKqIC8RFopqoIWqJS0QdUU80EI1EE9FMtBCXiSvEVaKVuEZcJ24QN4k2op3oIDqJLuIWcZvoJnqIXqKP6CcGiCAxSISIISAROmFVAvOXRM8cXUGaP6rw/fbzHK7glHnLk49a78PZes3m+OFXvwc/ar0PpPWe+rxtI/MN5vuPttMr3U6PdtFDuYs82EWypV6aZez9lZ3CX09Wbp0pDVG1qEaUInKLjok8olrRcVGqyCu6JKoT1YvSRA2idFGGqFGUKcoSuURNohOiZlGL6LLoiuiqqFV0TXRSdEp0XZQtyhH5RH7RDdFNUa7otKhNlCcKiNpFHaJOUZfojOiWKF9UILot6hYVis6KekRFomJRiahXVCrqE/WLykTnROWiAVFQVCEaFIVEQ6LzokpRlegClQjlPJp/HzXs16xhm0P+r3xhdm5p1tlAIuT7/D57Zv4s2+Tn9Bq/UM5vXt02n1osta5u5z7Yh8N8du5dn8XD8rA8GqflquTfYh6z4SaOER7iOJFKeIk0Ip3IIDKJLMJFnCBOEqeIbCKH8BF+Ipc4TeQRAeIMkU8UEIXEWaKIKCZKiFKijDhHlBMVxHmikqgiLhAXiWqihqglLhF1RD3RQDQSTUQz0UJcJq4QV4lW4hpxnbhB3CTaiHaig+gkuohbxG2im+gheok+op8YIILEIBEihoBEKM+qBObFyGfMivHG5B/qU8y/CFh/YVbMTxpOScy1/uLM6+l1GEcl0+xXfyKTzb9YO/PlBRjDcpgdlsPssBxmh+UwOyzH12E5vg7L8XVYDqXDcgwdlmPosBw8h+XgOSwHz2E5ag7LQXBYDoLDcvQblqPfsBz9huXoNyzHu2E53g3LgW5YDnTDcjAblqPYsBzFhuW4NSzHrWE5YA3LAWtYDljDcqQalmPTsBybhuXYNCxHo2E58AzLgWdYDjzDcuCxdVFULaoR1YouiepE9aIGUaOoSdQsahFdFl0RXRW1iq6JrotuiG6K2kTtog5Rp6hLdEt0W9Qt6hH1ivpE/aIBUVA0KAqJhqhEqEAKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS0QKS8QuLIUpR++n+0FzsjF/21zby//9wW+wbnT26OVfq4Z5QC5K+bSfV7yW/MOXmH84uvZ2dC3uAVyDMy9qBV+Ti3HBn5t7+Vrcx5LrX8698mtyjy7FPXru7KVT+rC1p4pTnN/5+FfmlipJcd5WX2HtsNLP/xW5736YrsiVHRWcKuuK3LlHF/0/Q4F5dNH/X6k05kswWv8tVpx/5XcOlMuBwi0HCrccKNxyoHDLgcItBwq3HCjccqBwy4HCLQcKtxwo3HKgcMuBwi0HCrccKNxyoHDLgcItBwq3HCjccqBwy4HCLQcKtxwo3HKgcMuBwi0HCrccKNxyoHDLgcItBwq3HCjccqBwy4HCLQcKtxwo3HKgcMuBwi0HCrccKNxyoHDLgcItBwq3HCjccqBwy4HCLQcKtxwo3HKgcMuBwi0HCrccKNxyoHDLgcItBwq3HCjccqBwy4HCLQcKtxwo3HKgcMuBwi0HCrccKNxyoHDLgcItBwq3HCjccqBwy4HCLQcKtxwo3HKgcMuBwi0HCrccKNxyoHDLgcItBwq3HCjc9oGiwiosZkOLG3Mv95mjnfhmycqbZe+9WfaeLUOUK6oW1YjaRHmidlGHqFbUKeoSpYrqRPWiBlGBKE2ULsoXdYsKRY2iTFGRqFhUIsoSuUR9oiZRs6hfVCYqF7WIBkStoqCoQjQoGhJViXpEvSKPqFKUTSVC51P40X4/jjzbyCF8hJ8wiFyimqgh2og8op3oIGqJTqKLSCXqiHqigSgg0oh0Ip/oJgqJRiKTKCKKiRIii3ARfUQT0Uz0E2VEOdFCDBCtRJCoIAaJIaKK6CF6iVLCQ1QS2UAiVGkeqszPXf1O64xZZcX4aE+cl7p83k76BecYFvwn8xsupjifzPo31vdXW99vHtI+ZGBrh+QfFLL/QTWf23nWfAmFZ+5hfX7wMx9na52LbPZjMikNfdJ+hC7xve//5Z75ANdJndlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindlindmyolwvr/3ulaNCrxy9eu3sN6Q4v2Eyw7ra02h9/2fx+TofSP7xg3Of1efsJO5n3hsP3x0fSf7/ePTes8l/w7u+1XC5QkUp73rWXHeMxP306FOP8QbmXwTPWrcL/mUi8Xj8/sk3hu/eiz011nP36afGk7d+NvH40+98tsq68++4Zy1fbC/vtJdhexmxly+xl7C9jNpLxF4es5eovXypvYzZy+P2ErOXd9lL3F6esJcn7eUpe3naXp6xl3fby117uWcv4/aSsJcvs5cvt5cJe5m0l/fYy3+wl6+wlyl7mbaX/2gvX2kvM/byVfYyay/vtZevtpc5e/lP9vI19vI+e/lae/k6e7lvL19vL99gL99oL99kL99sL99iL99qL8/ay7fZy7y9fLu9fIe9LNjL++3lP99zaq+1LNrLkr0s28t32st32ct/tZfvtpfvsZfvtZcP2Mv32cv328uKvfyAvfygvfyQvXzQXj5kLz9sLz9iLx+2l4/Yy4/ay0ftZdVe1uzlY/byY/aybi8ft5cft5f/Zi8/YS+fsJcNe9m0l5+85+xma9m2l5+yl/9uLzv2smsvP20vP2MvP2svP2cvP28vv2Ave/byi/ayby+ftJdfspdftpdP2cuv2Muv2suv2cuv28tv2Mtv2stv2ctv28v/sJffsZfftZfn7OV/2svz9vJ79vKCvfy+vfyBvfyhvfyRvfyxvfyJvfwve/lTe/kze/lze3nRXv7CXg7s5S/t5a/s5a/t5X/by/+xl7+xl/9rL4f28rf28nf28vf28g/28o/28k/WEnIZ9mo4a4qzup31mLN6nPW4s6Y6q9dZ05w13VkznDXTWbOc9YSznnTWU86a7aw5zupzVr+z5jrraWfNc9aAs55x1nxnLXDWQmc966xFzlrsrCXOWuqsZc56zlnLnbXCWc87a6WzVjnrBWe96KzVzlrjrLXOeslZ65y13lkbnLXRWZuctdlZW5z1srNecdarztrqrNec9bqz3nDWm87a5qztztrhrJ3O2uWst5z1trN2O2uPs/Y6a5+z9jvrgLMGnXXQWUPOOuSsb3DWNzrrv3PWL3LWNznrm531Lc56x1nf6qxvc9Z/76xvd9Z3OOsXO+s7nXXYWUec9UucNeyso84acdbHnDXqrF/qrGPO+rizxpz1Xc4ad9YnnPVJZ33KWZ921mec9d3OetdZ7znruLMmnPXLnPXLnXXCWSed9T3Gvej91KefGY89/ZQ1ktz3PBYdTYw9+777x++N341FxpN/OhmPRp8ZCT/xxMj40/Fo8nbvu58+fjcaHYk8Eb5379mh+55IOPJ4NPnlLOsPI2N3w08+Gb6b/ELqM0/fG38iOvHs0OPGu+aTY859T1LRu88+/q77GeN3w0/d+9Kn7z6Z9NC7vjn5t+90hiZrMIre9z5zN/b03dj45LP3jz+VvF34iWfvp4WfHI2NJawvHgsnxp9+9r7nbnQs+a94333fM3effiY8lhyvRpL/3ph9p5L//da/ciSSvAej4UjcvJ/3c54MT44mb/ZEOBJ9/OknHovevffs19w/EX0sNj4yHr37ZOyp8BPJu/b4WND1+OPvu5/59N3kTaLJ4S06bt4wM/bkM08nh71nwuOP33v2nc/ez7j3dOJuJGp9IfmIeJP/5MRYzHpMzbHu2GD4bvzZxKX/DwVUfpM='
+)
+DATA = pickle.loads(zlib.decompress(base64.b64decode(DATA)))
+MEMO = (
+b'eJztnQl8HNV9x61jV1qdvrhPCxwkG/ngMji2xVpe24q1K7GSfGCZYawdeXe82l32sDAsTRqSYpNNSdqlaUooJbTN0dK0TdIkkKNpS0lz0FAIV0tpoJRcbUgbSmiapm/mvdGbd+3OvJkVTj/lw8f2zOz/ve//9/7zf2/evJl5R+DuLz63xPzvtmr/HuOPSmtGndOqlWBsKro9Eq9W2nJqsajlM1XjYOCYmi6Bo+/tH9oM/z+4YfCaQwNrwb+0cmQA7pteW54eHBgYwofLxI+n1xGbA0Nlc4+1CQ/WKm5gaKBs26pWArNp9Uiheqhaacmr89VYJajMpxLFJNjTv6fpztAS9F+TVmlXlOLxnKYo1UpoHLoWj1RLlfZcPpXNp4rHq3uWJLsrnZNafi6VUdM7tNlqaU8T8D7ZXOmJTAyHxyM7lInJ+EhsVzXZauwPVlb2rVsD+Lasmp4e6J8G/w2sGeqrJtsPVZMdsWSnQdFsp0h2J3tKyV6jpuTS0p5mWHpo34QyEhsdiUUWCu5GElxYDg0MrCVLbKpRYgsssTUWji4Utv9g05Il/UOrQHmp2XIxqWXKWhr8S0sXtLKWSZTnk6m0Vp7N5supTDmRLSe02VRGK+e1YimfKR/WjoDdaa0I/lUugL+K2XIhmZ0vq8AU2GSyxXKqUC7mS6AM1SgzU0qnwXbqyBEtX06nMkfLuXx2RisUyuqM+VfheGamrB3Lpo8BgLlUEfyoUARY86lispxL5QAeqP9ISc0nyiVQoGoUfxwAFWZKBnKhlNfKRa1QLM+pxZkkcAAYz2bKhZw6nymr8yoosgCAZgDZXC5dPp7S0omydnMumy+Ws+AneW22PFcCHmXzeeAJ/Esx9hTzaqYwC7jzWlpTQd1AKa2YmtMGpg8PHFQHbwkPXq8cQv8AcagcWoNaZ/8hIPP6/9e5YTqvr9aP/1YY/8GJ8XgkvGPhdGpZt24daqZKoA9sgJO0u9KB8sBEMV+1lRGAZXSPxCYj8XH6lG+f7Tt4Q9+hNdZpXulYb+2xAFt4gC2w8CAsvEWJjS4U2dY/XVjTsXCagxKNHdOZgbVOXG6DJbYNj0WjkdgkLnVw8OANHQvhCUo1dkxnsJDc1NQMS21HiWRi99i+hSJbjXi0ygv2GVuGkMk1NpwQcnA0glFaQFRj+cEGY9UBrZq34xTYfFizbFr7DmuMSSc0CQyPjY7FFqyaNltGLX2bGZsuBDe2D1u0gEDFcGCDsepGVvHITmwFQhtbgQ3GqgeF4vaxeNymYRCeBJZtex/cZsx7UaXRKZuO4MzBlYINxmoptOqAlSp24w589llldPXhfUxRy2BR7ZPxcGxiJxgSLJwB1rm7EFl91h6mkOWoXSfHcLsWs7hdi1nGZAWK53hkNBKewPHQhjKFZRzqQzuYElYi8tGRnZHJEdwRVtqtJIPJrT1MIach8h028oSNPMGSn46aLBKzZR6Q+HGTgQ3G6gx0po1OXLcdh/FBHMYHGZMzkUmcMDmETQ4xJmehaBzdHg8PY0WabsVGtzJGZyOjOGV0Gza6jTE6Z+G8jEbD2OZSbHMpY3MuUm7CnjQK9qRR4CSN85DVjjFs1bQO17OOsTgfNeoIPpGbU7O4UVPsaXwB0npydwTnjFajd8eJ0NhiDC9EhpFRW22txogAGxpbjOGqBUNb9Lcaowi7ISfu+5Dy+3aPjGLLgDnssEzb+sxNxvYipOXOMXyit4ChCm4BsMFYXWzpGbPpmbHpycqyGsXUjshO+4A3CAdDOC3Cbcb8LdbZMh7GoE39uNH7GZNLrLOFMBnAJgOMSb8V+JHJqTj2LQiHahgSbjPmA6ghDoxERnEqCJjDI9wQ5iZju8YawUzGp4ZxXAfhOAtXDbcZ87XI2ZHoOB5gtBqjMxw8xhZjeClKu2C0s2uXLdu3oQEmTrtoB1PCoNU0I7E9uGpjXIqrNrYYw3XIcN/I5G5saAxSsaGxxRiuR8zj8bHhyMQEZkbjYMyMdjAlbEBqh4eJAoJwAI3VhtuM+UZrlHQgNmwbJYFht22UBLYYw8tQvZG9Y6N7bWcBHKzjeuE2Y365lSKiI5O2FAGG+LYUAbYYwyusbmBkYtKWz4LwwgDXC7cZ8ytRYG+P7LKd8gHz0gUHtrnJ2F6FbHdNheO2k8K8+sC25iZjuwn16OMj4xHiOrnduorBPbq1hynkapTipmxptaWEs2qgr8RJqtegFBfG0dGsFnCKU9mo2IwqmowfwBWBCytcEdhgrN66kHMmhqci9pxjXI3Zc46xzZhvsSIqNjEVt0eUeRVniyhzmzHfanVzkQlbRBnXfrZuDmwxhtusevePj8Vt+QpeBdrqNbcZ8yHUsooSjo3FlA1Y5PI2LHJ5G2N4LWm4ERsODWHDoSHGMIwa1NbRNeN+rrWP081tRw0atg/sVPvATuUM7IaRVcw2PGkBV/HYCmwwVjusLtUWbylbvKXYeIuQUlyGDbduxYZbtzKGO0nDy7HhKpvhKtZwF2l4BTbcZjPcxhruJg2vxIZbbIZbWMMRZBgdA33y7rDtgm8hTFr62Ch5m3UpALI7abYFm21hzPags2F8dAo3Q9NabLKWMRlF6S06ErPbDGKbQcYmanUfk/aRyRpssoYxiaFqJkbDE7izbFqPbdYzNmNWNxmJD9tnCJpWY6vVjNU4qim8L2zrZALmrA/O1+YmY3udlU3itkzWakxd2bJJnpPF4qjSnWH74DdgznfhSs1NxnYCVRqbGrUNfYxJMlypscUYTqJTbqdtFDtrG8XOsp3ZFBnHV2HDQVvaGmQDcq/VfuNh2xxEwJxRww6am4ztPivEwpPDuO0D5twctjU3Gdv9SJy92+2hVsYBUGZMDljDMuLKZ5648pnnXflcDw07pmI7IvGJ4TFbd9Sk4BoVxvAg+FElmAXjy5R538FwtlBUjW6ku9IZy2asyflqqRICHYqaKaSyGWOyH/64R1HMn5t/Gl1Ct35V85IlJd7RDQtHtUogm0+AEe6eJSC80ynQu8cqbdlcEZRdMG9/9B7VtJyiptNKMXsUdKDVk5U2s/rExurJZG+s0lvUwJhaLWpKIVvKz2iggG6wp3hcSWUSKTB0rA4YHsRLaW0MlVsCO1qNHdXSnmlQiX55s3k3xu4z5NM3gT8PQT30zeDf1gFV3wr+2tOkbwN/xfQhWIAeBn+f1LcbfwI2fdg8uAP8CRj0iGEI/t5p/L3nkPOKt7AVN8tXfIOTimEtLfK1KGQtIVALaCgtw3cRHE9m50F0zOHjyNMlQoYT9RhudMfQldBm0mpe42KIW7ouhuoOoz07n+EiiNu8LsJhl60xlz3Gl0EcEXUZZlwyJPLZHJehVZ4h4Y6h25qi5HIE5Dk0dxynJTQ45wAuHxTj+pDLE5TnmXXHs9LOM6fym6lNHueIO5xOtVBIHeGfNO3yFEl3FG2pWS5BSJ4g5Y6gw5xf5EJ0yEPoLtPXbDbPReiURzjqFqGUmVESxl0iEqFLHiHtMiTh9CRXiG55ijmXAWHOc3IheuQhMi4hYKrgtUevPETWJYQx8aocTmdnjtIQS+Uhci4HGGj6ltsgy+QxbnLZsxozwVyG5fIMeZdSoFlhLsYKeYyC255jRkixUp6i6HbwexzkKx7DafIMJZdKwOluLsXp8hTHXCphzJxzGc6QZ5h3qQScgOdSnClPcbPLhGXmKi7EWfIQx11CmLcEuBBny0Pc4jZVoLsKvB7kHHmMW10OKkoF/tlxrjxC2R1CbzF/XIH3ILgk58mT3OYyMIz7Efzu9Hx5iF9ym7LM+xpcKS6Qp3i725R1c47fo18oz/AOmoGZHUEMcPYtGa50zKbSRTC0yJaK1RPJ7ko7nq+DZbQanHjird7kSt0Jnl8mEfmTJyTlLn1Hi+E8KAr8bXGZ62XNIyeJI8ko9+diNyrdFkMqYyyRkvHqnQ33aoL385C5PtpcBm5V4laDJkoDo8SElAa3kxqw81H1/U8eaHBTdxpQyFUpJ9/lg5OKdyeTmtMyyGbuQasHvUjw7gZJkDzqgy43udQFTo5WluNVlZ60+RUqAbMToqQ48+5cvs2ldyjqe0wM0E5avpBM5aQ8u4PyjJ1mJT27XQ61wywXPrsig3mCxBTMxJKoJ901wl28n5urw3kHAuRoBxZxN/lLqrUw80w2JyfDSVKGOhPBDk7Ye3i+9VjFml1QgXLyfl45rjP2UhpdSo87ST1qT0Q7kOMj3N7YUAEykko86IsSvRS0lBDvIYUQtSAhgfhcqJyhKGQJ8E7tZZQAn+T5aj3xwSu3bqKQGntWJJzXnwB1cxD1b7Xgu6tEJ+sArf/kyRMnzCghAd/rIyBXdP0ZgTfPMfuJDlJK7l915Y3Imbp3ECkOoOwdrLJ3Ud0Xe6o6DHleu3sIyfc55YKVvyGSx8OKgveTCNy7YmRK/Jwfoxafryt/rdFefKlRTqOh+TJEPIvvvcjo8OuN1oE7EiAdq9H/O5elmZQllUloN8vLUj3FwmOxVIRps3IGEVwetbz71A6xxZK2lZQWiupR2t8gpWXWBpCyPuLU0695vmSphIwHnziD20qn8WCTAi6ZzXX5ji9zpJL8BzzLox9oxd23WBx9uhV1tNT+G2hz/UamQL7bbgaHxn8nTnIGiL95Cgpw2KEAjkeS/ch/ngAfPPUEELjreMCK3OW2929Rw0P2JCRuKixXlIVfKLl0qWA8IOB0XWTds+8eKu+bVVEnPqn/44uSoLznlQ8xnrEpjfTs6YYC173Rcy8JzFvBRfI+77QlGjy7JdU8v016yy4VI319yd1o47u/yNLcR0tDL2EjpfmhO2le4/28I6fm1TnePNdPT0GBfse7QPpjrfwZFp48XBH0JwWdyVN+Dx5YAe6nUgWn9cipj4D5C2qUt0JRsCGc5LvCxwT8YceQULfvtfr5TMUDZO2UAA4nhhzfofWu1u864YVCvcGErne5fs8XuZzPf6OZgG4YFODcVUtpucur36f6ed5qW3JytamJe+L6Pn31EedkIjDvDftR6izkLAMm1WlbJHU+RoFxlgaTYN0iMJ/u6nUjAnM+hbrxJbSqfdvP7pSMRh/3SSN9bYDf2/EU0tcF+IVsCLjp2PQrjGIknP4D0mlBs5Apqcv+I6rpTjceOLQVAXu6K2vfzvIe33/o3g19J62wvjsgf0eKZXrQDyaBVB5uKv2RGyyWyu3dJBbgEyQAP5pOvTHDH7vAhrIlmDzgvYf5EypJcR6vICNqRYMTeZdJMKcVk1k6j9dJ1zZ0GSX+lGoPLgf5NJ+i2H8EU9NVPs7vfNIFkudI+BRVGfcZFzIWzlqk0canSTTOcy8k1wWOuGBMLcq90D+jtOU+NEP6sNa5D/rqRWqHz/jmhv6Ar13jZ6nBOu9pIJJr4yJJ9jkqdNknhEiuTYvE9RClGO+pIZJs6yKRPUwpxj5JRHINLxLX5ynFeE8XkWQjLtLQqTiV+QXS4wB3WACP9SiK9ZwT6AM3+dgHftEJhOcE8iVqGMR5aIts2zFB277JTfbnlB+c575IP6YW6ez5cmPAagza6ffNcxfToaU+IYgzVzgiNXT8C7pf5D3oRrp30PUw+v/A1P9f+qaT3hP0egdgZZBf8unBht8B+CtSB/aJRFIDVRArjiIcXR21GXWo6bRUfD+yGLw1TmVXaz+tU9qANC7Z5Z6d+mtfXNavEIQpz019E/NjYnZGvyYoNyf36KI1n37ERVojF8SFYIAabw6T8fErpI/CJ2xJV+f86MUr3agi3pKrSjd8Waj79ViVDuyDlCR/46ck+l5ButxPp0v9elcJVL9BMqq/SronaATSuYLbXlduBQkNI+Pe1/xzT88L2q4YFGRPvSTZKF+nqPnBT1If93gSUtKTVco48Q1qrMp5Rp704O0eOrxGP7xmp5cR4zFSDO6z+qQa73Z9kq1UFFux8BryakH7EgAyDv2tXw7p94n6a3QSfVjyJPomSch5MQFx7U1eEXm/4n6cqp69+UFWz2lW7698/DsSgvSRfIWFcRWhzCRV4/XpTkWoW/8TVA7gVELeUuo2XourzGTVNEjU9CDAWKyzUACM72sE8W2vSQb8ScfgMIgfCQoW7uhf4YdvXYJvUX0AXxhSvbZsXmEv7I2nGQlr9FLaDaLcT1YlA/+UG3h0DSJU8BlJBZ8mIRhxSO3a1UyCJ94yRUGGSLaNAtkWypdhfcYZK5TqZaFU35GU6lnq2obRgtIqky3ytFquKJYlEusygVi4Bhnc5xziQrleE8r1E0m5/p6qn5GD7PkeEHTlrB0l0sJxGch/cAiJMtxMdi6n5lOFLJP/Pbzr93kqjXIqoc/CRCJlvJaaiiwwtsG2KLYuF+V+Wy0y0P/oGBo272ltovg6s00uvl6gsoFBoGRz/Oo/0USPn2r02yecAfyTG4BPiwB4geMQ4NtuAB4WAfDW4zgEeNENwJdFALz1OA4BXnID8KgIgPdyaIcA/+wG4BsiAN5boR0CvOwG4GMigCDqnU1r7aaqDMm/OCPpF6FQ3QB9odOG0r1ZbEaS8RW6T6QTKZloe+ZK6WIql07NqJx0a3TkyB4lW8GqeFs9MonuOw6hoYD7hYn2oGSi/S5ZfxDUL4ywJxqQZ7/nov5nG5Bmv0/WLwoK6kGKUkY1PiFFRMyZikIao7i5UhA3dFUyrfcDV/RQxaIwhuYlY+hfqTYEFMI2fKEBMfRvLup/uQEx9EMX9X+/AT31q2T9VHSSqflZwUicMiJDtSWjcW9o1yX7kQuyH4mm+9Rido4GQzfnOsxPHslfIfy7Ez4ehvcvcPwHWTVZPFFzMDYV3R6J15oaqwQzpbnD/Fdc1iX5sWOS2vPQxIlkfiQzlZELm9ccE1EfBq9xZlW6U5miljfeCCbN9Z9OufTXRQ/xoLuU7cYXt5R0ijv1XJfjdcccPxNxoHdchMzPd0mD/MQxSEuzACRgXekbE2SyHG844EDPgXJfIiK8TwLnzDkvxxA+CnQ/9yYKGoO3mw9Zynr5X9681J9v499/eKGNvtHKdwKO0vWXJIcJP20Q/rf5+wVOtHtz4r8b44QANuQN9mceYZnAcKl1hzf8//EbX4DZ6Q3z594wBVBdnqCiS5qcU3HfeSlOiTk15S4lPsh1sBtNSxhv6ZTMiNEmj17q57Xzc8oF7XTo8J2AX83RL2qXa6XmRvGv4u8XeNHrzYuWBnkhoF3qjbbVKy0TGy7VXuaNP+A7v4BzuTfOoEdOAdUKb1RtzqncrqFuV/NHHKygRn6stAbgxmtLZgQrauu60+7cHX3ailKJpc4IGn5+SFclxQ+5EZ84BqFcvorRh1Y6HS0Wgg9LyrdTh4t2yjHnJ89vveC9OeE3lPSbJZuzc7GaE+HCjy1VuuC7LuGzeVKt0eURXPZFlMiPs5Af8JWSHvzoduKHWFbiy02VtmNqXsnz31FRl6THRbLnnpY89fhBC7/wVAkcyWdL3Fel14XtdS5bZ1qdO5xQFd7SOPnvPEWXOifoML8hzgWQ/7xTdJkLAPMD6FwA+U87RZf70g+/OVcuF6AbOOhNC+DiRcurcv3CChf9wqOChM8d5H1VcGHwdYeDP/itKv2bkl3DysX26zFXQ/BV3rw7bZG9E3jR582L0xvlBRNjLlvnIm9+nbFofgn4L/bGf2aD+AW0q73RnkXRcmbMqWzOWTa5QlEWzNBtc/z+E8/Pi0bPdswIVe0N+fgSwug5dO1sN0QpZPyAs/LbMkMKbfJRoXMdM0KFzvdVofPoiCcE8PTKJZ+fP4+e7wJV9jlVfUPIx5eaRC+gkNkr4PonqLEcClmh6BM8VyNFeKFTQijPtb4G3yqqcu6Qn8y6oWZ+d8a9shF+PIr7NHkvv+ja3z60E8tI0NdYCVx5qk+Jgl/fG5J6Dip6EeUe74qG9O40gXcNf8jORibj6cW0p5yLR9LTcxzFG/yt6PVQQgFWKgoGgK+t33iNKz1s/DJ6rKa7NViemheNp1YJ5OiGhjm1CK71qLWiDs9ZoVakyzZEGY/f4pPH+rtC9GCX+zGFO+if6SdDdIHkWXyn5Fl8yZvali4fIm72pTH7/WrMDzlrzPuYpoP772dTcgt6NFWyMQcWpTEvcZHc/DmJ0bKq3gV3FPONQFKtv8av1v8Uc44KhNE/4yxOHmIK/LzopIfLu/QvSMbJ2l+YOHGZIII+BsqlfgXK444D5UlngfK0IKE8yyYUtLjsOclAGaQ0ELQ3cR0xyDhHLqpdiqyV+VQ6MSNonboTJOvck9Ve8mt98duik1/6G10vweZoEXAzxSi/6Da6QaJl6y2/7bK4jGW4UlQbJajqLcbttqjMRblSWJdJYNVbmtuFA03y7vflrqhqLdRdTljyrqprrr/tIgxlXLnCL1dqr7E9t0NuNvbKRVTal28/19ICLtWtLLMzGG+ekmu5qyRyXY275iHUgVtwh1OZhGyK20Sh1dKeeltIjWFN5Vzr8psQEH7HW/DqC6kZtKvd48PME+7wcyLvGhJD39KMSydalTNU8/y2m+jm+rX3s0fgnrGOmpfMUjxvpXg2O+ephECMFLU5LVP0MUq21AeCB6Z9jYqtjnXYTOvAaSk7m+dPXkS3eWDjkMh/+yI6RJHY34dJdhbcrF9j0ZaHiLnWKRRxRIypl6zzjIb0EF9hCvJ9rYKs08n7qqb3vLO9fv397BG4551sDHlQYpgi+YGIhB9D1NfGvIfPDqc8xJEa4XOXr3JFKDz7R34cyCX+8An3AzDe5dzpiVe/z1fxdjmFIY7UwLuX6YKF2B4S/m6/sTl4HnqBEQrvdiEeO2Zgv7/J/tJ7EL5NnlB/2NcI3OOYxF6vUBMPQTVan4QF8fy5rGjUsQC3Mx80q904QpF47/JxSBtrGC0x0S3FNuaBzZFuQXm2cZ/YiOkNKZLrKJIXXSQnzgVNI7JTXB5Rf9XX7DThmOTVBmenyfokLIj37DTlWIAXHZzvjkTykJ32NozWe3ba54HNkW4estN+n9i8Z6cDFMn9QQGJy9F8Y66sr/dEq1/S6f919EGnSMSRGpCrO/kjeiG8hyQ37Te8ENJDSjxEQT4qhHyP24Vegtcbew/UG7wy65FOP/tVxTHPo8z3LESEw4JA5ZB7CNEbG0DOIfQQnypF+LSQ8P2C+GReGu09AA87hnqakU2Aqau+huQMRfiKkPADorcwM2+P9q5bwjHVK4xuAk4966tuGkX4upDwXrm3V0tRzTqmep3RTcCp3+arbkcowjPaBITsW2KtcKPfcepdtqRTKOII3HNnJ72n4qtgKYrteqFg9NtP4V7RWz29q6Y7JSOOwD0fZFS7x1fVjlJsx8SqUe/bhHtrvdBSCijtFIg4Avd8lBHr476KNUexLQsJ2Nxeffic3TKeOPWHfBUt6xSGOFID77OCgRwH28NALuc3NgfPwyjuJgrvQr9CkXjQznso5j1x6s/4GooFpzDEkRp4TwlCkYPtIRSLfmNz8DyEYonC2+4uFP1Ofsec4hBHaqj1Y19jcJ7Cu4XFg7pwlpd7X8Zwc/3a+9kjcE9Tl586HKdIhjtcRY1gRZ738LnFKRdxpEb49PgpW2nd/wLvQyrZ'
+)
+MEMO = pickle.loads(zlib.decompress(base64.b64decode(MEMO)))
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(**kwargs):
+  return Lark._load_from_dict(DATA, MEMO, **kwargs)
+
+GRAMMAR_SHA1 = "dd2f1d9f03b37ae7ffc367d8a8e8f43ac33c7990"
@@ -12,13 +12,14 @@ Walks the AST and executes MOL programs. Features:
 
 from mol.ast_nodes import *
 from mol.types import (
+    MolObject,
     Thought, Memory, Node, Stream, Document, Chunk, Embedding, VectorStore,
     Vector, QuantizedVector, VectorIndex,
     EncryptedValue, EncryptedVector, EncryptedMemory, CryptoKeyPair,
     SwarmCluster,
 )
 from mol.stdlib import STDLIB, SecurityContext, MOLSecurityError, MOLTypeError, MOLTask, _THREAD_POOL, get_sandbox_stdlib, SANDBOX_BLOCKED_FUNCTIONS
-from mol.stdlib import MOLAssertionError
+from mol.stdlib import MOLAssertionError, _builtin_range_fn
 from mol.borrow_checker import BorrowChecker, BorrowError, OwnershipError, UseAfterFreeError, BufferOverflowError, MemoryRegion
 from mol.jit_tracer import JITTracer, _global_jit
 import time as _time
@@ -46,6 +47,9 @@ class YieldSignal(Exception):
         self.value = value
 
 
+_MISSING = object()
+
+
 class Environment:
     """Scoped variable environment with parent chain."""
 
@@ -54,10 +58,14 @@ class Environment:
         self._parent: Environment | None = parent
 
     def get(self, name: str):
-        if name in self._store:
-            return self._store[name]
-        if self._parent:
-            return self._parent.get(name)
+        # Iterative walk with one dict probe per scope: builtins live in the
+        # outermost scope, so every builtin call walks the whole chain.
+        env = self
+        while env is not None:
+            value = env._store.get(name, _MISSING)
+            if value is not _MISSING:
+                return value
+            env = env._parent
         raise MOLRuntimeError(f"Undefined variable: '{name}'")
 
     def set(self, name: str, value):
@@ -173,7 +181,7 @@ def _repr_val(v):
         return "null"
     if isinstance(v, bool):
         return "true" if v else "false"
-    if isinstance(v, float) and v == int(v):
+    if isinstance(v, float) and v.is_integer():
         return str(int(v))
     return repr(v)
 
@@ -234,8 +242,7 @@ class Interpreter:
 
         # Load standard library into global scope
         stdlib = get_sandbox_stdlib() if sandbox else STDLIB
-        for name, fn in stdlib.items():
-            self.global_env.set(name, fn)
+        self.global_env._store.update(stdlib)
 
     # ── Public API ───────────────────────────────────────────
     def run(self, program: Program):
@@ -340,7 +347,14 @@ class Interpreter:
         return None
 
     def _exec_ForStmt(self, node: ForStmt, env):
-        iterable = self._eval(node.iterable, env)
+        it = node.iterable
+        if (isinstance(it, FuncCall) and it.name == "range"
+                and env.get("range") is _builtin_range_fn):
+            # `for i in range(n)`: iterate the range lazily instead of
+            # materializing the list the range() builtin returns
+            iterable = range(*[int(self._eval(a, env)) for a in it.args])
+        else:
+            iterable = self._eval(it, env)
         if not hasattr(iterable, '__iter__'):
             raise MOLRuntimeError(f"Cannot iterate over {type(iterable).__name__}")
         for item in iterable:
@@ -477,9 +491,7 @@ class Interpreter:
     # ── Use (import) Statement ───────────────────────────────
     def _exec_UseStmt(self, node, env):
         """Handle 'use' — import package or file into current scope."""
-        from mol.package_manager import (
-            get_package_exports, load_mol_file, BUILTIN_PACKAGES
-        )
+        from mol.package_manager import get_package_exports, load_mol_file
 
         module = node.module
         exports = {}
@@ -1119,8 +1131,7 @@ class Interpreter:
             return value.mol_repr()
         if isinstance(value, SwarmCluster):
             return value.mol_repr()
-        if isinstance(value, (Thought, Memory, Node, Stream,
-                              Document, Chunk, Embedding, VectorStore)):
+        if isinstance(value, MolObject):
             return value.mol_repr()
         return str(value)[:35]
 
@@ -1314,7 +1325,7 @@ class Interpreter:
         if isinstance(value, bool):
             return "true" if value else "false"
         if isinstance(value, float):
-            if value == int(value):
+            if value.is_integer():
                 return str(int(value))
             return str(value)
         if isinstance(value, Vector):
@@ -1323,8 +1334,7 @@ class Interpreter:
             return value.mol_repr()
         if isinstance(value, SwarmCluster):
             return value.mol_repr()
-        if isinstance(value, (Thought, Memory, Node, Stream,
-                              Document, Chunk, Embedding, VectorStore)):
+        if isinstance(value, MolObject):
             return value.mol_repr()
         return str(value)
 
@@ -1332,7 +1342,7 @@ class Interpreter:
         if b == 0:
             raise MOLRuntimeError("Division by zero")
         result = a / b
-        if isinstance(a, int) and isinstance(b, int) and result == int(result):
+        if isinstance(a, int) and isinstance(b, int) and result.is_integer():
             return int(result)
         return result
 
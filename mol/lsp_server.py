@@ -176,7 +176,7 @@ STDLIB_FUNCTIONS = {
         "signature": "(text, sep?)",
         "params": [
             {"name": "text", "doc": "Text to split"},
-            {"name": "sep", "doc": 'Split delimiter (default " ")'},
+            {"name": "sep", "doc": "Split delimiter (default: runs of whitespace)"},
         ],
         "doc": 'Split text into a list. `split("a,b,c", ",")` → ["a","b","c"].',
         "returns": "List",
@@ -240,8 +240,11 @@ STDLIB_FUNCTIONS = {
         "category": "utility",
     },
     "to_json": {
-        "signature": "(obj)",
-        "params": [{"name": "obj", "doc": "A value to serialize"}],
+        "signature": "(obj, pretty?)",
+        "params": [
+            {"name": "obj", "doc": "A value to serialize"},
+            {"name": "pretty", "doc": "Indent the output (default true); false gives compact JSON"},
+        ],
         "doc": "Serialize a MOL value to JSON text.",
         "returns": "Text",
         "category": "conversion",
@@ -416,7 +419,7 @@ STDLIB_FUNCTIONS = {
         "signature": "(query, store_name?, top_k?)",
         "params": [
             {"name": "query", "doc": "Query text to search for"},
-            {"name": "store_name", "doc": 'VectorStore name (default "default")'},
+            {"name": "store_name", "doc": 'VectorStore name (default "default") or the VectorStore returned by store()'},
             {"name": "top_k", "doc": "Number of results (default 3)"},
         ],
         "doc": "Retrieve the top-k most similar entries from a VectorStore.",
@@ -698,11 +701,11 @@ STDLIB_FUNCTIONS = {
     "clamp": {
         "signature": "(value, lo, hi)",
         "params": [
-            {"name": "value", "doc": "Number to clamp"},
+            {"name": "value", "doc": "Number (or list of numbers) to clamp"},
             {"name": "lo", "doc": "Minimum bound"},
             {"name": "hi", "doc": "Maximum bound"},
         ],
-        "doc": "Clamp a value to the range [lo, hi].",
+        "doc": "Clamp a value, or each item of a list, to the range [lo, hi].",
         "returns": "Number",
         "category": "math",
     },
@@ -711,7 +714,7 @@ STDLIB_FUNCTIONS = {
         "params": [
             {"name": "a", "doc": "Start value"},
             {"name": "b", "doc": "End value"},
-            {"name": "t", "doc": "Interpolation factor (0.0–1.0)"},
+            {"name": "t", "doc": "Interpolation factor (0.0–1.0), or a list of factors"},
         ],
         "doc": "Linear interpolation between a and b. `lerp(0, 100, 0.5)` → 50.",
         "returns": "Number",
@@ -892,10 +895,11 @@ STDLIB_FUNCTIONS = {
         "category": "list",
     },
     "binary_search": {
-        "signature": "(lst, target)",
+        "signature": "(lst, target, assume_sorted?)",
         "params": [
             {"name": "lst", "doc": "A sorted list"},
             {"name": "target", "doc": "Value to search for"},
+            {"name": "assume_sorted", "doc": "Skip re-sorting `lst` (default false)"},
         ],
         "doc": "Binary search on a sorted list. Returns index or -1.",
         "returns": "Number",
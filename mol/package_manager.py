@@ -17,12 +17,17 @@ Commands:
 
 import json
 import os
+import random
 import shutil
+import socket
 import sys
+import time
 import hashlib
+import io
 import zipfile
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 from urllib import request, error
 
@@ -33,6 +38,8 @@ FALLBACK_REGISTRY_URL = "https://mol-lang.github.io/registry/index.json"
 PACKAGES_DIR = "mol_packages"
 MANIFEST_FILE = "mol.pkg.json"
 LOCK_FILE = "mol.lock.json"
+REGISTRY_ATTEMPTS = 3
+REGISTRY_BACKOFF = 0.5
 
 # ── ANSI Colors ──────────────────────────────────────────────
 class C:
@@ -46,6 +53,11 @@ class C:
     RESET = "\033[0m"
 
 
+# Pre-built status markers for the per-package print paths
+_OK = f"{C.GREEN}✓{C.RESET}"
+_WARN = f"{C.YELLOW}⚠{C.RESET}"
+
+
 # ── Built-in Packages (shipped with MOL) ────────────────────
 BUILTIN_PACKAGES = {
     "std": {
@@ -143,6 +155,17 @@ BUILTIN_PACKAGES = {
     },
 }
 
+# Make the table read-only all the way down: tuple exports, proxied records
+BUILTIN_PACKAGES = MappingProxyType({
+    name: MappingProxyType({**info, "exports": tuple(info["exports"])})
+    for name, info in BUILTIN_PACKAGES.items()
+})
+
+# package name → frozenset of export names, for O(1) membership tests
+BUILTIN_EXPORT_SETS = MappingProxyType({
+    name: frozenset(info["exports"]) for name, info in BUILTIN_PACKAGES.items()
+})
+
 
 # ── Manifest Management ─────────────────────────────────────
 
@@ -161,7 +184,7 @@ def load_manifest(project_root: Path) -> dict:
     manifest_path = project_root / MANIFEST_FILE
     if not manifest_path.exists():
         return {}
-    with open(manifest_path) as f:
+    with open(manifest_path, "rb") as f:
         return json.load(f)
 
 
@@ -186,21 +209,52 @@ def load_lockfile(project_root: Path) -> dict:
     lock_path = project_root / LOCK_FILE
     if not lock_path.exists():
         return {"packages": {}}
-    with open(lock_path) as f:
+    with open(lock_path, "rb") as f:
         return json.load(f)
 
 
 # ── Registry Client ─────────────────────────────────────────
 
+# Failures worth retrying: the same request may well succeed a moment later.
+# DNS errors, refused connections, 4xx, etc. fail over to the next mirror at once.
+_TRANSIENT_ERRORS = (socket.timeout, TimeoutError, ConnectionResetError, ConnectionAbortedError)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """True for timeouts, dropped connections and 5xx responses."""
+    if isinstance(exc, error.HTTPError):
+        return exc.code >= 500
+    if isinstance(exc, error.URLError):
+        return isinstance(exc.reason, _TRANSIENT_ERRORS)
+    return isinstance(exc, _TRANSIENT_ERRORS)
+
+
+def _get_with_retry(url: str, attempts: int = REGISTRY_ATTEMPTS,
+                    base_backoff: float = REGISTRY_BACKOFF) -> bytes:
+    """
+    GET a URL, retrying transient failures with jittered exponential backoff.
+    Permanent failures raise immediately; the last error is raised on exhaustion.
+    """
+    req = request.Request(url, headers={"User-Agent": "mol-pkg/0.4.0"})
+    for attempt in range(attempts):
+        # 10s for the first try, then shorter (5s, 3.3s, ... floored at 2s)
+        timeout = max(2, 10 / (attempt + 1))
+        try:
+            with request.urlopen(req, timeout=timeout) as resp:
+                return resp.read()
+        except (error.URLError, OSError) as exc:
+            if not _is_transient(exc) or attempt == attempts - 1:
+                raise
+        time.sleep(base_backoff * 2 ** attempt + random.uniform(0, base_backoff))
+
+
 def fetch_registry() -> dict:
     """Fetch the package registry index."""
     for url in [REGISTRY_URL, FALLBACK_REGISTRY_URL]:
         try:
-            req = request.Request(url, headers={"User-Agent": "mol-pkg/0.4.0"})
-            with request.urlopen(req, timeout=10) as resp:
-                return json.loads(resp.read().decode())
+            return json.loads(_get_with_retry(url))
         except Exception:
-            continue
+            continue  # fall through to the next mirror
 
     # Return a local built-in registry if network is unavailable
     return {
@@ -220,17 +274,12 @@ def fetch_registry() -> dict:
 
 def fetch_package(name: str, version: str = "latest") -> Optional[dict]:
     """Fetch package metadata from registry."""
-    registry = fetch_registry()
-    packages = registry.get("packages", {})
-
-    if name in packages:
-        return packages[name]
-
-    # Check built-ins
+    # Built-ins ship with MOL — no need to touch the network
     if name in BUILTIN_PACKAGES:
         return BUILTIN_PACKAGES[name]
 
-    return None
+    registry = fetch_registry()
+    return registry.get("packages", {}).get(name)
 
 
 def download_package(url: str, dest: Path) -> bool:
@@ -274,10 +323,40 @@ def resolve_package(name: str, version: str = "latest", project_root: Path = Non
     return None
 
 
-def get_package_exports(name: str, project_root: Path = None) -> dict:
+def _top_level_names(program, stdlib) -> dict:
+    """
+    Collect the symbols a module defines at top level without running it.
+    Mirrors the full get_package_exports path: every non-stdlib global,
+    regardless of 'export' statements. Names pulled in by nested 'use'
+    statements are not visible without executing the package.
+    """
+    from mol.ast_nodes import (
+        FuncDef, PipelineDef, StructDef, DeclareVar, OwnDeclare,
+        DestructureList, DestructureMap,
+    )
+
+    names = []
+    for stmt in program.statements:
+        if isinstance(stmt, (FuncDef, PipelineDef, StructDef, DeclareVar, OwnDeclare)):
+            names.append(stmt.name)
+        elif isinstance(stmt, DestructureList):
+            names.extend(n for n in stmt.names if n != "_")
+            if stmt.rest:
+                names.append(stmt.rest)
+        elif isinstance(stmt, DestructureMap):
+            names.extend(stmt.keys)
+
+    return {n: None for n in names if n not in stdlib}
+
+
+def get_package_exports(name: str, project_root: Path = None,
+                        names_only: bool = False) -> dict:
     """
     Get exported symbols from a package.
     Returns a dict of {symbol_name: callable_or_value}.
+
+    With names_only=True, user packages are parsed but not executed and
+    every value is None — enough for listing, without running side effects.
     """
     from mol.stdlib import STDLIB
 
@@ -286,7 +365,7 @@ def get_package_exports(name: str, project_root: Path = None) -> dict:
         exports = {}
         for symbol_name in BUILTIN_PACKAGES[name]["exports"]:
             if symbol_name in STDLIB:
-                exports[symbol_name] = STDLIB[symbol_name]
+                exports[symbol_name] = None if names_only else STDLIB[symbol_name]
         return exports
 
     # User-installed packages
@@ -300,7 +379,7 @@ def get_package_exports(name: str, project_root: Path = None) -> dict:
     # Look for main entry point
     pkg_manifest = pkg_dir / MANIFEST_FILE
     if pkg_manifest.exists():
-        with open(pkg_manifest) as f:
+        with open(pkg_manifest, "rb") as f:
             meta = json.load(f)
         main_file = meta.get("main", "main.mol")
     else:
@@ -314,10 +393,13 @@ def get_package_exports(name: str, project_root: Path = None) -> dict:
     from mol.parser import parse
     from mol.interpreter import Interpreter
 
-    with open(main_path) as f:
+    with open(main_path, encoding="utf-8") as f:
         source = f.read()
 
     ast = parse(source)
+    if names_only:
+        return _top_level_names(ast, STDLIB)
+
     interp = Interpreter(trace=False)
     interp.run(ast)
 
@@ -356,7 +438,7 @@ def load_mol_file(filepath: str, project_root: Path = None) -> dict:
     if not full_path.exists():
         raise FileNotFoundError(f"Cannot find module: {filepath}")
 
-    with open(full_path) as f:
+    with open(full_path, encoding="utf-8") as f:
         source = f.read()
 
     ast = parse(source)
@@ -423,7 +505,7 @@ def cmd_install(args):
     # Check if it's a built-in package
     if pkg_name in BUILTIN_PACKAGES:
         info = BUILTIN_PACKAGES[pkg_name]
-        print(f"  {C.GREEN}✓{C.RESET} {pkg_name}@{info['version']} {C.DIM}(built-in, {len(info['exports'])} exports){C.RESET}")
+        print(f"  {_OK} {pkg_name}@{info['version']} {C.DIM}(built-in, {len(info['exports'])} exports){C.RESET}")
 
         # Add to manifest dependencies
         manifest = load_manifest(root)
@@ -461,7 +543,7 @@ def cmd_install(args):
         pkg_dir.mkdir(parents=True, exist_ok=True)
 
         if download_package(download_url, pkg_dir):
-            print(f"  {C.GREEN}✓{C.RESET} {pkg_name}@{pkg_info.get('version', version)}")
+            print(f"  {_OK} {pkg_name}@{pkg_info.get('version', version)}")
 
             # Update manifest
             manifest = load_manifest(root)
@@ -487,7 +569,7 @@ def cmd_install(args):
             print(f"{C.RED}Failed to install {pkg_name}{C.RESET}")
     elif pkg_info.get("builtin"):
         # Built-in package from registry
-        print(f"  {C.GREEN}✓{C.RESET} {pkg_name}@{pkg_info.get('version')} {C.DIM}(built-in){C.RESET}")
+        print(f"  {_OK} {pkg_name}@{pkg_info.get('version')} {C.DIM}(built-in){C.RESET}")
         print(f"\n{C.GREEN}Installed 1 package{C.RESET}")
         _print_use_hint(pkg_name)
     else:
@@ -504,7 +586,7 @@ def cmd_install(args):
                 capture_output=True, text=True,
             )
             if result.returncode == 0:
-                print(f"  {C.GREEN}✓{C.RESET} {pkg_name}@{pkg_info.get('version', 'latest')}")
+                print(f"  {_OK} {pkg_name}@{pkg_info.get('version', 'latest')}")
                 print(f"\n{C.GREEN}Installed 1 package{C.RESET}")
                 _print_use_hint(pkg_name)
             else:
@@ -526,11 +608,11 @@ def cmd_uninstall(args):
     pkg_dir = root / PACKAGES_DIR / pkg_name
     if pkg_dir.exists():
         shutil.rmtree(pkg_dir)
-        print(f"  {C.GREEN}✓{C.RESET} Removed {pkg_name}")
+        print(f"  {_OK} Removed {pkg_name}")
     elif pkg_name in BUILTIN_PACKAGES:
-        print(f"  {C.YELLOW}⚠{C.RESET} {pkg_name} is a built-in package — removing from dependencies only")
+        print(f"  {_WARN} {pkg_name} is a built-in package — removing from dependencies only")
     else:
-        print(f"  {C.YELLOW}⚠{C.RESET} Package {pkg_name} was not installed")
+        print(f"  {_WARN} Package {pkg_name} was not installed")
 
     # Remove from manifest
     manifest = load_manifest(root)
@@ -579,7 +661,11 @@ def cmd_list(args=None):
     if pkg_dir.exists():
         for entry in pkg_dir.iterdir():
             if entry.is_dir() and entry.name not in deps:
-                print(f"  {C.YELLOW}{entry.name:<20}{C.RESET} {'local':<10} {C.DIM}(not in manifest){C.RESET}")
+                try:
+                    n_exports = len(get_package_exports(entry.name, root, names_only=True))
+                except Exception:
+                    n_exports = "?"  # unparsable main.mol or mol.pkg.json
+                print(f"  {C.YELLOW}{entry.name:<20}{C.RESET} {'local':<10} {C.DIM}(not in manifest, {n_exports} exports){C.RESET}")
 
     print()
 
@@ -645,23 +731,29 @@ def cmd_publish(args=None):
     archive_path = root / "dist" / archive_name
     archive_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
-        main_file = manifest.get("main", "main.mol")
-        # Add manifest
-        zf.write(root / MANIFEST_FILE, MANIFEST_FILE)
-        # Add main file
-        if (root / main_file).exists():
-            zf.write(root / main_file, main_file)
-        # Add all .mol files
-        for mol_file in root.glob("**/*.mol"):
-            if PACKAGES_DIR not in str(mol_file) and ".venv" not in str(mol_file):
-                rel_path = mol_file.relative_to(root)
-                zf.write(mol_file, str(rel_path))
-
-    size_kb = archive_path.stat().st_size / 1024
-    sha = hashlib.sha256(archive_path.read_bytes()).hexdigest()
-
-    print(f"  {C.GREEN}✓{C.RESET} Created {archive_name} ({size_kb:.1f} KB)")
+    # Collect (arcname → path) first so each file is read and written once
+    main_file = manifest.get("main", "main.mol")
+    entries = {MANIFEST_FILE: root / MANIFEST_FILE}
+    if (root / main_file).exists():
+        entries[main_file] = root / main_file
+    for mol_file in root.glob("**/*.mol"):
+        if PACKAGES_DIR not in str(mol_file) and ".venv" not in str(mol_file):
+            entries.setdefault(str(mol_file.relative_to(root)), mol_file)
+
+    # Build the archive in memory: zipfile seeks back to patch local headers,
+    # so hashing on write is unreliable — hash the finished buffer instead.
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for arcname, path in entries.items():
+            info = zipfile.ZipInfo.from_file(path, arcname)
+            zf.writestr(info, path.read_bytes(), compress_type=zipfile.ZIP_DEFLATED)
+    data = buf.getbuffer()
+    archive_path.write_bytes(data)
+
+    size_kb = len(data) / 1024
+    sha = hashlib.sha256(data).hexdigest()
+
+    print(f"  {_OK} Created {archive_name} ({size_kb:.1f} KB)")
     print(f"  {C.DIM}SHA256: {sha}{C.RESET}")
     print()
     print(f"{C.YELLOW}To publish to the MOL registry:{C.RESET}")
@@ -4,58 +4,168 @@ MOL Parser — Lark-based Lexer/Parser + AST Transformer
 
 Reads MOL source code, tokenizes it via Lark, and transforms
 the parse tree into a clean AST using the nodes from ast_nodes.py.
+
+Syntax errors are raised as MOLSyntaxError, whichever backend (the
+generated standalone parser or lark itself) is in use.
 """
 
 import os
-from lark import Lark, Transformer, v_args, Token
+import re
+import sys
+import hashlib
+import functools
 from mol.ast_nodes import *
 
 _GRAMMAR_PATH = os.path.join(os.path.dirname(__file__), "grammar.lark")
 
+with open(_GRAMMAR_PATH, "rb") as _f:
+    _GRAMMAR_SRC = _f.read()
+_GRAMMAR_SHA1 = hashlib.sha1(_GRAMMAR_SRC).hexdigest()
+
+
+def _load_standalone():
+    """Return the generated standalone parser module, or None if absent or stale.
+
+    Set MOL_DEV_GRAMMAR=1 to always build from grammar.lark while hacking on it.
+    """
+    if os.environ.get("MOL_DEV_GRAMMAR") == "1":
+        return None
+    try:
+        from mol import _standalone_parser
+    except ImportError:
+        return None
+    if getattr(_standalone_parser, "GRAMMAR_SHA1", None) != _GRAMMAR_SHA1:
+        return None
+    return _standalone_parser
+
+
+_standalone = _load_standalone()
+
+# Tree/Token classes differ between lark and the standalone module, so the
+# transformer machinery must come from whichever one builds the parser.
+if _standalone is not None:
+    from mol._standalone_parser import Lark, Transformer, Tree, v_args, Token, UnexpectedInput
+else:
+    from lark import Lark, Transformer, Tree, v_args, Token, UnexpectedInput
+
+
+class MOLSyntaxError(Exception):
+    """Raised when MOL source does not parse.
+
+    The backend's own exception classes differ between the standalone parser
+    and lark, so catch this one; the original is kept as __cause__.
+    """
+
+    def __init__(self, message, line=None, column=None):
+        super().__init__(message)
+        self.line = line
+        self.column = column
+
+    def __reduce__(self):
+        # keep line/column when raised in a parse_many() worker process
+        return (type(self), (str(self), self.line, self.column))
+
+
+def _first_position(children):
+    """(line, column) of the first positioned item in a reduction's raw children."""
+    for child in children:
+        # Explicit type checks instead of getattr probes: plain strings and
+        # None placeholders are common here and never carry a position.
+        if isinstance(child, (Token, ASTNode)):
+            if child.line:
+                return (child.line, child.column or 0)
+        elif isinstance(child, Tree):
+            if child.meta.pos:  # set by _stamp_positions on every helper tree
+                return child.meta.pos
+        elif isinstance(child, (list, tuple)):
+            pos = _first_position(child)
+            if pos:
+                return pos
+    return None
+
+
+def _ident(tok):
+    """Identifier token → interned str; the same names recur all over a program."""
+    return sys.intern(str(tok))
+
+
+def _number_value(tok):
+    """NUMBER token → int when it is integral (so `2.0` and `1e3` become ints), else float."""
+    if tok.isdigit():
+        return int(tok)
+    v = float(tok)
+    return int(v) if v == int(v) else v
+
+
+def _stamp_positions(callback):
+    """Wrap a parser callback so AST results get the line/col where their rule starts.
+
+    Lark only propagates positions onto Tree results, and the transformer is
+    fused into the parser, so we do it here. The raw children still include
+    filtered keyword tokens, matching what propagate_positions used to report.
+    """
+    def stamped(children):
+        result = callback(children)
+        if isinstance(result, ASTNode):
+            pos = _first_position(children)
+            if pos:
+                result.line, result.column = pos
+        elif isinstance(result, Tree):
+            # helper trees drop their _NL children; remember where they began
+            result.meta.pos = _first_position(children)
+        return result
+    return stamped
 
-def _get_parser() -> Lark:
-    """Create and return the Lark parser for MOL."""
-    with open(_GRAMMAR_PATH, "r") as f:
-        grammar = f.read()
-    return Lark(
-        grammar,
-        parser="lalr",
-        propagate_positions=True,
-        maybe_placeholders=True,
-    )
 
+# f-string body: `{expr}` holes and literal runs (a stray `{` stays literal)
+_INTERP_RE = re.compile(r"\{([^}]*)\}|([^{]+|\{)")
 
-_parser = _get_parser()
+# Rules whose handlers only return plain values (strings, lists, tuples) that
+# get folded into a parent node; their callbacks are left unwrapped.
+_PLAIN_RULES = frozenset({
+    "expr_list", "pair_list", "pair", "arg_list", "param_list", "param",
+    "param_default", "elif_list", "elif_clause", "else_clause", "block",
+    "name_list", "destruct_names", "rescue_clause", "ensure_clause",
+    "struct_field", "struct_fields", "impl_methods", "match_pattern_list",
+    "comp_eq", "comp_neq", "comp_op", "add_op", "mul_op", "type_name",
+})
 
 
 # ── Transformer: parse-tree → AST ───────────────────────────
 @v_args(inline=True)
 class MOLTransformer(Transformer):
-    """Transforms the Lark parse tree into our AST node objects."""
-
-    def __default_token__(self, tok):
-        return tok
-
-    def _apply_meta(self, tree, result):
-        """After transforming a tree, apply its meta (line/col) to the result AST node."""
-        if isinstance(result, ASTNode) and hasattr(tree, 'meta'):
-            meta = tree.meta
-            if hasattr(meta, 'line') and meta.line is not None:
-                result.line = meta.line
-                result.column = getattr(meta, 'column', 0) or 0
-        return result
+    """Builds AST node objects directly from the parser's reductions.
 
-    def _call_userfunc_token(self, token):
-        return token
+    The transformer is fused into the LALR parser, so no intermediate parse
+    tree is materialized. Handlers must stay stateless: a single shared
+    instance serves every parse. List-building rules use `inline=False` to
+    return the children list Lark already built instead of copying it.
+    """
 
     def __default__(self, data, children, meta):
         """Fallback for rules without explicit handlers."""
+        if data.startswith("_"):
+            # Lark's internal helper rules (e.g. __start_star_0) are inlined
+            # into their parent later and must stay Trees.
+            return Tree(data, children)
         return children
 
-    def _transform_tree(self, tree):
-        """Override to inject line/col from Lark meta into AST nodes."""
-        result = super()._transform_tree(tree)
-        return self._apply_meta(tree, result)
+    @staticmethod
+    def _fold_binop(args, node_cls, op=None):
+        """Left-fold a binary chain.
+
+        With a fixed `op`, args is [left, right, right, ...]; otherwise the
+        operators are interleaved: [left, op, right, op, right, ...].
+        """
+        it = iter(args)
+        left = next(it)
+        if op is not None:
+            for right in it:
+                left = node_cls(op=op, left=left, right=right)
+        else:
+            for op, right in zip(it, it):
+                left = node_cls(op=str(op), left=left, right=right)
+        return left
 
     # ── Program ──────────────────────────────────────────────
     def start(self, *stmts):
@@ -63,10 +173,7 @@ class MOLTransformer(Transformer):
 
     # ── Literals ─────────────────────────────────────────────
     def number(self, tok):
-        v = float(tok)
-        if v == int(v):
-            v = int(v)
-        return NumberLiteral(value=v)
+        return NumberLiteral(value=_number_value(tok))
 
     def string(self, tok):
         return StringLiteral(value=str(tok)[1:-1])  # strip quotes
@@ -85,146 +192,73 @@ class MOLTransformer(Transformer):
             return ListLiteral(elements=[])
         return ListLiteral(elements=items)
 
-    def expr_list(self, *items):
-        return list(items)
+    @v_args(inline=False)
+    def expr_list(self, items):
+        return items
 
     def map_lit(self, pairs=None):
         if pairs is None:
             return MapLiteral(pairs=[])
         return MapLiteral(pairs=pairs)
 
-    def pair_list(self, *pairs):
-        return list(pairs)
+    @v_args(inline=False)
+    def pair_list(self, pairs):
+        return pairs
 
     def pair(self, key, value):
-        if isinstance(key, Token):
-            k = str(key)
-            if k.startswith('"') or k.startswith("'"):
-                k = k[1:-1]
-        else:
-            k = str(key)
-        return (k, value)
+        # key is a NAME or ESCAPED_STRING token; slicing a Token gives a plain str
+        if key.type == "ESCAPED_STRING":
+            return (key[1:-1], value)
+        return (str(key), value)
 
     # ── Variables ────────────────────────────────────────────
     def var_ref(self, name):
-        return VarRef(name=str(name))
+        return VarRef(name=_ident(name))
 
     def declare_infer(self, name, value):
-        return DeclareVar(name=str(name), value=value)
+        return DeclareVar(name=_ident(name), value=value)
 
     def declare_typed(self, name, type_n, value):
-        return DeclareVar(name=str(name), type_name=type_n, value=value)
+        return DeclareVar(name=_ident(name), type_name=_ident(type_n), value=value)
 
     def assign_stmt(self, name, value):
-        return AssignVar(name=str(name), value=value)
+        return AssignVar(name=_ident(name), value=value)
 
     def assign_field_stmt(self, obj_name, field_name, value):
-        from mol.ast_nodes import VarRef
-        return AssignField(obj=VarRef(name=str(obj_name)), field_name=str(field_name), value=value)
+        return AssignField(obj=VarRef(name=_ident(obj_name)), field_name=_ident(field_name), value=value)
 
     def assign_index_stmt(self, obj_name, index, value):
-        from mol.ast_nodes import VarRef
-        return AssignIndex(obj=VarRef(name=str(obj_name)), index=index, value=value)
+        return AssignIndex(obj=VarRef(name=_ident(obj_name)), index=index, value=value)
 
     def assign_field_index_stmt(self, obj_name, field_name, index, value):
-        from mol.ast_nodes import VarRef, FieldAccess
-        obj = FieldAccess(obj=VarRef(name=str(obj_name)), field_name=str(field_name))
+        obj = FieldAccess(obj=VarRef(name=_ident(obj_name)), field_name=_ident(field_name))
         return AssignIndex(obj=obj, index=index, value=value)
 
     def assign_index_index_stmt(self, obj_name, first_index, second_index, value):
-        from mol.ast_nodes import VarRef, IndexAccess
-        obj = IndexAccess(obj=VarRef(name=str(obj_name)), index=first_index)
+        obj = IndexAccess(obj=VarRef(name=_ident(obj_name)), index=first_index)
         return AssignIndex(obj=obj, index=second_index, value=value)
 
-    # ── Types ────────────────────────────────────────────────
-    def type_thought(self):  return "Thought"
-    def type_memory(self):   return "Memory"
-    def type_node(self):     return "Node"
-    def type_stream(self):   return "Stream"
-    def type_number(self):   return "Number"
-    def type_text(self):     return "Text"
-    def type_bool(self):     return "Bool"
-    def type_list(self):     return "List"
-    def type_vector(self):   return "Vector"
-    def type_encrypted(self): return "Encrypted"
-    def type_swarm(self):    return "SwarmCluster"
-    def type_custom(self, n): return str(n)
-
     # ── Expressions ──────────────────────────────────────────
     def or_expr(self, *args):
-        args = list(args)
-        if len(args) == 1:
-            return args[0]
-        result = args[0]
-        for i in range(1, len(args)):
-            result = LogicalOp(op="or", left=result, right=args[i])
-        return result
+        return self._fold_binop(args, LogicalOp, "or")
 
     def and_expr(self, *args):
-        args = list(args)
-        if len(args) == 1:
-            return args[0]
-        result = args[0]
-        for i in range(1, len(args)):
-            result = LogicalOp(op="and", left=result, right=args[i])
-        return result
+        return self._fold_binop(args, LogicalOp, "and")
 
     def not_expr(self, operand):
         return NotOp(operand=operand)
 
     def comparison(self, *args):
-        args = list(args)
-        if len(args) == 1:
-            return args[0]
-        # args: [left, op, right, op, right, ...]
-        result = args[0]
-        i = 1
-        while i < len(args):
-            op = args[i]
-            right = args[i + 1]
-            result = Comparison(op=op, left=result, right=right)
-            i += 2
-        return result
+        return self._fold_binop(args, Comparison)
 
-    def comp_eq(self):    return "=="
-    def comp_neq(self):   return "!="
-    def comp_gt(self):    return ">"
-    def comp_lt(self):    return "<"
-    def comp_gte(self):   return ">="
-    def comp_lte(self):   return "<="
+    def comp_eq(self, _is):          return "=="
+    def comp_neq(self, _is, _not):   return "!="
 
     def addition(self, *args):
-        args = list(args)
-        if len(args) == 1:
-            return args[0]
-        result = args[0]
-        i = 1
-        while i < len(args):
-            op = args[i]
-            right = args[i + 1]
-            result = BinaryOp(op=op, left=result, right=right)
-            i += 2
-        return result
-
-    def op_add(self):  return "+"
-    def op_sub(self):  return "-"
+        return self._fold_binop(args, BinaryOp)
 
     def multiplication(self, *args):
-        args = list(args)
-        if len(args) == 1:
-            return args[0]
-        result = args[0]
-        i = 1
-        while i < len(args):
-            op = args[i]
-            right = args[i + 1]
-            result = BinaryOp(op=op, left=result, right=right)
-            i += 2
-        return result
-
-    def op_mul(self):  return "*"
-    def op_div(self):  return "/"
-    def op_mod(self):  return "%"
+        return self._fold_binop(args, BinaryOp)
 
     def neg(self, operand):
         return UnaryOp(op="-", operand=operand)
@@ -234,19 +268,20 @@ class MOLTransformer(Transformer):
 
     # ── Access / Calls ───────────────────────────────────────
     def field_access(self, obj, name):
-        return FieldAccess(obj=obj, field_name=str(name))
+        return FieldAccess(obj=obj, field_name=_ident(name))
 
     def index_access(self, obj, idx):
         return IndexAccess(obj=obj, index=idx)
 
     def method_call(self, obj, name, args=None):
-        return MethodCall(obj=obj, method=str(name), args=args or [])
+        return MethodCall(obj=obj, method=_ident(name), args=args or [])
 
     def func_call(self, name, args=None):
-        return FuncCall(name=str(name), args=args or [])
+        return FuncCall(name=_ident(name), args=args or [])
 
-    def arg_list(self, *args):
-        return list(args)
+    @v_args(inline=False)
+    def arg_list(self, args):
+        return args
 
     # ── Functions ────────────────────────────────────────────
     def func_def(self, name, *args):
@@ -259,49 +294,42 @@ class MOLTransformer(Transformer):
             params = args[0]
             body = args[1]
         return FuncDef(
-            name=str(name),
+            name=_ident(name),
             params=params if params else [],
             body=body if body else [],
         )
 
-    def param_list(self, *params):
-        return list(params)
+    @v_args(inline=False)
+    def param_list(self, params):
+        return params
 
     def param(self, name, type_n=None):
-        return (str(name), type_n)
+        return (_ident(name), _ident(type_n) if type_n is not None else None)
 
     def return_stmt(self, value=None):
         return ReturnStmt(value=value)
 
     # ── Control Flow ─────────────────────────────────────────
-    def if_stmt(self, cond, body, *rest):
-        elifs = []
-        else_body = None
-        for item in rest:
-            if item is None:
-                continue
-            if isinstance(item, tuple) and item[0] == "__elif__":
-                elifs.append((item[1], item[2]))
-            elif isinstance(item, tuple) and item[0] == "__else__":
-                else_body = item[1]
+    def if_stmt(self, cond, body, elifs, else_body):
         return IfStmt(
             condition=cond,
             body=body,
-            elif_clauses=elifs,
+            elif_clauses=elifs or [],
             else_body=else_body,
         )
 
-    def elif_clause(self, cond, body):
-        return ("__elif__", cond, body)
+    @v_args(inline=False)
+    def elif_list(self, clauses):
+        return clauses
 
-    def else_clause(self, body):
-        return ("__else__", body)
+    def elif_clause(self, cond, body):
+        return (cond, body)
 
     def while_stmt(self, cond, body):
         return WhileStmt(condition=cond, body=body)
 
     def for_stmt(self, name, iterable, body):
-        return ForStmt(var_name=str(name), iterable=iterable, body=body)
+        return ForStmt(var_name=_ident(name), iterable=iterable, body=body)
 
     # ── Block ────────────────────────────────────────────────
     def block(self, *stmts):
@@ -361,7 +389,7 @@ class MOLTransformer(Transformer):
     # ── Pipeline Definition ──────────────────────────────────
     def pipeline_def(self, name, params, body):
         return PipelineDef(
-            name=str(name),
+            name=_ident(name),
             params=params if params else [],
             body=body if body else [],
         )
@@ -371,31 +399,19 @@ class MOLTransformer(Transformer):
         return UseStmt(module=str(module)[1:-1])
 
     def use_named(self, module, *names):
-        return UseStmt(module=str(module)[1:-1], symbols=[str(n) for n in names])
+        return UseStmt(module=str(module)[1:-1], symbols=[_ident(n) for n in names])
 
     def use_alias(self, module, alias):
-        return UseStmt(module=str(module)[1:-1], alias=str(alias))
+        return UseStmt(module=str(module)[1:-1], alias=_ident(alias))
 
     # ── v0.6.0 — Destructuring ──────────────────────────────
     def name_list(self, *names):
-        return [str(n) for n in names]
+        return [_ident(n) for n in names]
 
     def destruct_names(self, *args):
-        """Parse destructure names, optionally with ...rest at end."""
-        names = []
-        rest = None
-        skip_next = False
-        for i, a in enumerate(args):
-            s = str(a)
-            if s == '...':
-                skip_next = True
-                continue
-            if skip_next:
-                rest = s
-                skip_next = False
-                continue
-            names.append(s)
-        return (names, rest)
+        """Parse destructure names; the trailing `...rest` slot is (None, None) when absent."""
+        *names, _spread, rest = args
+        return ([_ident(n) for n in names], _ident(rest) if rest is not None else None)
 
     def destructure_list(self, names_info, value):
         names, rest = names_info
@@ -406,17 +422,11 @@ class MOLTransformer(Transformer):
 
     # ── v0.6.0 — Default Parameters ─────────────────────────
     def param_default(self, name, default):
-        return (str(name), None, default)     # (name, type, default_expr)
+        return (_ident(name), None, default)     # (name, type, default_expr)
 
     # ── v0.6.0 — Null Coalescing ────────────────────────────
     def null_coalesce(self, *args):
-        args = list(args)
-        if len(args) == 1:
-            return args[0]
-        result = args[0]
-        for i in range(1, len(args)):
-            result = NullCoalesce(left=result, right=args[i])
-        return result
+        return functools.reduce(lambda left, right: NullCoalesce(left=left, right=right), args)
 
     # ── v0.6.0 — Try/Rescue/Ensure ──────────────────────────
     def try_rescue(self, body, rescue, ensure=None):
@@ -426,7 +436,7 @@ class MOLTransformer(Transformer):
 
     def rescue_clause(self, *args):
         if len(args) == 2:
-            return (str(args[0]), args[1])   # (name, body)
+            return (_ident(args[0]), args[1])   # (name, body)
         return (None, args[0])               # (None, body)
 
     def ensure_clause(self, body):
@@ -454,21 +464,23 @@ class MOLTransformer(Transformer):
 
     # ── v0.8.0 — Structs ────────────────────────────────────
     def struct_field(self, *args):
-        name = str(args[0])
+        name = _ident(args[0])
         type_name = str(args[1]) if len(args) > 1 else None
         return (name, type_name)
 
-    def struct_fields(self, *fields):
-        return list(fields)
+    @v_args(inline=False)
+    def struct_fields(self, fields):
+        return fields
 
     def struct_def(self, name, fields):
-        return StructDef(name=str(name), fields=fields)
+        return StructDef(name=_ident(name), fields=fields)
 
-    def impl_methods(self, *methods):
-        return list(methods)
+    @v_args(inline=False)
+    def impl_methods(self, methods):
+        return methods
 
     def impl_block(self, name, methods):
-        return ImplBlock(struct_name=str(name), methods=methods)
+        return ImplBlock(struct_name=_ident(name), methods=methods)
 
     def struct_literal(self, name, *pairs):
         # pairs may be: a single pair_list (list of tuples) or individual tuples
@@ -478,7 +490,7 @@ class MOLTransformer(Transformer):
                 fields.extend(p)
             else:
                 fields.append(p)
-        return StructLiteral(struct_name=str(name), fields=fields)
+        return StructLiteral(struct_name=_ident(name), fields=fields)
 
     # ── v0.8.0 — Yield ──────────────────────────────────────
     def yield_stmt(self, value):
@@ -486,26 +498,26 @@ class MOLTransformer(Transformer):
 
     # ── v0.8.0 — Export ─────────────────────────────────────
     def export_stmt(self, *names):
-        return ExportStmt(names=[str(n) for n in names])
+        return ExportStmt(names=[_ident(n) for n in names])
 
     # ── v2.0.0 — Memory Safety / Ownership ──────────────────
     def own_declare(self, name, value):
-        return OwnDeclare(name=str(name), value=value)
+        return OwnDeclare(name=_ident(name), value=value)
 
     def borrow_declare(self, borrower, source):
-        return BorrowDeclare(name=str(borrower), source=str(source))
+        return BorrowDeclare(name=_ident(borrower), source=_ident(source))
 
     def borrow_mut_declare(self, borrower, source):
-        return BorrowMutDeclare(name=str(borrower), source=str(source))
+        return BorrowMutDeclare(name=_ident(borrower), source=_ident(source))
 
     def move_ownership(self, source, target):
-        return MoveOwnership(source=str(source), target=str(target))
+        return MoveOwnership(source=_ident(source), target=_ident(target))
 
     def drop_value(self, name):
-        return DropValue(name=str(name))
+        return DropValue(name=_ident(name))
 
     def lifetime_scope(self, name, body):
-        return LifetimeScope(name=str(name), body=body if body else [])
+        return LifetimeScope(name=_ident(name), body=body if body else [])
 
     # ── v0.6.0 — Match Expression ───────────────────────────
     def match_expr(self, subject, *arms):
@@ -526,10 +538,7 @@ class MOLTransformer(Transformer):
         return MatchPattern(kind="wildcard")
 
     def pattern_number(self, tok):
-        v = float(tok)
-        if v == int(v):
-            v = int(v)
-        return MatchPattern(kind="literal", value=v)
+        return MatchPattern(kind="literal", value=_number_value(tok))
 
     def pattern_string(self, tok):
         return MatchPattern(kind="literal", value=str(tok)[1:-1])
@@ -544,45 +553,111 @@ class MOLTransformer(Transformer):
         return MatchPattern(kind="literal", value=None)
 
     def pattern_binding(self, name):
-        return MatchPattern(kind="binding", value=str(name))
+        return MatchPattern(kind="binding", value=_ident(name))
 
     def pattern_list(self, items=None):
         return MatchPattern(kind="list", children=items if items else [])
 
     def pattern_list_rest(self, items, rest):
-        return MatchPattern(kind="list_rest", value=str(rest), children=items if items else [])
+        return MatchPattern(kind="list_rest", value=_ident(rest), children=items if items else [])
 
-    def match_pattern_list(self, *items):
-        return list(items)
+    @v_args(inline=False)
+    def match_pattern_list(self, items):
+        return items
 
     # ── v0.6.0 — String Interpolation ───────────────────────
     def interp_string(self, tok):
         raw = str(tok)           # f"Hello {name}, {age}"
         inner = raw[2:-1]        # strip f" and "
         parts = []
-        i = 0
-        while i < len(inner):
-            if inner[i] == '{':
-                end = inner.index('}', i)
-                expr_src = inner[i+1:end]
-                # Parse the expression
-                from mol.parser import parse as _parse_mol
-                mini_ast = _parse_mol(f"show {expr_src}")
-                parts.append(mini_ast.statements[0].value)
-                i = end + 1
-            else:
-                # Collect literal text
-                j = i
-                while j < len(inner) and inner[j] != '{':
-                    j += 1
-                parts.append(inner[i:j])
-                i = j
+        for m in _INTERP_RE.finditer(inner):
+            hole = m.group(1)
+            parts.append(m.group(2) if hole is None else _parse_interp_expr(hole))
         return InterpolatedString(parts=parts)
 
 
+def _cache_path():
+    """Per-user location for the pickled LALR tables, or False to disable caching.
+
+    Lark unpickles this file, so it must not live anywhere another user can write.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    cache_dir = os.path.join(base, "mol")
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    except OSError:
+        return False
+    return os.path.join(cache_dir, f"grammar-{_GRAMMAR_SHA1}.lark-cache")
+
+
+# `expr` is a second entry point, used to parse f-string holes on their own.
+_START = ["start", "expr"]
+
+
+def _get_parser() -> Lark:
+    """Create and return the Lark parser for MOL, with the AST transformer fused in.
+
+    Prefers the pre-generated standalone parser. Otherwise the LALR tables
+    are pickled to a per-user cache keyed on the grammar source, so only the
+    first run after a grammar edit pays for building them.
+    """
+    if _standalone is not None:
+        parser = _standalone.Lark_StandAlone(transformer=_transformer)
+    else:
+        parser = Lark(
+            _GRAMMAR_SRC.decode("utf-8"),
+            parser="lalr",
+            maybe_placeholders=True,
+            start=_START,
+            transformer=_transformer,
+            cache=_cache_path(),
+        )
+    # frontend → LALR_Parser → _Parser; the callbacks dict is shared by reference
+    callbacks = parser.parser.parser.parser.callbacks
+    for rule, callback in callbacks.items():
+        if rule.origin.name not in _PLAIN_RULES:
+            callbacks[rule] = _stamp_positions(callback)
+    return parser
+
+
+_transformer = MOLTransformer()
+_parser = _get_parser()
+
+
 # ── Public API ───────────────────────────────────────────────
 def parse(source: str) -> Program:
-    """Parse MOL source code and return the AST."""
-    tree = _parser.parse(source + "\n")
-    transformer = MOLTransformer()
-    return transformer.transform(tree)
+    """Parse MOL source code and return the AST; raises MOLSyntaxError."""
+    try:
+        return _parser.parse(source, start="start")
+    except UnexpectedInput as e:
+        raise MOLSyntaxError(str(e), getattr(e, "line", None), getattr(e, "column", None)) from e
+
+
+def parse_many(sources, max_workers=None) -> list:
+    """Parse several MOL sources, in worker processes when there are enough of them.
+
+    Parsing is pure Python and holds the GIL, so threads would not help; the
+    shared parser and transformer are stateless, so each worker simply imports
+    this module. Results come back in input order; the first parse error is
+    raised, as with `parse`.
+    """
+    sources = list(sources)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(sources))
+    if max_workers <= 1:
+        return [parse(s) for s in sources]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        chunksize = max(1, len(sources) // (max_workers * 4))
+        return list(pool.map(parse, sources, chunksize=chunksize))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_interp_expr(expr_src: str) -> ASTNode:
+    """Parse one `{expr}` hole of an f-string; holes like `{name}` recur a lot.
+
+    The cached node is shared between strings, which is fine because the
+    interpreter never mutates the AST.
+    """
+    return _parser.parse(expr_src, start="expr")
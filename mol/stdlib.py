@@ -8,13 +8,20 @@ Includes general utilities, algorithms, and IntraMind-specific functions.
 
 import time
 import math
+import collections
+import functools
+import operator
 import json
+import binascii
+import bisect
 import hashlib
+import itertools
 import random
 import statistics
+import uuid
 from mol.types import (
-    Thought, Memory, Node, Stream,
-    Document, Chunk, Embedding, VectorStore,
+    MolObject, Thought, Memory, Node, Stream,
+    Document, Chunk, Embedding, VectorStore, cosine_similarity,
 )
 from mol.vector_engine import (
     Vector, QuantizedVector, VectorIndex,
@@ -69,13 +76,18 @@ class MOLGuardError(Exception):
 
 
 # ── Security Context ─────────────────────────────────────────
+AccessLogEntry = collections.namedtuple("AccessLogEntry", "resource granted time")
+
+
 class SecurityContext:
     """
     Enforces safety rails. Every access request is checked against
     an allow-list. This is how MOL prevents unauthorized data access *by design*.
     """
 
-    def __init__(self):
+    ACCESS_LOG_SIZE = 4096
+
+    def __init__(self, log_grants: bool = False):
         self._allowed_resources: set[str] = {
             "mind_core",
             "memory_bank",
@@ -83,21 +95,24 @@ class SecurityContext:
             "data_stream",
             "thought_pool",
         }
-        self._access_log: list[dict] = []
+        # Denials are always logged; granted accesses only when asked for,
+        # so the common authorized path stays a single set lookup. The log
+        # keeps the most recent ACCESS_LOG_SIZE entries.
+        self._log_grants = log_grants
+        self._access_log: collections.deque[AccessLogEntry] = collections.deque(
+            maxlen=self.ACCESS_LOG_SIZE
+        )
 
     def check_access(self, resource: str) -> bool:
-        granted = resource in self._allowed_resources
-        self._access_log.append({
-            "resource": resource,
-            "granted": granted,
-            "time": time.time(),
-        })
-        if not granted:
-            raise MOLSecurityError(
-                f"Access denied: '{resource}' is not an authorized resource. "
-                f"Allowed: {', '.join(sorted(self._allowed_resources))}"
-            )
-        return True
+        if resource in self._allowed_resources:
+            if self._log_grants:
+                self._access_log.append(AccessLogEntry(resource, True, time.time()))
+            return True
+        self._access_log.append(AccessLogEntry(resource, False, time.time()))
+        raise MOLSecurityError(
+            f"Access denied: '{resource}' is not an authorized resource. "
+            f"Allowed: {', '.join(sorted(self._allowed_resources))}"
+        )
 
     def grant(self, resource: str):
         self._allowed_resources.add(resource)
@@ -140,13 +155,19 @@ def _sandbox_blocked(name):
     return _blocked
 
 
+@functools.lru_cache(maxsize=None)
+def _sandbox_overrides():
+    """Blocker for each sandboxed STDLIB name, built once."""
+    return {
+        name: _sandbox_blocked(name)
+        for name in SANDBOX_BLOCKED_FUNCTIONS
+        if name in STDLIB
+    }
+
+
 def get_sandbox_stdlib():
     """Return a copy of STDLIB with dangerous functions replaced by blockers."""
-    safe = dict(STDLIB)
-    for name in SANDBOX_BLOCKED_FUNCTIONS:
-        if name in safe:
-            safe[name] = _sandbox_blocked(name)
-    return safe
+    return {**STDLIB, **_sandbox_overrides()}
 
 
 # ── Built-in Functions ───────────────────────────────────────
@@ -154,49 +175,61 @@ def _builtin_len(obj):
     return len(obj)
 
 
+# MOL type names for type_of(). Identifier-like string literals are interned
+# by CPython at compile time, so these already compare by identity.
+_TYPE_NAMES = {
+    int: "Number",
+    float: "Number",
+    str: "Text",
+    bool: "Bool",
+    list: "List",
+    dict: "Map",
+    Thought: "Thought",
+    Memory: "Memory",
+    Node: "Node",
+    Stream: "Stream",
+    Vector: "Vector",
+    QuantizedVector: "QuantizedVector",
+    VectorIndex: "VectorIndex",
+    EncryptedValue: "Encrypted",
+    EncryptedVector: "EncryptedVector",
+    EncryptedMemory: "EncryptedMemory",
+    CryptoKeyPair: "CryptoKeyPair",
+    SwarmCluster: "SwarmCluster",
+}
+
+# Class tuples for the isinstance checks below, built once at import rather
+# than from global loads on every call.
+_REPR_TYPES = (Thought, Memory, Node, Stream, Vector, EncryptedValue, SwarmCluster)
+_DICT_TYPES = (Thought, Memory, Node, Stream)
+_CONTENT_TYPES = (Thought, Document, Chunk)
+
+
 def _builtin_type_of(obj):
-    # Check for MOLStructInstance first (imported lazily to avoid circular import)
-    if hasattr(obj, '_struct_def') and hasattr(obj._struct_def, 'name'):
-        return obj._struct_def.name
-    type_map = {
-        int: "Number",
-        float: "Number",
-        str: "Text",
-        bool: "Bool",
-        list: "List",
-        dict: "Map",
-        Thought: "Thought",
-        Memory: "Memory",
-        Node: "Node",
-        Stream: "Stream",
-        Vector: "Vector",
-        QuantizedVector: "QuantizedVector",
-        VectorIndex: "VectorIndex",
-        EncryptedValue: "Encrypted",
-        EncryptedVector: "EncryptedVector",
-        EncryptedMemory: "EncryptedMemory",
-        CryptoKeyPair: "CryptoKeyPair",
-        SwarmCluster: "SwarmCluster",
-    }
-    return type_map.get(type(obj), type(obj).__name__)
+    name = _TYPE_NAMES.get(type(obj))
+    if name is not None:
+        return name
+    # MOLStructInstance is duck-typed (importing it would be circular)
+    struct_def = getattr(obj, "_struct_def", None)
+    if struct_def is not None and hasattr(struct_def, "name"):
+        return struct_def.name
+    return type(obj).__name__
 
 
 def _builtin_to_text(obj):
-    if isinstance(obj, (Thought, Memory, Node, Stream)):
-        return obj.mol_repr()
-    if isinstance(obj, Vector):
-        return obj.mol_repr()
-    if isinstance(obj, EncryptedValue):
-        return obj.mol_repr()
-    if isinstance(obj, SwarmCluster):
+    if type(obj) is str:
+        return obj
+    if isinstance(obj, _REPR_TYPES):
         return obj.mol_repr()
     return str(obj)
 
 
 def _builtin_to_number(obj):
+    if type(obj) is int:
+        return obj  # also keeps ints beyond float precision exact
     try:
         v = float(obj)
-        return int(v) if v == int(v) else v
+        return int(v) if v.is_integer() else v
     except (ValueError, TypeError):
         raise MOLTypeError(f"Cannot convert '{obj}' to Number")
 
@@ -263,10 +296,12 @@ def _builtin_contains(collection, item):
 
 
 def _builtin_join(lst, sep=" "):
-    return sep.join(str(x) for x in lst)
+    return sep.join(map(str, lst))
 
 
-def _builtin_split(text, sep=" "):
+def _builtin_split(text, sep=None):
+    if sep is None:
+        return text.split()  # Runs of whitespace, no empty tokens
     if sep == "":
         return list(text)  # Split into individual characters
     return text.split(sep)
@@ -308,10 +343,16 @@ def _builtin_wait(seconds):
     return None
 
 
-def _builtin_to_json(obj):
-    if isinstance(obj, (Thought, Memory, Node, Stream)):
-        return json.dumps(obj.to_dict(), indent=2)
-    return json.dumps(obj, indent=2)
+_json_compact = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _builtin_to_json(obj, pretty=True):
+    if isinstance(obj, _DICT_TYPES):
+        obj = obj.to_dict()
+    if pretty:
+        return json.dumps(obj, indent=2)
+    # compact: no indentation bookkeeping, encoder built once
+    return _json_compact(obj)
 
 
 def _builtin_from_json(text):
@@ -338,8 +379,7 @@ def _create_stream(name=""):
 
 def _builtin_inspect(obj):
     """Deep-inspect any MOL object."""
-    if isinstance(obj, (Thought, Memory, Node, Stream,
-                        Document, Chunk, Embedding, VectorStore)):
+    if isinstance(obj, MolObject):
         return obj.to_dict()
     return {"type": type(obj).__name__, "value": obj}
 
@@ -375,27 +415,28 @@ def _builtin_chunk(data, size=512):
         raise MOLTypeError(
             f"chunk() expects Text or Document, got {type(data).__name__}"
         )
+    # Chunks hold whole words joined by single spaces: normalize once, then
+    # cut the normalized text at the last space that keeps a chunk within
+    # size - 1 characters (a lone overlong word becomes its own chunk).
+    text = " ".join(text.split())
+    size = max(int(size), 1)
+    n = len(text)
     chunks = []
-    words = text.split()
-    current = []
-    current_len = 0
-    for word in words:
-        if current_len + len(word) + 1 > int(size) and current:
-            chunks.append(Chunk(
-                content=" ".join(current),
-                index=len(chunks),
-                source=source,
-            ))
-            current = []
-            current_len = 0
-        current.append(word)
-        current_len += len(word) + 1
-    if current:
-        chunks.append(Chunk(
-            content=" ".join(current),
-            index=len(chunks),
-            source=source,
-        ))
+    append = chunks.append
+    start = index = 0
+    while start < n:
+        limit = start + size - 1
+        if limit >= n:
+            end = n
+        else:
+            end = text.rfind(" ", start, limit + 1)
+            if end == -1:
+                end = text.find(" ", start)
+                if end == -1:
+                    end = n
+        append(Chunk(content=text[start:end], index=index, source=source))
+        index += 1
+        start = end + 1
     return chunks
 
 
@@ -408,10 +449,11 @@ def _builtin_embed(data, model="mol-sim-v1"):
     if isinstance(data, Document):
         return Embedding(text=data.content, model=str(model))
     if isinstance(data, list):
+        model = str(model)
         return [
             Embedding(
                 text=c.content if isinstance(c, Chunk) else str(c),
-                model=str(model),
+                model=model,
             )
             for c in data
         ]
@@ -423,9 +465,9 @@ def _builtin_embed(data, model="mol-sim-v1"):
 def _builtin_store(data, name="default"):
     """Store embeddings in a named VectorStore."""
     name = str(name)
-    if name not in _VECTOR_STORES:
-        _VECTOR_STORES[name] = VectorStore(name=name)
-    vs = _VECTOR_STORES[name]
+    vs = _VECTOR_STORES.get(name)
+    if vs is None:
+        vs = _VECTOR_STORES[name] = VectorStore(name=name)
 
     if isinstance(data, Embedding):
         vs.add(data, text=data.text)
@@ -440,11 +482,14 @@ def _builtin_store(data, name="default"):
 
 
 def _builtin_retrieve(query, store_name="default", top_k=3):
-    """Retrieve most similar entries from a VectorStore."""
-    store_name = str(store_name)
-    if store_name not in _VECTOR_STORES:
-        raise MOLTypeError(f"Vector store '{store_name}' not found")
-    vs = _VECTOR_STORES[store_name]
+    """Retrieve most similar entries from a VectorStore, given by name or as
+    the handle store() returned."""
+    if isinstance(store_name, VectorStore):
+        vs = store_name
+    else:
+        vs = _VECTOR_STORES.get(str(store_name))
+        if vs is None:
+            raise MOLTypeError(f"Vector store '{store_name}' not found")
     query_str = query if isinstance(query, str) else str(query)
     query_emb = Embedding(text=query_str)
     return vs.search(query_emb, int(top_k))
@@ -453,31 +498,39 @@ def _builtin_retrieve(query, store_name="default", top_k=3):
 def _builtin_cosine_sim(a, b):
     """Cosine similarity between two Embeddings or two lists."""
     if isinstance(a, Embedding):
+        if isinstance(b, Embedding):
+            return round(sum(map(operator.mul, a._unit_vector, b._unit_vector)), 4)
         a = a.vector
     if isinstance(b, Embedding):
         b = b.vector
-    dot = sum(x * y for x, y in zip(a, b))
-    norm_a = sum(x * x for x in a) ** 0.5
-    norm_b = sum(x * x for x in b) ** 0.5
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return round(dot / (norm_a * norm_b), 4)
+    return round(cosine_similarity(a, b), 4)
+
+
+# think() confidence is min(0.95, 0.5 + len / 1000): saturated from 450 chars.
+_THINK_CONFIDENCE_CAP_LEN = 450
 
 
 def _builtin_think(data, prompt=""):
     """Cognitive processing — synthesize a Thought from data."""
     if isinstance(data, list):
+        # Only the first 200 characters and the length up to the confidence
+        # cap (450) matter, so stop collecting parts once past the cap.
         parts = []
+        length = -1
         for item in data:
             if isinstance(item, dict) and "text" in item:
-                parts.append(str(item["text"]))
+                part = str(item["text"])
             elif isinstance(item, dict) and "chunk" in item:
                 c = item["chunk"]
-                parts.append(c.content if isinstance(c, Chunk) else str(c))
+                part = c.content if isinstance(c, Chunk) else str(c)
             elif isinstance(item, Chunk):
-                parts.append(item.content)
+                part = item.content
             else:
-                parts.append(str(item))
+                part = str(item)
+            parts.append(part)
+            length += len(part) + 1
+            if length >= _THINK_CONFIDENCE_CAP_LEN:
+                break
         context = " ".join(parts)
     elif isinstance(data, Document):
         context = data.content
@@ -504,9 +557,15 @@ def _builtin_recall(key_or_mem):
     return key_or_mem
 
 
+@functools.lru_cache(maxsize=256)
+def _category_words(category):
+    """Lower-cased keywords of a classify() category; categories repeat across calls."""
+    return tuple(category.lower().split())
+
+
 def _builtin_classify(text, *categories):
     """Classify text into categories (simulated keyword matching)."""
-    if isinstance(text, (Thought, Document, Chunk)):
+    if isinstance(text, _CONTENT_TYPES):
         text_str = text.content if hasattr(text, "content") else str(text)
     else:
         text_str = str(text)
@@ -514,9 +573,8 @@ def _builtin_classify(text, *categories):
     scores = {}
     for cat in categories:
         cat_str = str(cat)
-        cat_words = cat_str.lower().split()
-        score = sum(1 for w in cat_words if w in text_lower)
-        scores[cat_str] = score
+        # substring match on purpose: "sport" also scores "sports,"
+        scores[cat_str] = sum(w in text_lower for w in _category_words(cat_str))
     if scores:
         best = max(scores, key=scores.get)
         return {"label": best, "scores": scores}
@@ -525,25 +583,23 @@ def _builtin_classify(text, *categories):
 
 def _builtin_summarize(text, max_len=100):
     """Summarize text (truncate to sentence boundary)."""
-    if isinstance(text, (Document, Thought, Chunk)):
+    if isinstance(text, _CONTENT_TYPES):
         text = text.content if hasattr(text, "content") else str(text)
     elif isinstance(text, list):
-        text = " ".join(str(t) for t in text)
+        text = " ".join(map(str, text))
     text = str(text)
     max_len = int(max_len)
     if len(text) <= max_len:
         return text
-    truncated = text[:max_len]
-    last_period = truncated.rfind(".")
+    last_period = text.rfind(".", 0, max_len)
     if last_period > max_len * 0.5:
-        return truncated[:last_period + 1]
-    return truncated + "..."
+        return text[:last_period + 1]
+    return text[:max_len] + "..."
 
 
 def _builtin_display(value):
     """Print value and pass it through (for use in pipes)."""
-    if isinstance(value, (Thought, Memory, Node, Stream,
-                          Document, Chunk, Embedding, VectorStore)):
+    if isinstance(value, MolObject):
         print(value.mol_repr())
     else:
         print(value)
@@ -656,7 +712,12 @@ class MOLTask:
 class MOLChannel:
     """Thread-safe channel for inter-task communication."""
     def __init__(self, capacity=0):
-        self._queue = _queue.Queue(maxsize=capacity)
+        # Unbounded channels (the default) use the C-implemented SimpleQueue;
+        # only bounded ones need Queue's blocking put.
+        if capacity > 0:
+            self._queue = _queue.Queue(maxsize=capacity)
+        else:
+            self._queue = _queue.SimpleQueue()
 
     def send(self, value):
         self._queue.put(value)
@@ -680,7 +741,8 @@ class MOLChannel:
 
 
 # Global thread pool shared by all spawn calls
-_THREAD_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="mol-spawn")
+_THREAD_POOL_WORKERS = 32
+_THREAD_POOL = ThreadPoolExecutor(max_workers=_THREAD_POOL_WORKERS, thread_name_prefix="mol-spawn")
 
 
 def _builtin_channel(capacity=0):
@@ -706,7 +768,6 @@ def _builtin_receive(ch, timeout=None):
 
 def _builtin_sleep(ms):
     """Sleep for the given number of milliseconds."""
-    import time
     time.sleep(float(ms) / 1000.0)
     return None
 
@@ -717,8 +778,25 @@ def _builtin_parallel(items, func):
         raise MOLTypeError("parallel() expects a list as first argument")
     if not callable(func):
         raise MOLTypeError("parallel() expects a function as second argument")
-    futures = [_THREAD_POOL.submit(func, item) for item in items]
-    return [f.result() for f in futures]
+    n = len(items)
+    if n <= _THREAD_POOL_WORKERS:
+        futures = [_THREAD_POOL.submit(func, item) for item in items]
+        return [f.result() for f in futures]
+    # One future per contiguous shard rather than per item, so submission
+    # cost stays flat while every worker still gets work.
+    size = -(-n // _THREAD_POOL_WORKERS)
+    futures = [
+        _THREAD_POOL.submit(_map_shard, func, items[i:i + size])
+        for i in range(0, n, size)
+    ]
+    results = []
+    for f in futures:
+        results.extend(f.result())
+    return results
+
+
+def _map_shard(func, shard):
+    return [func(item) for item in shard]
 
 
 def _builtin_race(*args):
@@ -760,6 +838,16 @@ def _builtin_task_done(task):
 
 # ── Algorithms & Functional Programming (v0.3.0) ─────────────
 
+def _property_values(lst, key):
+    """Value of property `key` on each dict/struct (null when missing)."""
+    try:
+        # all-Map lists (the common case): unbound dict.get mapped in C; it
+        # raises TypeError on the first non-dict, which takes the slow path
+        return list(map(dict.get, lst, itertools.repeat(key)))
+    except TypeError:
+        return [item.get(key, None) if isinstance(item, dict) else getattr(item, key, None) for item in lst]
+
+
 def _builtin_map(lst, func):
     """Apply function to each element: map([1,2,3], double) → [2,4,6]
     Smart mode: map(users, "name") → extracts the 'name' field from each dict/struct."""
@@ -767,8 +855,7 @@ def _builtin_map(lst, func):
         return [func(item) for item in lst]
     # Smart mode: string → property extraction
     if isinstance(func, str):
-        key = func
-        return [item.get(key, None) if isinstance(item, dict) else getattr(item, key, None) for item in lst]
+        return _property_values(lst, func)
     raise MOLTypeError(
         f"map requires a function or property name, got {type(func).__name__}.\n"
         f"  Hint: use a lambda → map(fn(x) -> x * 2)\n"
@@ -822,25 +909,52 @@ def _builtin_flatten(lst):
                 _flatten(item)
             else:
                 result.append(item)
-    _flatten(lst)
+    try:
+        _flatten(lst)
+    except RecursionError:
+        # Recursion is the faster walk on CPython 3.11+; only nesting deeper
+        # than the recursion limit needs the explicit iterator stack.
+        return _flatten_iterative(lst)
+    return result
+
+
+def _flatten_iterative(lst):
+    result = []
+    stack = [iter(lst)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
+            result.append(item)
+        else:
+            stack.pop()
     return result
 
 
 def _builtin_unique(lst):
     """Remove duplicates preserving order: unique([1,2,2,3,1]) → [1,2,3]"""
     seen = set()
+    seen_unhashable = set()  # repr() keys for lists/maps
     result = []
     for item in lst:
-        key = str(item)
-        if key not in seen:
+        try:
+            key = (type(item) is bool, item)  # true/false are not 1/0
+            if key in seen:
+                continue
             seen.add(key)
-            result.append(item)
+        except TypeError:
+            key = repr(item)
+            if key in seen_unhashable:
+                continue
+            seen_unhashable.add(key)
+        result.append(item)
     return result
 
 
 def _builtin_zip(a, b):
     """Pair elements: zip([1,2,3], ["a","b","c"]) → [[1,"a"],[2,"b"],[3,"c"]]"""
-    return [list(pair) for pair in zip(a, b)]
+    return list(map(list, zip(a, b)))
 
 
 def _builtin_enumerate(lst):
@@ -886,30 +1000,40 @@ def _builtin_drop(lst, n):
     return lst[int(n):]
 
 
+def _group_buckets(pairs):
+    """Bucket (key, item) pairs by key without folding true/false into 1/0.
+    Keys keep their value; only when a boolean and an equal number both
+    occur does the boolean bucket get its text key ("true"/"false")."""
+    tagged = collections.defaultdict(list)
+    for key, item in pairs:
+        try:
+            tagged[(type(key) is bool, key)].append(item)
+        except TypeError:  # unhashable key (List/Map): group by its text
+            tagged[(False, repr(key))].append(item)
+    groups = {}
+    for (is_bool, key), items in tagged.items():
+        if is_bool and (False, key) in tagged:
+            key = "true" if key else "false"
+        groups[key] = items
+    return groups
+
+
 def _builtin_group_by(lst, func):
     """Group elements by function result: group_by([1,2,3,4], is_even) → {true:[2,4], false:[1,3]}
-    Smart mode: group_by(users, "role") → groups by the 'role' property."""
+    Smart mode: group_by(users, "role") → groups by the 'role' property.
+    A boolean key that collides with an equal number (true/1, false/0) is
+    keyed as "true"/"false" so the two groups stay apart."""
     if isinstance(func, str):
         key = func
-        groups = {}
-        for item in lst:
-            val = str(item.get(key, None) if isinstance(item, dict) else getattr(item, key, None))
-            if val not in groups:
-                groups[val] = []
-            groups[val].append(item)
-        return groups
+        return _group_buckets(
+            (item.get(key, None) if isinstance(item, dict) else getattr(item, key, None), item)
+            for item in lst)
     if not callable(func):
         raise MOLTypeError(
             f"group_by requires a function or property name, got {type(func).__name__}.\n"
             f"  Hint: group_by(fn(x) -> x > 10) or group_by(\"category\")"
         )
-    groups = {}
-    for item in lst:
-        key = str(func(item))
-        if key not in groups:
-            groups[key] = []
-        groups[key].append(item)
-    return groups
+    return _group_buckets((func(item), item) for item in lst)
 
 
 def _builtin_chunk_list(lst, size):
@@ -961,7 +1085,7 @@ def _builtin_reject(lst, func):
 def _builtin_pluck(lst, key):
     """Extract a single property from each dict/struct: pluck(users, "name") → ["Alice","Bob"]"""
     if isinstance(key, str):
-        return [item.get(key, None) if isinstance(item, dict) else getattr(item, key, None) for item in lst]
+        return _property_values(lst, key)
     raise MOLTypeError(
         f"pluck requires a property name (string), got {type(key).__name__}.\n"
         f"  Hint: pluck(\"name\")"
@@ -1065,14 +1189,26 @@ def _builtin_pow(base, exp):
 
 
 def _builtin_clamp(value, lo, hi):
-    """Clamp value to range: clamp(15, 0, 10) → 10"""
-    return max(float(lo), min(float(hi), float(value)))
+    """Clamp value to range: clamp(15, 0, 10) → 10
+
+    A list is clamped elementwise in one call: clamp([-1, 5, 20], 0, 10) → [0, 5, 10]
+    """
+    lo, hi = float(lo), float(hi)
+    if isinstance(value, list):
+        return [max(lo, min(hi, float(v))) for v in value]
+    return max(lo, min(hi, float(value)))
 
 
 def _builtin_lerp(a, b, t):
-    """Linear interpolation: lerp(0, 100, 0.5) → 50"""
-    a, b, t = float(a), float(b), float(t)
-    return a + (b - a) * t
+    """Linear interpolation: lerp(0, 100, 0.5) → 50
+
+    A list of t values is interpolated in one call: lerp(0, 10, [0, 0.5]) → [0, 5]
+    """
+    a, b = float(a), float(b)
+    span = b - a
+    if isinstance(t, list):
+        return [a + span * float(x) for x in t]
+    return a + span * float(t)
 
 
 def _builtin_mean(lst):
@@ -1097,8 +1233,7 @@ def _builtin_variance(lst):
 
 def _builtin_percentile(lst, p):
     """Percentile: percentile([1,2,3,4,5,6,7,8,9,10], 90) → 9.1"""
-    import bisect
-    sorted_lst = sorted([float(x) for x in lst])
+    sorted_lst = sorted(map(float, lst))
     k = (float(p) / 100.0) * (len(sorted_lst) - 1)
     f = math.floor(k)
     c = math.ceil(k)
@@ -1155,37 +1290,33 @@ def _builtin_format(template, *args):
 
 # ── Hashing & Encoding ───────────────────────────────────────
 
+_HASH_CTORS = {
+    "sha256": hashlib.sha256,
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha512": hashlib.sha512,
+}
+
+
 def _builtin_hash(text, algo="sha256"):
     """Hash text: hash("hello") → "2cf24dba..." """
-    algo = str(algo).lower()
-    data = str(text).encode("utf-8")
-    if algo == "sha256":
-        return hashlib.sha256(data).hexdigest()
-    elif algo == "md5":
-        return hashlib.md5(data).hexdigest()
-    elif algo == "sha1":
-        return hashlib.sha1(data).hexdigest()
-    elif algo == "sha512":
-        return hashlib.sha512(data).hexdigest()
-    return hashlib.sha256(data).hexdigest()
+    ctor = _HASH_CTORS.get(str(algo).lower(), hashlib.sha256)
+    return ctor(str(text).encode("utf-8")).hexdigest()
 
 
 def _builtin_uuid():
     """Generate UUID v4: uuid() → "a1b2c3d4-..." """
-    import uuid
     return str(uuid.uuid4())
 
 
 def _builtin_base64_encode(text):
     """Base64 encode: base64_encode("hello") → "aGVsbG8=" """
-    import base64
-    return base64.b64encode(str(text).encode("utf-8")).decode("ascii")
+    return binascii.b2a_base64(str(text).encode("utf-8"), newline=False).decode("ascii")
 
 
 def _builtin_base64_decode(text):
     """Base64 decode: base64_decode("aGVsbG8=") → "hello" """
-    import base64
-    return base64.b64decode(str(text)).decode("utf-8")
+    return binascii.a2b_base64(str(text)).decode("utf-8")
 
 
 # ── Sorting Algorithms ───────────────────────────────────────
@@ -1209,10 +1340,13 @@ def _builtin_sort_desc(lst):
     return sorted(lst, reverse=True)
 
 
-def _builtin_binary_search(lst, target):
-    """Binary search on sorted list: binary_search([1,2,3,4,5], 3) → 2"""
-    import bisect
-    sorted_lst = sorted(lst)
+def _builtin_binary_search(lst, target, assume_sorted=False):
+    """Binary search on sorted list: binary_search([1,2,3,4,5], 3) → 2
+
+    Pass assume_sorted=true for a list already in order (e.g. from sort) to
+    skip the defensive O(N log N) re-sort and search in O(log N).
+    """
+    sorted_lst = lst if assume_sorted else sorted(lst)
     i = bisect.bisect_left(sorted_lst, target)
     if i < len(sorted_lst) and sorted_lst[i] == target:
         return i
@@ -1587,13 +1721,11 @@ def _builtin_serve(port, handler):
 
 def _builtin_json_parse(text):
     """Parse a JSON string into a MOL value."""
-    import json as _j
-    return _j.loads(text)
+    return json.loads(text)
 
 
 def _builtin_json_stringify(value):
     """Convert a MOL value to a JSON string."""
-    import json as _j
 
     def _convert(v):
         if v is None:
@@ -1608,7 +1740,7 @@ def _builtin_json_stringify(value):
             return {k: _convert(val) for k, val in v._fields.items()}
         return str(v)
 
-    return _j.dumps(_convert(value))
+    return json.dumps(_convert(value))
 
 
 # ── Standard Library Registry ────────────────────────────────
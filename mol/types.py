@@ -8,6 +8,11 @@ These are first-class citizens in MOL — not just strings and integers.
 v2.0.0 additions: Vector, Encrypted, SwarmCluster as primitive types.
 """
 
+import functools
+import hashlib
+import heapq
+import math
+import operator
 import time
 import uuid
 
@@ -22,6 +27,24 @@ from mol.encryption import (
 from mol.swarm_runtime import SwarmCluster
 
 
+def cosine_similarity(a, b) -> float:
+    """Cosine similarity of two number sequences; 0.0 if either has zero norm.
+
+    Uses map/hypot so the per-element loops run in C rather than in
+    generator frames.
+    """
+    norm = math.hypot(*a) * math.hypot(*b)
+    if norm == 0:
+        return 0.0
+    return sum(map(operator.mul, a, b)) / norm
+
+
+def _unit(vec):
+    """L2-normalized copy of vec (a zero vector stays zero)."""
+    norm = math.hypot(*vec)
+    return [x / norm for x in vec] if norm else list(vec)
+
+
 class MolObject:
     """Base class for all MOL domain objects."""
 
@@ -251,6 +274,19 @@ class Chunk(MolObject):
         }
 
 
+@functools.lru_cache(maxsize=10_000)
+def _hash_vector(h, dimensions):
+    """Normalized vector from a sha256 hex digest; pipelines re-embed the same chunks.
+    Keyed on the 64-char digest so the cache never pins whole documents."""
+    vec = []
+    for i in range(dimensions):
+        idx = (i * 2) % len(h)
+        val = int(h[idx:idx + 2], 16) / 255.0
+        vec.append(val)
+    norm = sum(v * v for v in vec) ** 0.5
+    return tuple(v / norm for v in vec) if norm > 0 else tuple(vec)
+
+
 class Embedding(MolObject):
     """
     A vector embedding of text. Uses deterministic hash-based simulation
@@ -262,19 +298,21 @@ class Embedding(MolObject):
         self.text = text[:80]
         self.model = model
         self.dimensions = 64
-        self.vector = self._hash_embed(text)
+        # only the digest is kept, so long source texts are not held alive
+        self._digest = hashlib.sha256(text.encode()).hexdigest()
 
-    def _hash_embed(self, text):
+    @functools.cached_property
+    def vector(self):
         """Deterministic pseudo-embedding from text hash — same text = same vector."""
-        import hashlib
-        h = hashlib.sha256(text.encode()).hexdigest()
-        vec = []
-        for i in range(self.dimensions):
-            idx = (i * 2) % len(h)
-            val = int(h[idx:idx + 2], 16) / 255.0
-            vec.append(val)
-        norm = sum(v * v for v in vec) ** 0.5
-        return [v / norm for v in vec] if norm > 0 else vec
+        # computed on first use: embed() results that are only displayed or
+        # passed along never pay for the vector; cached as a tuple, each
+        # Embedding gets its own list
+        return list(_hash_vector(self._digest, self.dimensions))
+
+    @functools.cached_property
+    def _unit_vector(self):
+        # normalized once, shared by cosine_sim() and VectorStore
+        return _unit(self.vector)
 
     def mol_repr(self):
         return f'<Embedding:{self._id} dim={self.dimensions} model="{self.model}">'
@@ -288,16 +326,35 @@ class Embedding(MolObject):
         }
 
 
+def _build_ann_index(vectors):
+    """hnswlib inner-product index over unit vectors; None without hnswlib."""
+    try:
+        import hnswlib
+    except ImportError:
+        return None
+    index = hnswlib.Index(space="ip", dim=len(vectors[0]))
+    index.init_index(max_elements=2 * len(vectors), ef_construction=200, M=16)
+    index.add_items(vectors, list(range(len(vectors))))
+    return index
+
+
 class VectorStore(MolObject):
     """
     In-memory vector store for embeddings. Supports add + similarity search.
     (Plugs into FAISS/Milvus in v0.4+.)
+
+    Search is an exact scan; once a store reaches ANN_THRESHOLD vectors and
+    hnswlib is installed, it switches to an approximate HNSW index.
     """
 
+    ANN_THRESHOLD = 1024
+
     def __init__(self, name="default"):
         super().__init__()
         self.name = name
         self.entries: list[dict] = []
+        self._unit_vectors: list[list] = []   # parallel to entries
+        self._ann = None
 
     def add(self, embedding, chunk=None, text=""):
         self.entries.append({
@@ -305,27 +362,41 @@ class VectorStore(MolObject):
             "chunk": chunk,
             "text": text,
         })
+        vec = embedding._unit_vector
+        self._unit_vectors.append(vec)
+        n = len(self._unit_vectors)
+        if self._ann is not None:
+            if self._ann.get_current_count() == self._ann.get_max_elements():
+                self._ann.resize_index(2 * n)
+            self._ann.add_items([vec], [n - 1])
+        elif n == self.ANN_THRESHOLD:
+            self._ann = _build_ann_index(self._unit_vectors)
 
     def search(self, query_emb, top_k=3):
-        results = []
-        for entry in self.entries:
-            sim = self._cosine_sim(query_emb.vector, entry["embedding"].vector)
-            results.append({
-                "chunk": entry.get("chunk"),
-                "text": entry.get("text", ""),
-                "score": round(sim, 4),
-            })
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:top_k]
-
-    @staticmethod
-    def _cosine_sim(a, b):
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = sum(x * x for x in a) ** 0.5
-        norm_b = sum(x * x for x in b) ** 0.5
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot / (norm_a * norm_b)
+        # Stored vectors are normalized on add, so cosine is a plain dot product.
+        q = query_emb._unit_vector
+        if self._ann is not None:
+            k = min(top_k, len(self._unit_vectors))
+            if k <= 0:
+                return []
+            self._ann.set_ef(max(50, k))
+            labels, distances = self._ann.knn_query([q], k=k)
+            hits = [(int(i), 1.0 - float(d)) for i, d in zip(labels[0], distances[0])]
+        else:
+            mul = operator.mul
+            # rank on raw scores; only the k results returned get rounded
+            scores = [sum(map(mul, q, v)) for v in self._unit_vectors]
+            best = heapq.nlargest(top_k, range(len(scores)), key=scores.__getitem__)
+            hits = [(i, scores[i]) for i in best]
+        entries = self.entries
+        return [
+            {
+                "chunk": entries[i].get("chunk"),
+                "text": entries[i].get("text", ""),
+                "score": round(score, 4),
+            }
+            for i, score in hits
+        ]
 
     def mol_repr(self):
         return f'<VectorStore:{self._id} "{self.name}" {len(self.entries)} vectors>'
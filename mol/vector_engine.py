@@ -25,8 +25,10 @@ MOL syntax:
   let result be vec_batch_sim(query, db) -- batch similarity
 """
 
+import heapq
 import math
 import hashlib
+import operator
 import struct
 import array
 from dataclasses import dataclass, field
@@ -82,7 +84,7 @@ class Vector:
     def dot(self, other: 'Vector') -> float:
         """Dot product — the fundamental vector operation."""
         self._check_dim(other)
-        return sum(a * b for a, b in zip(self._data, other._data))
+        return sum(map(operator.mul, self._data, other._data))
 
     def cosine_similarity(self, other: 'Vector') -> float:
         """Cosine similarity — key for De-RAG retrieval."""
@@ -106,7 +108,7 @@ class Vector:
     def norm(self) -> float:
         """L2 norm (magnitude)."""
         if self._norm_cache is None:
-            self._norm_cache = math.sqrt(sum(x * x for x in self._data))
+            self._norm_cache = math.hypot(*self._data)
         return self._norm_cache
 
     def normalize(self) -> 'Vector':
@@ -182,21 +184,23 @@ class Vector:
         my_norm = self.norm()
         if my_norm == 0:
             return [0.0] * len(vectors)
+        mul = operator.mul
+        data = self._data
         results = []
         for v in vectors:
-            d = self.dot(v)
-            vn = v.norm()
-            results.append(d / (my_norm * vn) if vn > 0 else 0.0)
+            self._check_dim(v)
+            vn = v.norm()  # cached per Vector
+            results.append(sum(map(mul, data, v._data)) / (my_norm * vn) if vn > 0 else 0.0)
         return results
 
     def top_k(self, vectors: List['Vector'], k: int = 5,
               labels: List[str] = None) -> List[dict]:
         """Find k most similar vectors — core De-RAG operation."""
         sims = self.batch_cosine(vectors)
-        indexed = list(enumerate(sims))
-        indexed.sort(key=lambda x: x[1], reverse=True)
+        best = heapq.nlargest(k, range(len(sims)), key=sims.__getitem__)
         results = []
-        for rank, (idx, score) in enumerate(indexed[:k]):
+        for rank, idx in enumerate(best):
+            score = sims[idx]
             entry = {"rank": rank, "index": idx, "score": round(score, 6)}
             if labels and idx < len(labels):
                 entry["label"] = labels[idx]
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Generate mol/_standalone_parser.py from mol/grammar.lark
+=========================================================
+
+The generated module is a self-contained LALR parser (Lark standalone),
+so `mol.parser` can start without building parse tables or importing lark.
+Re-run this after every grammar change:
+
+    python scripts/gen_standalone_parser.py
+
+A stale module is detected by its GRAMMAR_SHA1 and ignored at import time.
+"""
+
+import hashlib
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+GRAMMAR = ROOT / "mol" / "grammar.lark"
+OUT = ROOT / "mol" / "_standalone_parser.py"
+
+
+def main():
+    result = subprocess.run(
+        [sys.executable, "-m", "lark.tools.standalone",
+         "--compress", "--maybe_placeholders",
+         # keep in sync with mol.parser._START
+         "--start", "start", "--start", "expr",
+         str(GRAMMAR)],
+        capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        return result.returncode
+
+    digest = hashlib.sha1(GRAMMAR.read_bytes()).hexdigest()
+    OUT.write_text(
+        "# Generated by scripts/gen_standalone_parser.py — do not edit.\n"
+        + result.stdout
+        + f'\nGRAMMAR_SHA1 = "{digest}"\n',
+        encoding="utf-8",
+    )
+    print(f"Wrote {OUT.relative_to(ROOT)} (grammar sha1 {digest[:12]})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -63,6 +63,21 @@ end
     assert interp.output == ["0", "1", "2"]
 
 
+def test_for_range_respects_shadowing():
+    interp = run("""
+for i in range(1, 7, 2) do
+  show to_text(i)
+end
+define range(n)
+  return ["mine"]
+end
+for j in range(3) do
+  show j
+end
+""")
+    assert interp.output == ["1", "3", "5", "mine"]
+
+
 def test_while_loop():
     interp = run("""
 let count be 0
@@ -97,6 +112,16 @@ show to_text(fact(5))
     assert "120" in interp.output
 
 
+def test_to_number_and_float_display():
+    interp = run("""
+show to_text(to_number("42.0"))
+show to_text(to_number("2.5"))
+show to_text(to_number("inf"))
+show to_text(6 / 2)
+""")
+    assert interp.output == ["42", "2.5", "inf", "3"]
+
+
 def test_lists():
     interp = run("""
 let nums be [1, 2, 3]
@@ -380,6 +405,13 @@ show to_text(len(chunks))
     assert any(int(o) >= 2 for o in interp.output if o.isdigit())
 
 
+def test_chunk_word_boundaries():
+    from mol.stdlib import _builtin_chunk
+    chunks = _builtin_chunk("aa bb  cc\ndd overlongword ee", 6)
+    assert [c.content for c in chunks] == ["aa bb", "cc dd", "overlongword", "ee"]
+    assert [c.index for c in chunks] == [0, 1, 2, 3]
+
+
 def test_embed_function():
     """Embedding text produces an Embedding object"""
     interp = run("""
@@ -399,6 +431,30 @@ show to_text(cosine_sim(a, b))
     assert "1.0" in interp.output
 
 
+def test_embedding_vectors_cached_but_not_shared():
+    from mol.types import Embedding
+    a, b = Embedding("same text"), Embedding("same text")
+    assert a.vector == b.vector
+    assert a.vector is not b.vector
+    assert a._id != b._id
+
+
+def test_cosine_sim_lists():
+    interp = run("""
+show to_text(cosine_sim([1, 2, 3], [2, 4, 6]))
+show to_text(cosine_sim([1, 0], [0, 1]))
+show to_text(cosine_sim([0, 0], [1, 1]))
+""")
+    assert interp.output == ["1.0", "0.0", "0.0"]
+
+
+def test_classify_keyword_scores():
+    from mol.stdlib import _builtin_classify
+    result = _builtin_classify("Sports news: football tonight", "sport football", "cooking food")
+    assert result == {"label": "sport football",
+                      "scores": {"sport football": 2, "cooking food": 0}}
+
+
 def test_store_and_retrieve():
     """Store embeddings and retrieve by similarity"""
     interp = run("""
@@ -411,6 +467,15 @@ show to_text(len(results))
     assert "2" in interp.output
 
 
+def test_retrieve_with_store_handle():
+    interp = run("""
+let kb be store(embed(["red apple", "blue sky"]), "handle_store")
+let results be retrieve("blue sky", kb, 1)
+show results[0].text
+""")
+    assert interp.output == ["blue sky"]
+
+
 def test_think_function():
     """Think produces a Thought from input"""
     interp = run("""
@@ -600,8 +665,10 @@ def test_binary_search():
     interp = run("""
 show binary_search([1, 2, 3, 4, 5], 3)
 show binary_search([1, 2, 3, 4, 5], 99)
+show binary_search(sort([5, 3, 1, 4, 2]), 4, true)
+show binary_search([5, 3, 1], 1)
 """)
-    assert interp.output == ["2", "-1"]
+    assert interp.output == ["2", "-1", "3", "0"]
 
 
 def test_random_int():
@@ -773,6 +840,15 @@ show f"{x + 1} items"
 """)
     assert interp.output == ["4 items"]
 
+def test_string_interpolation_repeated_hole():
+    interp = run("""
+let n be 2
+show f"{n} and {n}"
+let n be 5
+show f"{n}!"
+""")
+    assert interp.output == ["2 and 2", "5!"]
+
 def test_destructure_list():
     interp = run("""
 let [a, b, c] be [10, 20, 30]
@@ -1377,6 +1453,28 @@ show helper()
     assert interp.output[0] == "42"
 
 
+# ── Standalone Parser ───────────────────────────────────────
+def test_standalone_parser_matches_grammar():
+    """mol/_standalone_parser.py must be regenerated after grammar edits"""
+    from mol import parser, _standalone_parser
+    assert _standalone_parser.GRAMMAR_SHA1 == parser._GRAMMAR_SHA1
+
+
+def test_parse_without_trailing_newline():
+    from mol.parser import parse
+    ast = parse("if true then\n  show 1\nend")
+    assert len(ast.statements) == 1
+    assert len(parse("show 1 -- done").statements) == 1
+
+
+def test_parse_many_matches_parse():
+    from mol.parser import parse, parse_many
+    sources = ['show f"n = {n}"', "let [a, ...b] be xs", "if x is not 1 then\nshow x\nend"]
+    expected = [parse(s) for s in sources]
+    assert parse_many(sources, max_workers=1) == expected
+    assert parse_many(sources, max_workers=2) == expected
+
+
 # ── Line Tracking ───────────────────────────────────────────
 def test_ast_has_line_info():
     """Verify AST nodes carry line info from parser."""
@@ -2028,6 +2126,481 @@ let result be nums |> where(fn(x) -> x > 4) |> first
     assert interp.global_env.get("result") == 5
 
 
+# ── Package Manager ──────────────────────────────────────────
+
+def test_fetch_package_builtin_skips_registry():
+    from mol import package_manager as pm
+
+    def _no_network():
+        raise AssertionError("registry fetched for a built-in package")
+
+    original = pm.fetch_registry
+    pm.fetch_registry = _no_network
+    try:
+        info = pm.fetch_package("math")
+    finally:
+        pm.fetch_registry = original
+    assert info["name"] == "math"
+    assert info["builtin"] is True
+
+
+def test_builtin_packages_read_only():
+    from mol.package_manager import BUILTIN_PACKAGES, BUILTIN_EXPORT_SETS
+    import pytest
+
+    with pytest.raises(TypeError):
+        BUILTIN_PACKAGES["std"]["version"] = "9.9.9"
+    assert "sin" in BUILTIN_EXPORT_SETS["math"]
+    assert set(BUILTIN_PACKAGES["math"]) == {
+        "name", "version", "description", "author", "builtin", "exports",
+    }
+
+
+def test_use_unknown_builtin_symbol():
+    import pytest
+    with pytest.raises(MOLRuntimeError, match="Symbol 'nope' not found in package 'math'"):
+        run('use "math" : sin, nope')
+
+
+def test_registry_get_retries_transient_errors():
+    from urllib import error
+    from mol import package_manager as pm
+
+    calls = []
+
+    class _Resp:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def read(self):
+            return b'{"packages": {}}'
+
+    def _flaky_urlopen(req, timeout=None):
+        calls.append(timeout)
+        if len(calls) < 3:
+            raise error.URLError(ConnectionResetError("connection reset"))
+        return _Resp()
+
+    original = pm.request.urlopen
+    pm.request.urlopen = _flaky_urlopen
+    try:
+        body = pm._get_with_retry("https://example.invalid/index.json", base_backoff=0)
+    finally:
+        pm.request.urlopen = original
+    assert body == b'{"packages": {}}'
+    assert calls == [10, 5, 10 / 3]  # per-attempt timeouts shrink
+
+
+def test_registry_get_fails_fast_on_permanent_errors():
+    import socket
+    from urllib import error
+    from mol import package_manager as pm
+
+    failures = [
+        error.URLError(socket.gaierror(-2, "Name or service not known")),
+        error.URLError(ConnectionRefusedError(111, "Connection refused")),
+        error.HTTPError("https://example.invalid/", 404, "Not Found", {}, None),
+    ]
+    original = pm.request.urlopen
+    try:
+        for exc in failures:
+            calls = []
+
+            def _failing_urlopen(req, timeout=None, exc=exc):
+                calls.append(timeout)
+                raise exc
+
+            pm.request.urlopen = _failing_urlopen
+            try:
+                pm._get_with_retry("https://example.invalid/index.json", base_backoff=0)
+            except error.URLError:
+                pass
+            else:
+                raise AssertionError("expected the error to propagate")
+            assert len(calls) == 1, exc
+    finally:
+        pm.request.urlopen = original
+
+
+def test_package_exports_names_only():
+    import tempfile
+    from pathlib import Path
+    from mol.package_manager import get_package_exports
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pkg = Path(tmp) / "mol_packages" / "greet"
+        pkg.mkdir(parents=True)
+        (pkg / "main.mol").write_text("""
+define hello(name)
+  return "hi " + name
+end
+let greeting be "hello"
+let [a, _, ...rest] be [1, 2, 3]
+export hello
+""")
+        names = get_package_exports("greet", Path(tmp), names_only=True)
+        full = get_package_exports("greet", Path(tmp))
+    assert names == {"hello": None, "greeting": None, "a": None, "rest": None}
+    assert set(names) == set(full)
+
+
+def test_package_exports_names_only_skips_execution():
+    import tempfile
+    from pathlib import Path
+    from mol.package_manager import get_package_exports
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pkg = Path(tmp) / "mol_packages" / "loud"
+        pkg.mkdir(parents=True)
+        (pkg / "main.mol").write_text('panic("package body must not run")\nlet x be 1\n')
+        assert get_package_exports("loud", Path(tmp), names_only=True) == {"x": None}
+
+
+def test_cmd_list_survives_broken_local_package():
+    import io
+    import os
+    import tempfile
+    from contextlib import redirect_stdout
+    from pathlib import Path
+    from mol.package_manager import cmd_list
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "mol.pkg.json").write_text('{"dependencies": {"math": "^0.4.0"}}')
+        bad_src = Path(tmp) / "mol_packages" / "bad_src"
+        bad_src.mkdir(parents=True)
+        (bad_src / "main.mol").write_text("let be be be\n")
+        bad_meta = Path(tmp) / "mol_packages" / "bad_meta"
+        bad_meta.mkdir()
+        (bad_meta / "mol.pkg.json").write_text("{not json")
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                cmd_list()
+        finally:
+            os.chdir(cwd)
+    out = buf.getvalue()
+    assert "bad_src" in out and "bad_meta" in out
+    assert out.count("? exports") == 2
+
+
+def test_security_context_logs_denials_only_by_default():
+    from mol.stdlib import SecurityContext
+    ctx = SecurityContext()
+    for _ in range(3):
+        ctx.check_access("mind_core")
+    assert not ctx._access_log
+    try:
+        ctx.check_access("secret_vault")
+        assert False, "Should have raised MOLSecurityError"
+    except MOLSecurityError:
+        pass
+    assert [e.resource for e in ctx._access_log] == ["secret_vault"]
+    verbose = SecurityContext(log_grants=True)
+    verbose.check_access("mind_core")
+    assert verbose._access_log[0].granted is True
+    for _ in range(SecurityContext.ACCESS_LOG_SIZE + 10):
+        verbose.check_access("mind_core")
+    assert len(verbose._access_log) == SecurityContext.ACCESS_LOG_SIZE
+
+
+def test_think_long_list_context():
+    from mol.stdlib import _builtin_think
+    thought = _builtin_think(["word"] * 10_000)
+    assert thought.content == " ".join(["word"] * 10_000)[:200]
+    assert thought.confidence == 0.95
+    assert _builtin_think(["a", "b"]).confidence == 0.5
+
+
+def test_embedding_vector_is_lazy():
+    from mol.types import Embedding
+    long_text = "x" * 200
+    emb = Embedding(text=long_text)
+    assert "vector" not in emb.__dict__
+    assert emb.text == long_text[:80]
+    assert long_text not in emb.__dict__.values()
+    assert emb.vector == Embedding(text=long_text).vector
+    assert emb.vector != Embedding(text=long_text[:80]).vector
+    assert emb.vector is emb.vector
+
+
+def test_split_default_whitespace_runs():
+    interp = run('''
+let words be split("  alpha  beta   gamma ")
+let exact be split("a  b", " ")
+''')
+    assert interp.global_env.get("words") == ["alpha", "beta", "gamma"]
+    assert interp.global_env.get("exact") == ["a", "", "b"]
+
+
+def test_to_text_and_to_number_fast_paths():
+    from mol.stdlib import _builtin_to_text, _builtin_to_number
+    assert _builtin_to_text("abc") == "abc"
+    assert _builtin_to_text(3) == "3"
+    big = 2 ** 60 + 1
+    assert _builtin_to_number(big) == big
+    assert _builtin_to_number(True) == 1
+    assert _builtin_to_number(4.0) == 4 and isinstance(_builtin_to_number(4.0), int)
+
+
+def test_hash_algorithms():
+    import hashlib
+    from mol.stdlib import _builtin_hash
+    assert _builtin_hash("hi", "MD5") == hashlib.md5(b"hi").hexdigest()
+    assert _builtin_hash("hi", "sha512") == hashlib.sha512(b"hi").hexdigest()
+    assert _builtin_hash(42, "nope") == hashlib.sha256(b"42").hexdigest()
+    assert _builtin_hash("x", [1]) == hashlib.sha256(b"x").hexdigest()
+    assert _builtin_hash("x", {"a": 1}) == hashlib.sha256(b"x").hexdigest()
+
+
+def test_cosine_sim_embeddings_reuse_unit_vectors():
+    from mol.stdlib import _builtin_cosine_sim
+    from mol.types import Embedding, cosine_similarity
+    a, b = Embedding(text="neural nets"), Embedding(text="graph search")
+    expected = round(cosine_similarity(a.vector, b.vector), 4)
+    assert _builtin_cosine_sim(a, b) == expected
+    assert _builtin_cosine_sim(a, b.vector) == expected
+    assert "_unit_vector" in a.__dict__
+    assert _builtin_cosine_sim(a, a) == 1.0
+
+
+def test_unique_keeps_types_apart():
+    from mol.stdlib import _builtin_unique
+    assert _builtin_unique([1, "1", 1, "1"]) == [1, "1"]
+    assert _builtin_unique([[1, 2], [1, 2], {"a": 1}, {"a": 1}, "[1, 2]"]) == [
+        [1, 2], {"a": 1}, "[1, 2]"]
+    assert _builtin_unique([1, True, 0, False, True]) == [1, True, 0, False]
+
+
+def test_clamp_and_lerp_lists():
+    interp = run("""
+let clamped be clamp([-1, 5, 20], 0, 10)
+let steps be lerp(0, 10, [0, 0.5, 1])
+show clamp(15, 0, 10)
+""")
+    assert interp.global_env.get("clamped") == [0, 5, 10]
+    assert interp.global_env.get("steps") == [0, 5, 10]
+    assert interp.output == ["10"]
+
+
+def test_vector_store_search_past_ann_threshold():
+    from mol.types import Embedding, VectorStore
+    vs = VectorStore()
+    for i in range(VectorStore.ANN_THRESHOLD + 5):
+        vs.add(Embedding(text=f"doc {i}"), text=f"doc {i}")
+    hits = vs.search(Embedding(text="doc 7"), 3)
+    assert len(hits) == 3
+    assert hits[0]["text"] == "doc 7" and hits[0]["score"] == 1.0
+
+
+class _FakeHnswIndex:
+    """Exact inner-product stand-in for hnswlib.Index (distance = 1 - dot)."""
+
+    def __init__(self, space, dim):
+        assert space == "ip"
+        self.dim = dim
+        self.items = {}
+        self.max_elements = 0
+        self.resizes = []
+        self.ef = None
+
+    def init_index(self, max_elements, ef_construction=200, M=16):
+        self.max_elements = max_elements
+
+    def add_items(self, data, ids):
+        assert len(self.items) + len(ids) <= self.max_elements
+        for vec, i in zip(data, ids):
+            self.items[i] = list(vec)
+
+    def get_current_count(self):
+        return len(self.items)
+
+    def get_max_elements(self):
+        return self.max_elements
+
+    def resize_index(self, new_size):
+        self.resizes.append(new_size)
+        self.max_elements = new_size
+
+    def set_ef(self, ef):
+        self.ef = ef
+
+    def knn_query(self, data, k=1):
+        q = data[0]
+        dist = {i: 1.0 - sum(a * b for a, b in zip(q, v)) for i, v in self.items.items()}
+        labels = sorted(dist, key=dist.get)[:k]
+        return [labels], [[dist[i] for i in labels]]
+
+
+def test_vector_store_hnswlib_branch():
+    import sys
+    import types as pytypes
+    from mol.types import Embedding, VectorStore
+    fake = pytypes.ModuleType("hnswlib")
+    fake.Index = _FakeHnswIndex
+    saved = sys.modules.get("hnswlib")
+    sys.modules["hnswlib"] = fake
+    try:
+        vs = VectorStore()
+        vs.ANN_THRESHOLD = 4
+        for i in range(4):
+            vs.add(Embedding(text=f"doc {i}"), text=f"doc {i}")
+        index = vs._ann
+        assert isinstance(index, _FakeHnswIndex)
+        assert index.get_max_elements() == 8 and index.get_current_count() == 4
+        for i in range(4, 9):  # the ninth add outgrows the initial 8 slots
+            vs.add(Embedding(text=f"doc {i}"), text=f"doc {i}")
+        assert index.resizes == [18] and index.get_current_count() == 9
+        hits = vs.search(Embedding(text="doc 6"), 2)
+        assert index.ef == 50
+        assert hits[0]["text"] == "doc 6" and hits[0]["score"] == 1.0
+        exact = [sum(a * b for a, b in zip(Embedding(text="doc 6")._unit_vector, v))
+                 for v in vs._unit_vectors]
+        assert hits[1]["score"] == round(sorted(exact)[-2], 4)
+        assert len(vs.search(Embedding(text="doc 1"), 20)) == 9
+    finally:
+        if saved is None:
+            sys.modules.pop("hnswlib", None)
+        else:
+            sys.modules["hnswlib"] = saved
+
+
+def test_parse_raises_mol_syntax_error():
+    import pickle
+    import pytest
+    from mol.parser import MOLSyntaxError, UnexpectedInput
+    with pytest.raises(MOLSyntaxError) as info:
+        parse("let x be 1\nshow (x +")
+    err = info.value
+    assert err.line == 2 and err.column is not None
+    assert isinstance(err.__cause__, UnexpectedInput)
+    copy = pickle.loads(pickle.dumps(err))
+    assert (str(copy), copy.line, copy.column) == (str(err), err.line, err.column)
+
+
+def test_parser_callbacks_chain_is_present():
+    # _get_parser() patches Lark internals (frontend → LALR_Parser → _Parser);
+    # if a lark release moves them, this is the test that should break.
+    from lark import Lark as LarkParser
+    from mol import parser as mol_parser
+    fresh = LarkParser(mol_parser._GRAMMAR_SRC.decode("utf-8"), parser="lalr",
+                       maybe_placeholders=True, start=mol_parser._START,
+                       cache=mol_parser._cache_path())
+    for p in (fresh, mol_parser._parser):
+        callbacks = p.parser.parser.parser.callbacks
+        assert isinstance(callbacks, dict) and callbacks
+    stamped = mol_parser._parser.parser.parser.parser.callbacks.values()
+    assert any(cb.__name__ == "stamped" for cb in stamped)
+    program = parse("let x be 1\n\nshow x")
+    assert program.statements[1].line == 3
+
+
+def test_group_by_function_keeps_key_types():
+    from mol.stdlib import _builtin_group_by
+    groups = _builtin_group_by([1, 2, 3, 4, "4"], lambda x: x == 4 or x == "4")
+    assert groups == {False: [1, 2, 3], True: [4, "4"]}
+    assert _builtin_group_by([1, "1"], lambda x: x) == {1: [1], "1": ["1"]}
+    assert _builtin_group_by([1, 2], lambda x: [x % 2]) == {"[1]": [1], "[0]": [2]}
+    assert _builtin_group_by([1, True, 0, False], lambda x: x) == {
+        1: [1], "true": [True], 0: [0], "false": [False]}
+    assert _builtin_group_by([1, 2], lambda x: x > 1) == {False: [1], True: [2]}
+    interp = run("""
+let groups be group_by([1, 2, 3, 4, 5, 6], fn(x) -> x % 3)
+show len(groups[0])
+""")
+    assert interp.output == ["2"]
+
+
+def test_vector_batch_cosine_and_top_k():
+    import math
+    from mol.vector_engine import Vector, vec_batch_cosine, vec_top_k
+    q = Vector([1.0, 2.0, 0.5])
+    vs = [Vector([1.0, 2.0, 0.5]), Vector([0.0, 0.0, 0.0]),
+          Vector([-1.0, 0.5, 3.0]), Vector([2.0, 4.0, 1.0])]
+    def naive(a, b):
+        d = sum(x * y for x, y in zip(a, b))
+        na = math.sqrt(sum(x * x for x in a))
+        nb = math.sqrt(sum(x * x for x in b))
+        return d / (na * nb) if na and nb else 0.0
+    raw = [[1.0, 2.0, 0.5], [0.0, 0.0, 0.0], [-1.0, 0.5, 3.0], [2.0, 4.0, 1.0]]
+    assert vec_batch_cosine(q, vs) == [round(naive([1.0, 2.0, 0.5], r), 6) for r in raw]
+    top = vec_top_k(q, vs, 3, ["a", "b", "c", "d"])
+    assert [t["label"] for t in top] == ["a", "d", "c"]
+    assert [t["rank"] for t in top] == [0, 1, 2]
+
+
+def test_channel_timeout_and_bounded():
+    from mol.stdlib import MOLChannel
+    from mol.interpreter import MOLRuntimeError
+    ch = MOLChannel()
+    assert ch.try_receive() is None
+    try:
+        ch.receive(timeout=0.01)
+        assert False, "Should have timed out"
+    except MOLRuntimeError:
+        pass
+    bounded = MOLChannel(capacity=2)
+    bounded.send(1)
+    bounded.send(2)
+    assert repr(bounded) == "<Channel(size=2)>"
+    assert [bounded.receive(), bounded.try_receive()] == [1, 2]
+
+
+def test_parallel_large_list_keeps_order():
+    interp = run("""
+let results be parallel(range(1000), fn(x) -> x * 3)
+""")
+    assert interp.global_env.get("results") == [x * 3 for x in range(1000)]
+
+
+def test_flatten_deep_nesting():
+    from mol.stdlib import _builtin_flatten
+    assert _builtin_flatten([1, [2, [3, [4, []]], 5], [[6]]]) == [1, 2, 3, 4, 5, 6]
+    deep = [7]
+    for _ in range(5000):
+        deep = [deep]
+    assert _builtin_flatten([0, deep, 8]) == [0, 7, 8]
+
+
+def test_group_by_property_keeps_value_types():
+    from mol.stdlib import _builtin_group_by
+    rows = [{"n": 1}, {"n": "1"}, {"n": 1}, {}, {"n": [2]}]
+    groups = _builtin_group_by(rows, "n")
+    assert groups == {1: [{"n": 1}, {"n": 1}], "1": [{"n": "1"}],
+                      None: [{}], "[2]": [{"n": [2]}]}
+    flags = [{"on": True}, {"on": 1}, {"on": False}, {"on": True}]
+    assert _builtin_group_by(flags, "on") == {
+        "true": [{"on": True}, {"on": True}], 1: [{"on": 1}], False: [{"on": False}]}
+
+
+def test_to_json_compact():
+    interp = run("""
+let data be {"a": [1, 2], "b": "x"}
+let pretty be to_json(data)
+let compact be to_json(data, false)
+""")
+    assert interp.global_env.get("compact") == '{"a":[1,2],"b":"x"}'
+    assert interp.global_env.get("pretty").startswith('{\n  "a": [')
+
+
+def test_pluck_maps_and_objects():
+    from types import SimpleNamespace
+    from mol.stdlib import _builtin_pluck
+    interp = run("""
+let rows be [{"x": 1}, {"y": 2}]
+let a be pluck(rows, "x")
+let c be map(rows, "y")
+""")
+    assert interp.global_env.get("a") == [1, None]
+    assert interp.global_env.get("c") == [None, 2]
+    mixed = [{"x": 1}, SimpleNamespace(x=5), SimpleNamespace()]
+    assert _builtin_pluck(mixed, "x") == [1, 5, None]
+
+
 if __name__ == "__main__":
     tests = [v for k, v in globals().items() if k.startswith("test_")]
     passed = 0